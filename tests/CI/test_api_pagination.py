@@ -0,0 +1,137 @@
+from unittest import mock
+
+import pytest
+
+from tz.client import api
+from tz.client.api import aio
+
+PUBLISHER = dict(name="Publisher", short_name="pub", organisation_type="Type", slug="pub")
+
+
+def _page(slugs, next_page):
+    response = mock.Mock()
+    response.json.return_value = dict(
+        publishers=[{**PUBLISHER, "slug": slug} for slug in slugs], next_page=next_page
+    )
+    return response
+
+
+PAGES = [_page(["a", "b"], 1), _page(["c", "d"], 2), _page(["e"], None)]
+
+
+def test_iter_search_follows_next_page():
+    with mock.patch.object(api.publishers.client, "get", side_effect=PAGES) as mock_get:
+        publishers = api.publishers.iter_search(name="pub", limit=2)
+
+        # Nothing is fetched until the iterator is consumed
+        mock_get.assert_not_called()
+
+        assert [p.slug for p in publishers] == ["a", "b", "c", "d", "e"]
+
+    assert [c.kwargs["params"]["page"] for c in mock_get.call_args_list] == [0, 1, 2]
+    assert all(c.kwargs["params"]["name"] == "pub" for c in mock_get.call_args_list)
+
+
+def test_iter_search_is_lazy():
+    with mock.patch.object(api.publishers.client, "get", side_effect=PAGES) as mock_get:
+        publishers = api.publishers.iter_search(limit=2)
+        assert next(publishers).slug == "a"
+        assert next(publishers).slug == "b"
+        assert mock_get.call_count == 1
+        assert next(publishers).slug == "c"
+        assert mock_get.call_count == 2
+
+
+def test_iter_search_stops_on_empty_page():
+    pages = [_page(["a"], 1), _page([], 2)]
+    with mock.patch.object(api.publishers.client, "get", side_effect=pages) as mock_get:
+        assert [p.slug for p in api.publishers.iter_search()] == ["a"]
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_iter_search_follows_next_page():
+    with mock.patch.object(
+        aio.publishers.client, "get", new_callable=mock.AsyncMock, side_effect=PAGES
+    ):
+        slugs = [p.slug async for p in aio.publishers.iter_search(limit=2)]
+
+    assert slugs == ["a", "b", "c", "d", "e"]
+
+
+def test_source_iter_search_filters_by_publisher():
+    response = mock.Mock()
+    response.json.return_value = dict(sources=[], next_page=None)
+    with mock.patch.object(api.sources.client, "get", return_value=response) as mock_get:
+        assert list(api.sources.iter_search(publisher_slug="pub")) == []
+    assert mock_get.call_args.kwargs["params"]["publisher_slug"] == "pub"
+
+
+def _records_page(page, limit=2, total_results=5):
+    ids = list(range(page * limit, min((page + 1) * limit, total_results)))
+    response = mock.Mock()
+    response.json.return_value = dict(
+        records=[
+            dict(
+                id=i,
+                source_id=1,
+                timestamp="2020-01-01T00:00:00",
+                valid_timestamp_start="2020-01-01T00:00:00",
+                valid_timestamp_end="2020-12-31T23:59:59",
+                datum_type="generation",
+                value=float(i),
+                unit="MWh",
+            )
+            for i in ids
+        ],
+        next_page=page + 1 if (page + 1) * limit < total_results else None,
+        total_results=total_results,
+    )
+    return response
+
+
+def test_get_all_fetches_remaining_pages_concurrently():
+    def get(url, params):
+        return _records_page(params["page"])
+
+    with mock.patch.object(api.records.client, "get", side_effect=get) as mock_get:
+        records = api.records.get_all(node_id="IDN", limit=2, max_concurrency=2)
+
+    assert [r.id for r in records] == [0, 1, 2, 3, 4]
+    assert sorted(c.kwargs["params"]["page"] for c in mock_get.call_args_list) == [0, 1, 2]
+    assert all(c.kwargs["params"]["node_id"] == "IDN" for c in mock_get.call_args_list)
+
+
+def test_get_all_without_total_results_follows_next_page():
+    def get(url, params):
+        response = _records_page(params["page"])
+        response.json.return_value["total_results"] = None
+        return response
+
+    with mock.patch.object(api.records.client, "get", side_effect=get) as mock_get:
+        records = api.records.get_all(limit=2)
+
+    assert [r.id for r in records] == [0, 1, 2, 3, 4]
+    assert [c.kwargs["params"]["page"] for c in mock_get.call_args_list] == [0, 1, 2]
+
+
+def test_get_all_with_server_capped_page_size():
+    # the server returns at most 2 items per page, whatever the limit
+    def get(url, params):
+        return _records_page(params["page"], limit=2)
+
+    with mock.patch.object(api.records.client, "get", side_effect=get):
+        records = api.records.get_all(limit=10)
+
+    assert [r.id for r in records] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_async_get_all_reassembles_pages_in_order():
+    async def get(url, params):
+        return _records_page(params["page"])
+
+    with mock.patch.object(aio.records.client, "get", side_effect=get):
+        records = await aio.records.get_all(limit=2, max_concurrency=2)
+
+    assert [r.id for r in records] == [0, 1, 2, 3, 4]
@@ -0,0 +1,77 @@
+from unittest import mock
+
+import httpx
+import pytest
+
+from tz.client.api import aio
+from tz.client.api.client import AsyncClient, ClientAuth
+from tz.client.api.generated_schema import Technology
+from tz.client.api.schemas import AuthToken
+
+TOKEN = dict(
+    access_token="old-access",
+    refresh_token="refresh",
+    id_token="id",
+    scope="openid",
+    expires_in=86400,
+    token_type="Bearer",
+)
+
+TECHNOLOGY = dict(
+    uuid="6e2b4cf1-4a2b-4d47-9d8c-5b0f6a3a8d11",
+    slug="coal",
+    creation_time="2024-01-01T00:00:00Z",
+    name="coal",
+    fullslug="coal",
+    owner="feo-core-admin",
+)
+
+
+@pytest.mark.asyncio
+async def test_async_auth_flow_refreshes_token(tmp_path):
+    seen_tokens = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth/token":
+            return httpx.Response(200, json={**TOKEN, "access_token": "new-access"})
+        seen_tokens.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer old-access":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"ok": True})
+
+    auth = ClientAuth()
+    auth.no_token = False
+    auth.token = AuthToken(**TOKEN)
+    auth.token_path = tmp_path / "token.json"
+
+    async with httpx.AsyncClient(
+        base_url="https://api.test", auth=auth, transport=httpx.MockTransport(handler)
+    ) as client:
+        resp = await client.get("/nodes/IDN")
+
+    assert resp.status_code == 200
+    assert seen_tokens == ["Bearer old-access", "Bearer new-access"]
+    assert auth.token.access_token == "new-access"
+
+
+@pytest.mark.asyncio
+async def test_async_client_headers(mock_some_header):
+    async with AsyncClient(headers={"x-another-header": "another-value"}) as client:
+        for k, v in [("x-some-header", "some-value"), ("x-another-header", "another-value")]:
+            assert client.httpx_client.headers.get(k) == v
+
+
+@pytest.mark.asyncio
+async def test_async_technology_get():
+    with mock.patch.object(aio.technologies.client, "get", new_callable=mock.AsyncMock) as mock_get:
+        mock_response = mock.Mock()
+        mock_response.json.return_value = TECHNOLOGY
+        mock_get.return_value = mock_response
+
+        technology = await aio.technologies.get("coal")
+
+    assert isinstance(technology, Technology)
+    assert technology.slug == "coal"
+    mock_get.assert_awaited_once_with(
+        "/technologies/coal", params=dict(includes=None, is_asset=False)
+    )
@@ -0,0 +1,128 @@
+from unittest import mock
+
+import httpx
+import pytest
+
+from tz.client.api.cache import ResponseCache, ValidatorStore
+from tz.client.api.client import AsyncClient, Client
+
+
+def _handler(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.url.path == "/nodes/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"path": request.url.path, "n": len(requests)})
+
+    return handler
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def client(requests):
+    client = Client(cache=ResponseCache(ttls={"nodes": 60, "technologies": 60}))
+    client.httpx_client = httpx.Client(
+        base_url="https://api.test", transport=httpx.MockTransport(_handler(requests))
+    )
+    return client
+
+
+def test_cache_serves_repeated_gets(client, requests):
+    first = client.get("/nodes/DEU", params={"includes": "children"})
+    assert client.get("/nodes/DEU", params={"includes": "children"}).json() == first.json()
+    client.get("/nodes/DEU", params={"includes": "parents"})
+    assert len(requests) == 2
+    assert (client.cache.hits, client.cache.misses) == (1, 2)
+
+
+def test_cache_skips_uncached_resources_and_errors(client, requests):
+    client.get("/runs/a:b:c:d")
+    client.get("/runs/a:b:c:d")
+    client.get("/nodes/missing")
+    client.get("/nodes/missing")
+    assert len(requests) == 4
+
+
+def test_cache_expires(client, requests):
+    with mock.patch("time.monotonic", return_value=0):
+        client.get("/nodes/DEU")
+    with mock.patch("time.monotonic", return_value=61):
+        client.get("/nodes/DEU")
+    assert len(requests) == 2
+
+
+def test_cache_invalidated_by_writes(client, requests):
+    client.get("/technologies/coal")
+    client.get("/nodes/DEU")
+    client.delete("/technologies", json={"slug": "coal"})
+    client.get("/technologies/coal")
+    client.get("/nodes/DEU")
+    assert requests == [
+        ("GET", "/technologies/coal"),
+        ("GET", "/nodes/DEU"),
+        ("DELETE", "/technologies"),
+        ("GET", "/technologies/coal"),
+    ]
+
+
+def test_cache_bounded():
+    cache = ResponseCache(ttls={"nodes": 60}, maxsize=2)
+    for slug in ["A", "B", "C"]:
+        cache.set(cache.key(f"/nodes/{slug}", {}), httpx.Response(200))
+    assert len(cache) == 2
+    assert cache.get(cache.key("/nodes/A", {}), httpx.Request("GET", "/nodes/A")) is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_cache(requests):
+    client = AsyncClient(cache=ResponseCache())
+    client.httpx_client = httpx.AsyncClient(
+        base_url="https://api.test", transport=httpx.MockTransport(_handler(requests))
+    )
+    async with client:
+        await client.get("node-aliases", params={"name": "Germany"})
+        await client.get("/node-aliases", params={"name": "Germany"})
+    assert len(requests) == 1
+
+
+def test_conditional_get_serves_stored_body_on_304():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            json={"runs": ["big"]},
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 May 2024 00:00:00 GMT"},
+        )
+
+    client = Client(validators=ValidatorStore())
+    client.httpx_client = httpx.Client(
+        base_url="https://api.test", transport=httpx.MockTransport(handler)
+    )
+    first = client.get("/runs/a:b:c:d", params={"includes": "model"})
+    second = client.get("/runs/a:b:c:d", params={"includes": "model"})
+
+    assert "if-none-match" not in seen[0]
+    assert seen[1]["if-none-match"] == '"v1"'
+    assert seen[1]["if-modified-since"] == "Wed, 01 May 2024 00:00:00 GMT"
+    assert second.status_code == 200
+    assert second.json() == first.json() == {"runs": ["big"]}
+    second.raise_for_status()
+
+
+def test_conditional_get_without_validators(requests):
+    client = Client(validators=ValidatorStore())
+    client.httpx_client = httpx.Client(
+        base_url="https://api.test", transport=httpx.MockTransport(_handler(requests))
+    )
+    client.get("/runs/a:b:c:d")
+    client.get("/runs/a:b:c:d")
+    assert len(client.validators) == 0
+    assert len(requests) == 2
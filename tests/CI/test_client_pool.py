@@ -0,0 +1,33 @@
+from unittest import mock
+
+import httpx
+import pytest
+
+from tz.client.api.client import AsyncClient, Client
+
+
+def _pool(client):
+    return client.httpx_client._transport._pool
+
+
+def test_pool_limits_from_env(monkeypatch):
+    monkeypatch.setenv("TZ_MAX_CONNECTIONS", "20")
+    monkeypatch.setenv("TZ_MAX_KEEPALIVE_CONNECTIONS", "10")
+    monkeypatch.setenv("TZ_KEEPALIVE_EXPIRY", "30")
+    pool = _pool(Client())
+    assert (pool._max_connections, pool._max_keepalive_connections) == (20, 10)
+    assert pool._keepalive_expiry == 30
+
+    pool = _pool(AsyncClient(limits=httpx.Limits(max_connections=4)))
+    assert pool._max_connections == 4
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setenv("TZ_HTTP2", "true")
+    with mock.patch("tz.client.api.client.find_spec", return_value=None):
+        with pytest.warns(UserWarning, match="tz-client\\[http2\\]"):
+            client = Client()
+    assert not _pool(client)._http2
+
+    with mock.patch("tz.client.api.client.find_spec", return_value=object()):
+        assert _pool(Client(http2=False))._http2 is False
@@ -0,0 +1,98 @@
+import asyncio
+from unittest import mock
+
+import httpx
+import pytest
+
+from tz.client.api.client import AsyncClient, Client, RetryPolicy
+
+
+def _handler(requests, failures):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+def _client(requests, failures, **kwargs):
+    client = Client(retry=RetryPolicy(jitter=False, **kwargs))
+    client.httpx_client = httpx.Client(
+        base_url="https://api.test", transport=httpx.MockTransport(_handler(requests, failures))
+    )
+    return client
+
+
+@pytest.fixture
+def sleep():
+    with mock.patch("time.sleep") as sleep:
+        yield sleep
+
+
+def test_retries_transient_failures_with_backoff(sleep):
+    requests = []
+    failures = [httpx.Response(503), httpx.ReadError("reset"), httpx.Response(502)]
+    response = _client(requests, failures).get("/nodes/DEU")
+    assert response.json() == {"ok": True}
+    assert len(requests) == 4
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0, 2.0]
+
+
+def test_gives_up_after_max_retries(sleep):
+    requests = []
+    failures = [httpx.Response(503)] * 5
+    assert _client(requests, failures, max_retries=2).get("/nodes/DEU").status_code == 503
+    assert len(requests) == 3
+
+
+def test_retry_after(sleep):
+    requests = []
+    failures = [httpx.Response(429, headers={"retry-after": "7"})]
+    _client(requests, failures).get("/nodes/DEU")
+    sleep.assert_called_once_with(7.0)
+
+    failures = [httpx.Response(429, headers={"retry-after": "3600"})]
+    assert _client(requests, failures).get("/nodes/DEU").status_code == 429
+
+
+def test_unsafe_methods_not_retried(sleep):
+    requests = []
+    failures = [httpx.Response(503)]
+    assert _client(requests, failures).post("/technologies", json={}).status_code == 503
+
+    # a request that failed to connect never reached the server
+    failures = [httpx.ConnectError("refused")]
+    assert _client(requests, failures).post("/technologies", json={}).status_code == 200
+
+    failures = [httpx.ReadError("reset")]
+    with pytest.raises(httpx.ReadError):
+        _client(requests, failures).post("/technologies", json={})
+
+
+def test_budget_limits_retries(sleep):
+    requests = []
+    failures = [httpx.Response(503)] * 10
+    client = _client(requests, failures, max_retries=5, budget_reserve=2, budget_ratio=0)
+    assert client.get("/nodes/DEU").status_code == 503
+    assert len(requests) == 3
+
+
+def test_async_retries():
+    requests = []
+    failures = [httpx.Response(504)]
+
+    async def get():
+        async with AsyncClient(retry=RetryPolicy(backoff_factor=0)) as client:
+            client.httpx_client = httpx.AsyncClient(
+                base_url="https://api.test",
+                transport=httpx.MockTransport(_handler(requests, failures)),
+            )
+            return await client.get("/nodes/DEU")
+
+    assert asyncio.run(get()).status_code == 200
+    assert len(requests) == 2
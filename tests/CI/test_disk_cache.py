@@ -0,0 +1,141 @@
+import base64
+import json
+from unittest import mock
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from tz.client.api.cache import ResponseCache, ValidatorStore
+from tz.client.api.client import Client, ClientAuth
+# fmt: off
+from tz.client.api.disk_cache import (ACCESS_RESOLUTION, CACHE_DIR_ENV,
+                                      SIZE_RECOUNT_INTERVAL, DiskCache)
+from tz.client.api.schemas import AuthToken
+from tz.client.cli.cli import root
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+def _client(requests, **kwargs):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"slug": "DEU", "geometry": "x" * 10_000})
+
+    client = Client(**kwargs)
+    client.httpx_client = httpx.Client(
+        base_url="https://api.test", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_disk_cache_shared_between_clients(cache_dir):
+    requests = []
+    # separate DiskCache instances stand in for separate processes
+    first = _client(requests, cache=ResponseCache(backend=DiskCache()))
+    second = _client(requests, cache=ResponseCache(backend=DiskCache()))
+
+    body = first.get("/nodes/DEU", params={"includes": "children"}).json()
+    assert second.get("/nodes/DEU", params={"includes": "children"}).json() == body
+    assert requests == ["/nodes/DEU"]
+
+    # bodies are stored compressed
+    assert DiskCache().size() < 1_000
+
+
+def test_disk_cache_keyed_on_scope(cache_dir):
+    cache = ResponseCache(backend=DiskCache())
+    response = httpx.Response(200, json={"slug": "DEU"})
+    cache.set(cache.key("/nodes/DEU", {}, ("https://api.test", "user-a")), response)
+    request = httpx.Request("GET", "https://api.test/nodes/DEU")
+
+    assert cache.get(cache.key("/nodes/DEU", {}, ("https://api.test", "user-a")), request)
+    assert not cache.get(cache.key("/nodes/DEU", {}, ("https://api.test", "user-b")), request)
+
+
+def test_disk_cache_invalidate_and_namespaces(cache_dir):
+    responses = ResponseCache(backend=DiskCache(namespace="responses"))
+    validators = ValidatorStore(backend=DiskCache(namespace="validators"))
+    response = httpx.Response(200, json={}, headers={"ETag": '"v1"'})
+    responses.set(responses.key("/nodes/DEU", {}), response)
+    responses.set(responses.key("/technologies/coal", {}), response)
+    validators.resolve(validators.key("/nodes/DEU", {}), response)
+
+    responses.invalidate("/nodes")
+    assert len(responses._cache) == 1
+    assert len(validators) == 1
+
+
+def test_disk_cache_cap_evicts_least_recently_used(cache_dir):
+    disk_cache = DiskCache()
+    record = {"status_code": 200, "headers": {}, "content": bytes(range(256)) * 4}
+    for i, key in enumerate(["a", "b", "c"]):
+        with mock.patch("time.time", return_value=1000 + i):
+            disk_cache.set(key, record)
+    # access times are only bumped once they're old enough
+    with mock.patch("time.time", return_value=1003):
+        disk_cache.get("a")
+        assert disk_cache.cap(disk_cache.size() - 1) == 1
+        assert disk_cache.get("a") is None
+    with mock.patch("time.time", return_value=1000 + ACCESS_RESOLUTION + 1):
+        disk_cache.get("b")
+
+    entry_size = disk_cache.size() // 2
+    assert disk_cache.cap(entry_size) == 1
+    assert disk_cache.get("c") is None
+    assert disk_cache.get("b") is not None
+
+
+def test_disk_cache_size_recounted_periodically(cache_dir):
+    disk_cache = DiskCache()
+    record = {"status_code": 200, "headers": {}, "content": b"x"}
+    with mock.patch.object(DiskCache, "size", return_value=0) as size:
+        for key in range(SIZE_RECOUNT_INTERVAL):
+            disk_cache.set(key, record)
+    assert size.call_count == 2
+
+    disk_cache.max_bytes = 0
+    disk_cache.set("a", record)
+    assert len(disk_cache) == 0
+
+
+def test_cache_cli(cache_dir):
+    disk_cache = DiskCache()
+    disk_cache.set("a", {"status_code": 200, "headers": {}, "content": b"x"}, ttl=-1)
+    disk_cache.set("b", {"status_code": 200, "headers": {}, "content": b"y"})
+
+    runner = CliRunner()
+    result = runner.invoke(root, ["cache", "info"])
+    assert result.exit_code == 0
+    assert "responses: 2 entries" in result.output
+    assert "1 expired" in result.output
+
+    result = runner.invoke(root, ["cache", "prune"])
+    assert "deleted 1 entries" in result.output
+
+    result = runner.invoke(root, ["cache", "prune", "--max-bytes", "0"])
+    assert "deleted 1 entries" in result.output
+    assert len(disk_cache) == 0
+
+
+def test_auth_identity():
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": "auth0|123"}).encode()).decode()
+    auth = ClientAuth()
+    auth.token = AuthToken(
+        access_token=f"header.{payload.rstrip('=')}.signature",
+        id_token="id",
+        scope="openid",
+        expires_in=86400,
+        token_type="Bearer",
+    )
+    assert auth.identity() == "auth0|123"
+
+    auth.token = auth.token.model_copy(update={"access_token": "opaque"})
+    assert auth.identity() != "anonymous"
+
+    auth.token = None
+    assert auth.identity() == "anonymous"
@@ -0,0 +1,97 @@
+from unittest import mock
+
+import pytest
+
+from tz.client import Node, api
+from tz.client.api.client import Client
+from tz.client.core import TTLCache
+from tz.client.identity import IDENTITY_MAP_ENV, IdentityMap
+
+
+@pytest.fixture
+def identity_map(monkeypatch):
+    identity_map = IdentityMap()
+    monkeypatch.setattr(api.nodes.client, "identity_map", identity_map)
+    return identity_map
+
+
+def _node(slug, **kwargs):
+    return {
+        "uuid": f"0c6b1a3e-7a57-4f11-8d3f-2f4f3b1c9e{len(slug):02d}",
+        "slug": slug,
+        "creation_time": "2024-01-01T00:00:00Z",
+        "fullslug": slug,
+        "owner": "admin",
+        "node_type": "COUNTRY",
+        **kwargs,
+    }
+
+
+def _get_node(slug, includes=None, response_model=None):
+    if includes == "children":
+        return (response_model or Node)(**_node(slug, children=[_node(f"{slug}-A")]))
+    return (response_model or Node)(**_node(slug, primary_alias=slug.lower()))
+
+
+def test_from_slug_reuses_instance(identity_map):
+    with mock.patch.object(api.nodes, "get", side_effect=_get_node) as mock_get:
+        deu = Node.from_slug("DEU")
+        assert Node.from_slug("DEU") is deu
+        assert mock_get.call_count == 1
+
+        identity_map.invalidate(Node, deu.uuid)
+        assert identity_map.get(Node, "DEU") is None
+        assert Node.from_slug("DEU") is not deu
+        assert mock_get.call_count == 2
+
+
+def test_identity_map_is_opt_in(monkeypatch):
+    monkeypatch.setattr(api.nodes.client, "identity_map", None)
+    with mock.patch.object(api.nodes, "get", side_effect=_get_node) as mock_get:
+        assert Node.from_slug("DEU") is not Node.from_slug("DEU")
+        assert mock_get.call_count == 2
+
+    monkeypatch.delenv(IDENTITY_MAP_ENV, raising=False)
+    assert Client().identity_map is None
+    monkeypatch.setenv(IDENTITY_MAP_ENV, "1")
+    first, second = Client(), Client()
+    assert isinstance(first.identity_map, IdentityMap)
+    assert first.identity_map is not second.identity_map
+
+
+def test_hierarchy_reuses_instances(identity_map):
+    with mock.patch.object(api.nodes, "get", side_effect=_get_node) as mock_get:
+        deu = Node.from_slug("DEU")
+        child = deu.children[0]
+        assert child.primary_alias is None
+
+        # a full load of a node first seen as a child upgrades that instance
+        assert Node.from_slug("DEU-A") is child
+        assert child.primary_alias == "deu-a"
+
+        # loading the same children again yields the same instances
+        deu._children = None
+        assert deu.children[0] is child
+        assert mock_get.call_count == 4
+
+
+def test_identity_map_ttl():
+    identity = IdentityMap(ttl=60)
+    node = Node(**_node("DEU"))
+    with mock.patch("time.monotonic", return_value=0):
+        identity.add(node)
+    with mock.patch("time.monotonic", return_value=59):
+        assert identity.get(Node, "DEU") is node
+    with mock.patch("time.monotonic", return_value=61):
+        assert identity.get(Node, "DEU") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
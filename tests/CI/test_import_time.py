@@ -0,0 +1,87 @@
+import json
+import subprocess
+import sys
+
+# modules that `import tz.client` must not pull in
+HEAVY_MODULES = [
+    "dotenv",
+    "httpx",
+    "pandas",
+    "pydantic",
+    "tz.client.api.client",
+    "tz.client.api.generated_schema",
+]
+
+# a generous bound on the cumulative import time of `tz.client`, in microseconds
+MAX_IMPORT_TIME_US = 250_000
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def test_import_is_lazy():
+    code = "import sys, json, tz.client, tz.client.api; print(json.dumps(list(sys.modules)))"
+    modules = set(json.loads(_run(code).stdout))
+    assert modules.isdisjoint(HEAVY_MODULES)
+
+
+def test_import_time():
+    stderr = _run("import tz.client", "-X", "importtime").stderr
+    (line,) = [line for line in stderr.splitlines() if line.endswith("| tz.client")]
+    cumulative = int(line.split("|")[1])
+    assert cumulative < MAX_IMPORT_TIME_US
+
+
+def test_lazy_names_resolve():
+    code = (
+        "import tz.client as c; from tz.client import ModelScenario, api;"
+        " print(c.Node.__pydantic_complete__, ModelScenario.__pydantic_complete__,"
+        " type(api.nodes).__name__, type(api.aio.nodes).__name__)"
+    )
+    assert _run(code).stdout.split() == ["True", "True", "NodeAPI", "AsyncNodeAPI"]
+
+
+def test_generated_models_built_on_first_use():
+    code = (
+        "import tz.client.api.generated_schema as g;"
+        " models = [m for m in vars(g).values() if isinstance(m, type)"
+        " and issubclass(m, g.PydanticBaseModel) and m.__module__ == g.__name__];"
+        " built = lambda: sum(m.__pydantic_complete__ for m in models);"
+        " before = built();"
+        " g.UrlIndexResourcePatch(slug='a');"
+        " print(before, built(), g.UrlIndexResourcePatch.__pydantic_complete__)"
+    )
+    assert _run(code).stdout.split() == ["0", "1", "True"]
+
+
+def test_submodule_imported_first():
+    code = (
+        "import tz.client.technology; from tz import client;"
+        " from tz.client import ModelScenario, Node;"
+        " print(client._rebuilt, Node.__pydantic_complete__,"
+        " ModelScenario.__pydantic_complete__, client.api.__name__)"
+    )
+    assert _run(code).stdout.split() == ["True", "True", "True", "tz.client.api"]
+
+
+def test_class_modules_dont_build_generated_models():
+    code = (
+        "import tz.client.api.generated_schema as g;"
+        " from tz.client.job import Job; import tz.client.model;"
+        " job = Job(uuid='0c6b1a3e-7a57-4f11-8d3f-2f4f3b1c9e21',"
+        " creation_time='2024-01-01T00:00:00Z', owner='admin', run='a:b:c:d');"
+        " print(g.Run.__pydantic_complete__, g.Model.__pydantic_complete__, job.run)"
+    )
+    assert _run(code).stdout.split() == ["False", "False", "a:b:c:d"]
+
+
+def test_rebuild_errors_propagate():
+    code = (
+        "import sys; import tz.client as c; sys.modules['tz.client.geospatial'] = None\n"
+        "try:\n    c.Node\nexcept ImportError as e:\n    print(e.name, c._rebuilt)\n"
+        "del sys.modules['tz.client.geospatial']; c.Node; print(c._rebuilt)"
+    )
+    assert _run(code).stdout.split() == ["tz.client.geospatial", "False", "True"]
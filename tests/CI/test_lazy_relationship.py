@@ -0,0 +1,113 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from tz.client import Model, ModelScenario, Technology, api, prefetch_related
+from tz.client.utils import LazyRelationship
+
+
+def _technology(slug, **kwargs):
+    return {
+        "uuid": "5d3f0a5e-0a43-4c9f-9a3e-6d9b1c7a0b11",
+        "slug": slug,
+        "creation_time": "2024-01-01T00:00:00Z",
+        "name": slug.title(),
+        "fullslug": slug,
+        "owner": "admin",
+        **kwargs,
+    }
+
+
+def _response(payload):
+    response = mock.Mock()
+    response.json.return_value = payload
+    return response
+
+
+def test_cached_relationship_skips_loader_and_dump():
+    technology = Technology(**_technology("renewables"))
+    parent = _technology("renewables", children=[_technology("wind")])
+    with mock.patch.object(
+        api.technologies.client, "get", return_value=_response(parent)
+    ) as mock_get:
+        children = technology.children
+        with mock.patch.object(Technology, "model_dump") as mock_dump:
+            for _ in range(3):
+                assert technology.children is children
+            mock_dump.assert_not_called()
+        assert mock_get.call_count == 1
+
+
+def test_relationship_resolves_class_once():
+    relationship = ModelScenario.__dict__["model"]
+    assert isinstance(relationship, LazyRelationship)
+    with mock.patch("tz.client.utils.import_module") as mock_import:
+        mock_import.return_value.Model = Model
+        relationship._target = None
+        assert relationship.target is Model
+        assert relationship.target is Model
+        assert mock_import.call_count == 1
+
+
+def test_relationship_shadowing_field_uses_field_value_as_context():
+    scenario = ModelScenario.model_construct(owner="admin", slug="net-zero", model="admin:feo")
+    loaded = mock.Mock(model=Model.model_construct(slug="feo"))
+    with mock.patch.object(api.model_scenarios, "get", return_value=loaded) as mock_get:
+        assert scenario.model.slug == "feo"
+        assert type(scenario.model) is Model
+    mock_get.assert_called_once_with(
+        owner="admin", model_slug="feo", model_scenario_slug="net-zero", includes="model"
+    )
+
+
+def test_prefetch_related_loads_each_object_once():
+    technologies = [Technology(**_technology(slug)) for slug in ["coal", "gas", "wind"]]
+    technologies.append(technologies[0])
+
+    def get(slug, includes):
+        return Technology.model_construct(children=[Technology.model_construct(slug=f"{slug}-1")])
+
+    with mock.patch.object(api.technologies, "get", side_effect=get) as mock_get:
+        assert prefetch_related(technologies, "children") is technologies
+        assert mock_get.call_count == 3
+        assert [t.children[0].slug for t in technologies] == ["coal-1", "gas-1", "wind-1", "coal-1"]
+        assert type(technologies[1].children[0]) is Technology
+        assert mock_get.call_count == 3
+
+
+def test_prefetch_related_uses_included_objects():
+    technology = Technology(**_technology("renewables", children=[_technology("wind")]))
+    with mock.patch.object(api.technologies, "get") as mock_get:
+        prefetch_related([technology], "children")
+        assert technology.children[0].slug == "wind"
+        mock_get.assert_not_called()
+
+
+def test_prefetch_related_unknown_field():
+    with pytest.raises(ValueError, match="'name' is not a relationship"):
+        prefetch_related([Technology(**_technology("wind"))], "name")
+
+
+def test_walk_breadth_first_with_concurrent_levels():
+    tree = {"EUR": ["DEU", "FRA"], "DEU": ["DEU-BY", "DEU-BE"], "FRA": ["FRA-IDF"]}
+    # both nodes of the second level must be in flight together
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get(slug, includes):
+        if slug in ("DEU", "FRA"):
+            barrier.wait()
+        children = [Technology.model_construct(slug=child) for child in tree.get(slug, [])]
+        return Technology.model_construct(children=children)
+
+    root = Technology(**_technology("EUR"))
+    with mock.patch.object(api.technologies, "get", side_effect=get) as mock_get:
+        adjacency = root.walk(depth=2)
+        assert mock_get.call_count == 3
+
+    assert adjacency == {"EUR": ["DEU", "FRA"], "DEU": ["DEU-BY", "DEU-BE"], "FRA": ["FRA-IDF"]}
+
+
+def test_walk_invalid_direction():
+    with pytest.raises(ValueError, match="direction"):
+        Technology(**_technology("wind")).walk(direction="sideways")
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import httpx
+
+from tz.client.api.client import AsyncClient, Client, RetryPolicy
+# fmt: off
+from tz.client.api.rate_limit import (Limit, RateLimiter, TokenBucket,
+                                      default_rate_limiter)
+
+
+def test_token_bucket_waits_for_tokens():
+    with mock.patch("time.monotonic", return_value=0):
+        bucket = TokenBucket(rate=2, burst=2)
+        assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    with mock.patch("time.monotonic", return_value=10):
+        assert bucket.reserve() == 0
+
+
+def test_token_bucket_adapts_to_throttling():
+    bucket = TokenBucket(rate=10, burst=10)
+    bucket.throttle()
+    bucket.throttle()
+    assert bucket.rate == 2.5
+    bucket.recover()
+    assert bucket.rate == 3.0
+    for _ in range(100):
+        bucket.recover()
+    assert bucket.rate == 10
+
+
+def test_longest_prefix_wins(monkeypatch):
+    limiter = RateLimiter({"": Limit(rate=1), "/runs": Limit(rate=2)})
+    assert limiter.endpoint("/runs/a:b:c:d").limit.rate == 2
+    assert limiter.endpoint("/nodes/DEU").limit.rate == 1
+    assert RateLimiter({"/runs": Limit(rate=2)}).endpoint("/nodes") is None
+
+    # requests are only limited once limits are configured
+    assert default_rate_limiter().endpoints == {}
+    monkeypatch.setenv("TZ_RATE_LIMITS", '{"/records": {"rate": 5, "max_in_flight": 2}}')
+    limit = default_rate_limiter().endpoint("/records").limit
+    assert (limit.rate, limit.max_in_flight) == (5, 2)
+
+
+def _concurrency_handler(counts, lock):
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            counts["current"] += 1
+            counts["max"] = max(counts["max"], counts["current"])
+        time.sleep(0.01)
+        with lock:
+            counts["current"] -= 1
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def test_max_in_flight():
+    counts, lock = {"current": 0, "max": 0}, threading.Lock()
+    client = Client(rate_limiter=RateLimiter({"/records": Limit(rate=1000, max_in_flight=2)}))
+    client.httpx_client = httpx.Client(
+        base_url="https://api.test",
+        transport=httpx.MockTransport(_concurrency_handler(counts, lock)),
+    )
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: client.get("/records"), range(16)))
+    assert counts["max"] == 2
+
+
+def test_throttled_responses_slow_down_the_endpoint():
+    responses = [httpx.Response(429), httpx.Response(200)]
+    client = Client(
+        retry=RetryPolicy(backoff_factor=0),
+        rate_limiter=RateLimiter({"/runs": Limit(rate=1000), "": Limit(rate=1000)}),
+    )
+    client.httpx_client = httpx.Client(
+        base_url="https://api.test", transport=httpx.MockTransport(lambda r: responses.pop(0))
+    )
+    assert client.get("/runs/a:b:c:d").status_code == 200
+    assert client.rate_limiter.endpoint("/runs").bucket.rate == 550
+    assert client.rate_limiter.endpoint("/nodes").bucket.rate == 1000
+
+
+def test_async_max_in_flight():
+    current, peak = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal current, peak
+        current += 1
+        peak = max(peak, current)
+        await asyncio.sleep(0.01)
+        current -= 1
+        return httpx.Response(200, json={})
+
+    async def run():
+        limiter = RateLimiter({"": Limit(rate=1000, max_in_flight=3)})
+        async with AsyncClient(rate_limiter=limiter) as client:
+            client.httpx_client = httpx.AsyncClient(
+                base_url="https://api.test", transport=httpx.MockTransport(handler)
+            )
+            await asyncio.gather(*[client.get("/records") for _ in range(12)])
+
+    asyncio.run(run())
+    assert peak == 3
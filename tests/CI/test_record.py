@@ -1,5 +1,9 @@
+from unittest import mock
+
+import pandas as pd
 import pytest
 
+from tz.client import api
 from tz.client.record import RecordCollection
 
 TEST_DATUM_DETAIL = "forest_landuse"
@@ -13,3 +17,75 @@ def test_record_collection_search():
 
     assert len(resp) == 10  # Default page limit
     assert resp.datum_detail.unique() == TEST_DATUM_DETAIL
+
+
+def _records(ids):
+    return [
+        api.schemas.Record(
+            id=i,
+            node_id="IDN",
+            source_id=1,
+            timestamp="2020-01-01T00:00:00",
+            valid_timestamp_start="2020-01-01T00:00:00",
+            valid_timestamp_end="2020-12-31T23:59:59",
+            datum_type="generation",
+            value=float(i),
+            unit="MWh",
+        )
+        for i in ids
+    ]
+
+
+@pytest.fixture
+def paged_records():
+    pages = [_records([0, 1]), _records([2, 3]), _records([4]), []]
+    with mock.patch.object(api.records, "get", side_effect=pages) as mock_get:
+        yield mock_get
+
+
+def test_record_collection_next_page(paged_records):
+    collection = RecordCollection.search(node_id="IDN", limit=2)
+    assert collection.next_page() == 2
+    assert list(collection.id) == [0, 1, 2, 3]
+
+
+def test_record_collection_load_all_concatenates_once(paged_records):
+    collection = RecordCollection.search(node_id="IDN", limit=2)
+
+    with mock.patch("tz.client.record.pd.concat", wraps=pd.concat) as mock_concat:
+        collection.load_all()
+
+    assert mock_concat.call_count == 1
+    assert list(collection.id) == [0, 1, 2, 3, 4]
+    assert isinstance(collection, RecordCollection)
+
+
+def test_record_collection_deferred_materialise(paged_records):
+    collection = RecordCollection.search(node_id="IDN", limit=2)
+    collection.next_page(materialise=False)
+    collection.next_page(materialise=False)
+    assert len(collection) == 2
+
+    collection.materialise()
+    assert list(collection.id) == [0, 1, 2, 3, 4]
+
+
+def test_record_collection_next_page_replays_query(paged_records):
+    query = dict(
+        node_id="IDN",
+        public=True,
+        valid_timestamp_start="2039-01-01 00:00:00",
+        valid_timestamp_end="2039-01-01 23:59:59",
+        provenance_slug=["tz:contributions"],
+        datum_type=["generation"],
+        datum_detail=["power.COA"],
+        node_type=["admin_0"],
+        technology="coal",
+        limit=2,
+    )
+    collection = RecordCollection.search(**query, page=3)
+    collection.next_page()
+
+    first, second = paged_records.call_args_list
+    assert first.kwargs == {**query, "page": 3}
+    assert second.kwargs == {**query, "page": 4}
@@ -0,0 +1,140 @@
+from unittest import mock
+
+import httpx
+
+from tz.client import Asset, AssetCollection, Node, Technology, api
+from tz.client.api import generated_schema
+
+
+def _technology(slug):
+    return {
+        "uuid": "5d3f0a5e-0a43-4c9f-9a3e-6d9b1c7a0b11",
+        "slug": slug,
+        "creation_time": "2024-01-01T00:00:00Z",
+        "name": slug.title(),
+        "fullslug": slug,
+        "owner": "admin",
+    }
+
+
+def _node(slug):
+    return {
+        "uuid": "0c6b1a3e-7a57-4f11-8d3f-2f4f3b1c9e21",
+        "slug": slug,
+        "creation_time": "2024-01-01T00:00:00Z",
+        "fullslug": slug,
+        "owner": "admin",
+        "node_type": "COUNTRY",
+    }
+
+
+def _response(payload):
+    response = mock.Mock()
+    response.json.return_value = payload
+    return response
+
+
+def test_search_validates_into_high_level_class():
+    page = {
+        "technologies": [_technology("wind"), _technology("solar")],
+        "next_page": None,
+        "total_results": 2,
+    }
+    with mock.patch.object(api.technologies.client, "get", return_value=_response(page)):
+        with mock.patch.object(generated_schema.Technology, "model_dump") as mock_dump:
+            technologies = Technology.search()
+            mock_dump.assert_not_called()
+
+    assert [type(t) for t in technologies] == [Technology, Technology]
+    assert [t.slug for t in technologies] == ["wind", "solar"]
+    assert technologies[0]._children is None
+
+
+def test_node_search_validates_alias_nodes():
+    alias = {
+        "uuid": "9a1e0f7c-2b3d-4e5f-8a9b-0c1d2e3f4a5b",
+        "creation_time": "2024-01-01T00:00:00Z",
+        "name": "Germany",
+        "alias_type": "name",
+        "fullslug": "DEU:germany",
+        "owner": "admin",
+        "node": _node("DEU"),
+    }
+    page = {"node_aliases": [alias], "next_page": None, "total_results": 1}
+    with mock.patch.object(api.node_aliases.client, "get", return_value=_response(page)):
+        nodes = Node.search("Germany")
+
+    assert type(nodes[0]) is Node
+    assert nodes[0].slug == "DEU"
+
+
+def test_lazy_relationship_promotes_without_revalidating():
+    parent = {**_technology("renewables"), "children": [_technology("wind")]}
+    technology = Technology(**_technology("renewables"))
+    with mock.patch.object(api.technologies.client, "get", return_value=_response(parent)):
+        children = technology.children
+
+    assert type(children[0]) is Technology
+    assert children[0].slug == "wind"
+    assert children[0].model_fields_set == Technology(**_technology("wind")).model_fields_set
+
+
+def _asset(id):
+    return {
+        "id": id,
+        "node_type": "asset",
+        "type_alias": "power_unit",
+        "sector": "power",
+        "asset_properties": {
+            "unit_type": "coal",
+            "operating_status": "operating",
+            "latitude": None,
+            "longitude": None,
+            "fuel_type": None,
+            "capacity": 100.0,
+            "capacity_unit": "MW",
+            "start_date": None,
+        },
+    }
+
+
+def _assets_transport(pages):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page") or 0)
+        ids = pages[page] if page < len(pages) else []
+        next_page = page + 1 if page + 1 < len(pages) else None
+        return httpx.Response(
+            200, json={"assets": [_asset(i) for i in ids], "next_page": next_page}
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_asset_from_id(monkeypatch):
+    transport = _assets_transport([["a1"]])
+    monkeypatch.setattr(
+        api.assets.client,
+        "httpx_client",
+        httpx.Client(base_url="https://api.test", transport=transport),
+    )
+    asset = Asset.from_id("a1")
+
+    assert type(asset) is Asset
+    assert asset.id == "a1"
+    assert asset.asset_properties.capacity == 100.0
+
+
+def test_asset_collection_pages(monkeypatch):
+    transport = _assets_transport([["a1", "a2"], ["a3"]])
+    monkeypatch.setattr(
+        api.assets.client,
+        "httpx_client",
+        httpx.Client(base_url="https://api.test", transport=transport),
+    )
+    collection = AssetCollection.from_parent_node("IDN")
+    assert list(collection["id"]) == ["a1", "a2"]
+
+    collection.load_all()
+    assert list(collection["id"]) == ["a1", "a2", "a3"]
+    assert list(collection["capacity"]) == [100.0] * 3
+    assert [type(asset) for asset in collection.to_assets()] == [Asset] * 3
@@ -0,0 +1,92 @@
+import os
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from tz.client import api
+from tz.client.api import generated_schema
+from tz.client.api.schemas import DataSeries
+# fmt: off
+from tz.client.results_store import (RESULTS_STORE_ENV,
+                                     RESULTS_STORE_MAX_BYTES_ENV, ResultsStore,
+                                     default_store)
+from tz.client.run import Run, RunResults
+
+pytest.importorskip("pyarrow")
+
+FULLSLUG = "feo-core-admin:feo-indonesia:net-zero-2060:run1"
+
+
+@pytest.fixture
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(RESULTS_STORE_ENV, str(tmp_path))
+    return tmp_path
+
+
+def _production(**kwargs):
+    return mock.Mock(data={"IDN": {"BAT": {"ELEC": DataSeries(x=[2030, 2031], y=[1.0, 2.0])}}})
+
+
+def test_results_served_from_store(store_dir):
+    with mock.patch.object(api.runs, "get_chart_data", side_effect=_production) as mock_get:
+        downloaded = RunResults(id=FULLSLUG, final=True).production
+        stored = RunResults(id=FULLSLUG, final=True).production
+        assert mock_get.call_count == 1
+
+    assert stored._table == "production_timeseries"
+    pd.testing.assert_frame_equal(pd.DataFrame(stored), pd.DataFrame(downloaded))
+
+
+def test_unfinished_run_results_not_stored(store_dir):
+    with mock.patch.object(api.runs, "get_chart_data", side_effect=_production) as mock_get:
+        RunResults(id=FULLSLUG).production
+        RunResults(id=FULLSLUG).production
+        assert mock_get.call_count == 2
+    assert not list(store_dir.glob("*/*.parquet"))
+
+
+def test_run_final():
+    job = generated_schema.Job.model_construct(status="created")
+    assert not Run.model_construct(fullslug=FULLSLUG, jobs=[job]).results.final
+    job = generated_schema.Job.model_construct(status="Completed")
+    assert Run.model_construct(fullslug=FULLSLUG, jobs=["uuid", job]).results.final
+
+
+def test_default_store_is_shared(store_dir, monkeypatch):
+    assert default_store() is default_store()
+    monkeypatch.setenv(RESULTS_STORE_MAX_BYTES_ENV, "1024")
+    assert default_store().max_bytes == 1024
+
+
+def test_store_invalidate(store_dir):
+    store = ResultsStore(store_dir)
+    df = pd.DataFrame({"value": [1.0]})
+    store.put(df, FULLSLUG, "flow_timeseries", "Flow")
+    store.put(df, "a:b:c:d", "flow_timeseries", "Flow")
+
+    store.invalidate(FULLSLUG)
+    assert store.get(FULLSLUG, "flow_timeseries", "Flow") is None
+    assert store.get("a:b:c:d", "flow_timeseries", "Flow") is not None
+
+    store.invalidate()
+    assert store.get("a:b:c:d", "flow_timeseries", "Flow") is None
+
+
+def test_store_evicts_least_recently_used(store_dir):
+    df = pd.DataFrame({"value": range(100)})
+    store = ResultsStore(store_dir)
+    paths = [store.put(df, FULLSLUG, "node_capacity", "Capacity", year=y) for y in range(3)]
+    file_size = paths[0].stat().st_size
+    for i, path in enumerate(paths):
+        os.utime(path, (i, i))
+
+    # reading bumps the first table, so the second is the least recently used
+    store.get(FULLSLUG, "node_capacity", "Capacity", year=0)
+    store.max_bytes = 3 * file_size
+    store.put(df, FULLSLUG, "node_capacity", "Capacity", year=3)
+
+    assert store.size() <= 3 * file_size
+    assert paths[0].exists()
+    assert not paths[1].exists()
+    assert paths[2].exists()
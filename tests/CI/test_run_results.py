@@ -0,0 +1,169 @@
+import threading
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tz.client import api
+from tz.client.api.schemas import DataSeries
+from tz.client.run import RESULTS_TABLES, ResultsCollection, RunResults
+
+FULLSLUG = "feo-core-admin:feo-indonesia:net-zero-2060:run1"
+
+
+def test_structure_node_capacity():
+    data = {
+        "IDN": {
+            "BAT": DataSeries(x=[2046, 2047], y=[1.5, 1.87]),
+            "BIO": DataSeries(x=[2047], y=[1.86]),
+        },
+        "MYS": {"BAT": DataSeries(x=[2030], y=[4.0])},
+    }
+    results = ResultsCollection(RunResults(id=FULLSLUG)._structure_response(data))
+
+    assert list(results.columns) == ["node_id", "technology_type", "timestamp", "value"]
+    assert list(results.node_id) == ["IDN", "IDN", "IDN", "MYS"]
+    assert list(results.technology_type) == ["BAT", "BAT", "BIO", "BAT"]
+    assert list(results.timestamp) == [
+        pd.Timestamp(year, 1, 1) for year in [2046, 2047, 2047, 2030]
+    ]
+    assert list(results.value) == [1.5, 1.87, 1.86, 4.0]
+
+
+def test_structure_edge_capacity():
+    data = {"IDN": {"BAT": {"ELEC": DataSeries(x=[2047], y=[1.87])}}}
+    results = ResultsCollection(
+        RunResults(id=FULLSLUG)._structure_response(data, commodity_column=True)
+    )
+
+    assert list(results.columns) == [
+        "node_id",
+        "technology_type",
+        "timestamp",
+        "value",
+        "commodity",
+    ]
+    assert results.iloc[0].to_dict() == dict(
+        node_id="IDN",
+        technology_type="BAT",
+        timestamp=pd.Timestamp(2047, 1, 1),
+        value=1.87,
+        commodity="ELEC",
+    )
+
+
+def test_structure_production_records():
+    data = {"IDN-AC": {"BAT": {"ELEC": DataSeries(x=[2045, 2046], y=[30.0, 36.499])}}}
+    results = ResultsCollection(RunResults(id=FULLSLUG)._structure_production_records(data))
+
+    assert list(results.columns) == ["node", "technology", "commodity", "year", "value"]
+    assert list(results.year) == [2045, 2046]
+    assert list(results.value) == [30.0, 36.499]
+
+
+def test_structure_flow_records():
+    data = {"IDN-JW": {"IDN-KA": {"ELEC": {"export": DataSeries(x=[2030], y=[5.0])}}}}
+    results = ResultsCollection(RunResults(id=FULLSLUG)._structure_flow_records(data))
+
+    assert list(results.columns) == [
+        "source_node",
+        "target_node",
+        "commodity",
+        "flow_type",
+        "year",
+        "value",
+    ]
+    assert results.iloc[0].to_dict() == dict(
+        source_node="IDN-JW",
+        target_node="IDN-KA",
+        commodity="ELEC",
+        flow_type="export",
+        year=2030,
+        value=5.0,
+    )
+
+
+def test_structure_empty_response():
+    results = ResultsCollection(RunResults(id=FULLSLUG)._structure_production_records({}))
+    assert len(results) == 0
+    assert list(results.columns) == ["node", "technology", "commodity", "year", "value"]
+
+
+def test_structure_series_length_mismatch():
+    data = {"IDN": {"BAT": {"ELEC": DataSeries(x=[2045, 2046], y=[30.0])}}}
+    with pytest.raises(ValueError, match="IDN/BAT/ELEC"):
+        RunResults(id=FULLSLUG)._structure_production_records(data)
+
+
+@pytest.mark.parametrize("n_years, n_steps", [(30, 8760)])
+def test_structure_large_series_is_linear(n_years, n_steps):
+    # Regression benchmark: x and y must be zipped, not crossed. A cartesian
+    # expansion of this input would need ~7e10 rows per series.
+    n_points = n_years * n_steps
+    x = np.repeat(np.arange(2020, 2020 + n_years), n_steps).tolist()
+    series = DataSeries.model_construct(x=x, y=np.arange(n_points, dtype=float).tolist())
+    production = {
+        node: {"COA": {"ELEC": series}, "SPV": {"ELEC": series}} for node in ["IDN-JW", "IDN-KA"]
+    }
+    flow = {"IDN-JW": {"IDN-KA": {"ELEC": {"export": series, "import": series}}}}
+
+    production_results = RunResults(id=FULLSLUG)._structure_production_records(production)
+    flow_results = RunResults(id=FULLSLUG)._structure_flow_records(flow)
+
+    assert len(production_results["value"]) == 4 * n_points
+    assert len(flow_results["value"]) == 2 * n_points
+    # pairs are preserved: every series keeps its own x and y, in order
+    expected_values = np.tile(np.arange(n_points, dtype=float), 4)
+    np.testing.assert_array_equal(production_results["value"], expected_values)
+    np.testing.assert_array_equal(production_results["year"], np.tile(x, 4))
+    assert np.bincount(flow_results["year"] - 2020).tolist() == [2 * n_steps] * n_years
+
+
+def _chart_data(attribute, **kwargs):
+    series = DataSeries(x=[2030], y=[1.0])
+    data = {
+        "node_capacity": {"IDN": {"BAT": series}},
+        "edge_capacity": {"IDN-MYS": {"HVDC": {"ELEC": series}}},
+        "production_timeseries": {"IDN": {"BAT": {"ELEC": series}}},
+        "flow_timeseries": {"IDN": {"MYS": {"ELEC": {"export": series}}}},
+    }[attribute]
+    return mock.Mock(data=data)
+
+
+def test_load_fetches_tables_concurrently():
+    # every request blocks until all four are in flight, so a sequential
+    # load would time out on the barrier
+    barrier = threading.Barrier(len(RESULTS_TABLES), timeout=5)
+
+    def get_chart_data(**kwargs):
+        barrier.wait()
+        return _chart_data(**kwargs)
+
+    with mock.patch.object(api.runs, "get_chart_data", side_effect=get_chart_data) as mock_get:
+        results = RunResults(id=FULLSLUG).load()
+        assert mock_get.call_count == 4
+        assert results.node_capacity._table == "node_capacity"
+        assert results.edge_capacity._table == "edge_capacity"
+        assert list(results.production.commodity) == ["ELEC"]
+        assert list(results.flow.flow_type) == ["export"]
+        assert mock_get.call_count == 4
+
+
+def test_load_skips_loaded_tables():
+    with mock.patch.object(api.runs, "get_chart_data", side_effect=_chart_data) as mock_get:
+        results = RunResults(id=FULLSLUG)
+        results.production
+        results.load(tables=["production", "flow"])
+        attributes = [call.kwargs["attribute"] for call in mock_get.call_args_list]
+        assert attributes == ["production_timeseries", "flow_timeseries"]
+
+
+def test_load_unknown_table():
+    with pytest.raises(ValueError, match="capacity"):
+        RunResults(id=FULLSLUG).load(tables=["capacity"])
+
+
+def test_missing_table_data():
+    with mock.patch.object(api.runs, "get_chart_data", return_value=mock.Mock(data=None)):
+        assert RunResults(id=FULLSLUG).load().flow is None
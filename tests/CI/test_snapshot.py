@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tz.client.api import snapshot
+from tz.client.api.client import AsyncClient, Client
+from tz.client.api.snapshot import SnapshotMissError, SnapshotTransport
+
+
+def _handler(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(
+            200,
+            json={"path": request.url.path, "limit": request.url.params.get("limit")},
+            headers={"etag": '"v1"', "set-cookie": "session=secret"},
+        )
+
+    return handler
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "snapshot.json.gz")
+
+
+def _client(transport):
+    client = Client()
+    client.httpx_client = httpx.Client(base_url="https://api.test", transport=transport)
+    return client
+
+
+def test_record_then_replay(path):
+    requests = []
+    recorder = SnapshotTransport(
+        path, mode="record", transport=httpx.MockTransport(_handler(requests))
+    )
+    client = _client(recorder)
+    recorded = client.get("/models", params={"limit": 5, "offset": 0}).json()
+    client.get("/oauth/token")
+    recorder.save()
+
+    replayed = _client(SnapshotTransport(path))
+    # query parameter order doesn't matter
+    response = replayed.get("/models", params={"offset": 0, "limit": 5})
+    assert response.json() == recorded
+    assert response.headers["etag"] == '"v1"'
+    assert "set-cookie" not in response.headers
+    assert requests == ["/models", "/oauth/token"]
+
+    with pytest.raises(SnapshotMissError):
+        replayed.get("/models", params={"limit": 10})
+    with pytest.raises(SnapshotMissError):
+        replayed.get("/oauth/token")
+
+
+def test_replay_async(path):
+    recorder = SnapshotTransport(path, mode="record", transport=httpx.MockTransport(_handler([])))
+    _client(recorder).get("/runs/a:b:c:d")
+    recorder.save()
+
+    async def replay():
+        async with AsyncClient() as client:
+            client.httpx_client = httpx.AsyncClient(
+                base_url="https://api.test", transport=SnapshotTransport(path)
+            )
+            return (await client.get("/runs/a:b:c:d")).json()
+
+    assert asyncio.run(replay()) == {"path": "/runs/a:b:c:d", "limit": None}
+
+
+def test_offline_env(path, monkeypatch):
+    SnapshotTransport(path, mode="record").save()
+    monkeypatch.setattr(snapshot, "_default_transport", None)
+    monkeypatch.setenv("TZ_OFFLINE", "1")
+    monkeypatch.setenv("TZ_SNAPSHOT", path)
+    monkeypatch.setenv("TZ_API_CACHE", "true")
+
+    client = Client()
+    assert client.httpx_client.auth.no_token
+    assert client.cache is None
+    with pytest.raises(SnapshotMissError):
+        client.get("/models")
@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from tz.client.api.client import ClientAuth, RefreshTokenError
+from tz.client.api.schemas import AuthToken
+
+TOKEN = dict(
+    access_token="old-access",
+    refresh_token="refresh",
+    id_token="id",
+    scope="openid",
+    expires_in=3600,
+    token_type="Bearer",
+)
+
+
+def _handler(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.url.path, request.headers.get("Authorization")))
+        if request.url.path == "/oauth/token":
+            # no refresh_token: it isn't rotated
+            return httpx.Response(
+                200,
+                json={k: v for k, v in TOKEN.items() if k != "refresh_token"}
+                | {"access_token": "new-access"},
+            )
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+@pytest.fixture
+def token_path(tmp_path):
+    return tmp_path / "token.json"
+
+
+def _auth(token_path, issued_at):
+    auth = ClientAuth()
+    auth.no_token = False
+    auth.token_path = token_path
+    auth.token = AuthToken(**TOKEN, issued_at=issued_at)
+    return auth
+
+
+def test_refreshes_before_expiry(token_path):
+    requests = []
+    auth = _auth(token_path, issued_at=time.time() - 3590)
+    client = httpx.Client(
+        base_url="https://api.test", auth=auth, transport=httpx.MockTransport(_handler(requests))
+    )
+    assert client.post("/technologies", json={"big": "body"}).status_code == 200
+    assert requests == [("/oauth/token", None), ("/technologies", "Bearer new-access")]
+
+    # the refreshed token is persisted, keeping the old refresh token
+    saved = AuthToken.from_file(token_path)
+    assert (saved.access_token, saved.refresh_token) == ("new-access", "refresh")
+    assert saved.expires_at == pytest.approx(time.time() + 3600, abs=5)
+
+
+def test_fresh_token_not_refreshed(token_path):
+    requests = []
+    auth = _auth(token_path, issued_at=time.time())
+    client = httpx.Client(
+        base_url="https://api.test", auth=auth, transport=httpx.MockTransport(_handler(requests))
+    )
+    client.get("/nodes/DEU")
+    assert requests == [("/nodes/DEU", "Bearer old-access")]
+    assert not token_path.exists()
+
+
+def test_issued_at_falls_back_to_file_mtime(token_path):
+    token_path.write_text(json.dumps(TOKEN))
+    os.utime(token_path, (1_000_000, 1_000_000))
+    assert AuthToken.from_file(token_path).expires_at == 1_000_000 + 3600
+
+
+def _expiring_handler(requests, barrier):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.url.path, request.headers.get("Authorization")))
+        if request.url.path == "/oauth/token":
+            return httpx.Response(200, json={**TOKEN, "access_token": "new-access"})
+        if request.headers["Authorization"] == "Bearer old-access":
+            # let every thread get its 401 before any refreshes
+            barrier.wait()
+            return httpx.Response(401)
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+def test_concurrent_401s_refresh_once(token_path):
+    requests, barrier = [], threading.Barrier(8)
+    auth = _auth(token_path, issued_at=None)
+    client = httpx.Client(
+        base_url="https://api.test",
+        auth=auth,
+        transport=httpx.MockTransport(_expiring_handler(requests, barrier)),
+    )
+    with ThreadPoolExecutor(8) as executor:
+        responses = list(executor.map(lambda _: client.get("/nodes/DEU"), range(8)))
+    assert all(response.status_code == 200 for response in responses)
+    assert [path for path, _ in requests].count("/oauth/token") == 1
+
+
+def test_refresh_by_another_process_is_reused(token_path):
+    requests = []
+    handler = _expiring_handler(requests, threading.Barrier(1))
+    # e.g. two processes sharing the token file
+    first, second = _auth(token_path, issued_at=None), _auth(token_path, issued_at=None)
+    for auth in (first, second):
+        client = httpx.Client(
+            base_url="https://api.test", auth=auth, transport=httpx.MockTransport(handler)
+        )
+        assert client.get("/nodes/DEU").status_code == 200
+    assert [path for path, _ in requests].count("/oauth/token") == 1
+    assert second.token.access_token == "new-access"
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(400, json={"error": "invalid_grant", "error_description": "Revoked"}),
+        httpx.Response(401, text="Unauthorized"),
+        httpx.Response(200, json={"error": "no token"}),
+    ],
+)
+def test_failed_refresh_is_not_saved(token_path, response):
+    auth = _auth(token_path, issued_at=time.time() - 3590)
+    client = httpx.Client(
+        base_url="https://api.test", auth=auth, transport=httpx.MockTransport(lambda r: response)
+    )
+    with pytest.raises(RefreshTokenError):
+        client.get("/nodes/DEU")
+    assert not token_path.exists()
+    assert auth.token.access_token == "old-access"
@@ -27,33 +27,93 @@
 """
 
 
+import threading
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
 
-from dotenv import load_dotenv
-
-from tz.client.asset import Asset, AssetCollection
-from tz.client.geospatial import Features, Geometry
-from tz.client.job import Job
-from tz.client.model import Model
-from tz.client.model_scenario import ModelScenario
-from tz.client.node import Node
-from tz.client.publisher import Publisher
-from tz.client.record import Record, RecordCollection
-from tz.client.run import Run
-from tz.client.source import Source
-from tz.client.technology import Technology
-
-load_dotenv()
-
-Publisher.model_rebuild()
-Source.model_rebuild()
-Asset.model_rebuild()
-Node.model_rebuild()
-Model.model_rebuild()
-ModelScenario.model_rebuild()
-Technology.model_rebuild()
-Run.model_rebuild()
-Job.model_rebuild()
+from tz.client.core import load_env
+
+# Importing the package is cheap and free of side effects: the public names below
+# are imported from their modules on first use, together with the .env file.
+_LAZY_IMPORTS = {
+    "Node": "tz.client.node",
+    "Asset": "tz.client.asset",
+    "AssetCollection": "tz.client.asset",
+    "Model": "tz.client.model",
+    "ModelScenario": "tz.client.model_scenario",
+    "Run": "tz.client.run",
+    "Record": "tz.client.record",
+    "RecordCollection": "tz.client.record",
+    "ResultsStore": "tz.client.results_store",
+    "Publisher": "tz.client.publisher",
+    "Source": "tz.client.source",
+    "Technology": "tz.client.technology",
+    "Features": "tz.client.geospatial",
+    "Geometry": "tz.client.geospatial",
+    "Job": "tz.client.job",
+    "prefetch_related": "tz.client.utils",
+}
+
+# models with forward references to each other, rebuilt once all are imported
+_REBUILT_MODELS = (
+    "Publisher",
+    "Source",
+    "Asset",
+    "Node",
+    "Model",
+    "ModelScenario",
+    "Technology",
+    "Run",
+    "Job",
+)
+
+_rebuild_lock = threading.RLock()
+_rebuilt = False
+_rebuilding = False
+
+
+def _rebuild_models() -> None:
+    global _rebuilt, _rebuilding
+    with _rebuild_lock:
+        if _rebuilt or _rebuilding:
+            return
+        _rebuilding = True
+        try:
+            namespace = {}
+            for name, module_name in _LAZY_IMPORTS.items():
+                module = import_module(module_name)
+                if not hasattr(module, name):
+                    # the module is still being imported (e.g. `import tz.client.node`
+                    # imports the others first); the rebuild is retried on the next access
+                    return
+                namespace[name] = getattr(module, name)
+            for name in _REBUILT_MODELS:
+                namespace[name].model_rebuild(_types_namespace=namespace)
+        finally:
+            _rebuilding = False
+        _rebuilt = True
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        try:
+            # submodules, e.g. `client.api` after `from tz import client`
+            return import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    load_env()
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    _rebuild_models()
+    # only cached once the rebuild hasn't failed, so a failure is raised again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 try:
     __version__ = version("tz-client")
@@ -69,10 +129,12 @@ __all__ = [
     "Run",
     "Record",
     "RecordCollection",
+    "ResultsStore",
     "Publisher",
     "Source",
     "Technology",
     "Features",
     "Geometry",
     "Job",
+    "prefetch_related",
 ]
@@ -20,29 +20,55 @@
     ```python
     my_model = api.models.get("my-model")
     ```
+
+    Asyncio versions of every wrapper live in `api.aio`:
+    ```python
+    node = await api.aio.nodes.get("IDN")
+    ```
 """
-from tz.client.api.assets import AssetAPI
-from tz.client.api.geospatial import VectorAPI
-from tz.client.api.jobs import JobAPI
-from tz.client.api.model_scenarios import ModelScenarioAPI
-from tz.client.api.models import ModelAPI
-from tz.client.api.node_aliases import NodeAliasAPI
-from tz.client.api.nodes import NodeAPI
-from tz.client.api.publishers import PublisherAPI
-from tz.client.api.records import RecordsAPI
-from tz.client.api.runs import RunAPI
-from tz.client.api.sources import SourceAPI
-from tz.client.api.technologies import TechnologyAPI
-
-node_aliases = NodeAliasAPI()
-nodes = NodeAPI()
-assets = AssetAPI()
-vectors = VectorAPI()
-records = RecordsAPI()
-runs = RunAPI()
-models = ModelAPI()
-model_scenarios = ModelScenarioAPI()
-sources = SourceAPI()
-publishers = PublisherAPI()
-technologies = TechnologyAPI()
-jobs = JobAPI()
+import sys
+import types
+from importlib import import_module
+
+# the wrappers are built on first use, so that importing `tz.client.api` doesn't
+# import every schema
+_LAZY_WRAPPERS = {
+    "node_aliases": ("tz.client.api.node_aliases", "NodeAliasAPI"),
+    "nodes": ("tz.client.api.nodes", "NodeAPI"),
+    "assets": ("tz.client.api.assets", "AssetAPI"),
+    "vectors": ("tz.client.api.geospatial", "VectorAPI"),
+    "records": ("tz.client.api.records", "RecordsAPI"),
+    "runs": ("tz.client.api.runs", "RunAPI"),
+    "models": ("tz.client.api.models", "ModelAPI"),
+    "model_scenarios": ("tz.client.api.model_scenarios", "ModelScenarioAPI"),
+    "sources": ("tz.client.api.sources", "SourceAPI"),
+    "publishers": ("tz.client.api.publishers", "PublisherAPI"),
+    "technologies": ("tz.client.api.technologies", "TechnologyAPI"),
+    "jobs": ("tz.client.api.jobs", "JobAPI"),
+}
+
+
+def __getattr__(name: str):
+    if name == "aio":
+        return import_module("tz.client.api.aio")
+    if name not in _LAZY_WRAPPERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, cls = _LAZY_WRAPPERS[name]
+    wrapper = getattr(import_module(module), cls)()
+    return globals().setdefault(name, wrapper)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_WRAPPERS) | {"aio"})
+
+
+class _APIModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing e.g. `tz.client.api.nodes` binds the module on this package,
+        # but the wrapper of the same name takes precedence
+        if name in _LAZY_WRAPPERS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _APIModule
@@ -0,0 +1,53 @@
+"""
+    Asyncio counterparts of the `tz.client.api` wrappers. Every call returns a
+    coroutine, so many lookups can be run concurrently on one event loop:
+
+    ```python
+    import asyncio
+
+    from tz.client.api import aio
+
+    async def main():
+        return await asyncio.gather(*[aio.nodes.get(slug) for slug in ["IDN", "DEU"]])
+
+    nodes = asyncio.run(main())
+    ```
+
+    The instances below share the module-level `async_client`, whose connections
+    belong to the event loop that first uses them. To drive several event loops
+    (e.g. repeated `asyncio.run` calls), give each loop its own client:
+
+    ```python
+    from tz.client.api.client import AsyncClient
+    from tz.client.api.nodes import AsyncNodeAPI
+
+    async def main():
+        async with AsyncClient() as client:
+            return await AsyncNodeAPI(client).get("IDN")
+    ```
+"""
+from tz.client.api.assets import AsyncAssetAPI
+from tz.client.api.geospatial import AsyncVectorAPI
+from tz.client.api.jobs import AsyncJobAPI
+from tz.client.api.model_scenarios import AsyncModelScenarioAPI
+from tz.client.api.models import AsyncModelAPI
+from tz.client.api.node_aliases import AsyncNodeAliasAPI
+from tz.client.api.nodes import AsyncNodeAPI
+from tz.client.api.publishers import AsyncPublisherAPI
+from tz.client.api.records import AsyncRecordsAPI
+from tz.client.api.runs import AsyncRunAPI
+from tz.client.api.sources import AsyncSourceAPI
+from tz.client.api.technologies import AsyncTechnologyAPI
+
+node_aliases = AsyncNodeAliasAPI()
+nodes = AsyncNodeAPI()
+assets = AsyncAssetAPI()
+vectors = AsyncVectorAPI()
+records = AsyncRecordsAPI()
+runs = AsyncRunAPI()
+models = AsyncModelAPI()
+model_scenarios = AsyncModelScenarioAPI()
+sources = AsyncSourceAPI()
+publishers = AsyncPublisherAPI()
+technologies = AsyncTechnologyAPI()
+jobs = AsyncJobAPI()
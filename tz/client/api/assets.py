@@ -1,7 +1,10 @@
-from typing import List, Union
+from typing import AsyncIterator, Iterator, List, Union
 
-from tz.client.api.base import BaseAPI
-from tz.client.api.schemas import AssetResponse, Node
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
+from tz.client.api.schemas import AssetResponse, Node, NodeBase
+# fmt: off
+from tz.client.api.utils import (DEFAULT_MAX_CONCURRENCY, afetch_all,
+                                 apaginate, fetch_all, paginate, parse_page)
 
 
 class AssetAPI(BaseAPI):
@@ -13,6 +16,7 @@ class AssetAPI(BaseAPI):
         limit: Union[int, None] = None,
         page: Union[int, None] = None,
         includes: Union[str, None] = None,
+        response_model: type[NodeBase] | None = None,
     ) -> List[Node]:
         if isinstance(ids, list):
             ids = ",".join(ids)
@@ -26,7 +30,149 @@ class AssetAPI(BaseAPI):
             includes=includes,
         )
 
+        return self._get(params, response_model).assets
+
+    def iter_get(
+        self,
+        ids: Union[str, List[str], None] = None,
+        parent_node_id: Union[str, None] = None,
+        sector: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        page: Union[int, None] = None,
+        includes: Union[str, None] = None,
+    ) -> Iterator[Node]:
+        """Lazily iterate over every asset matching the query, fetching pages
+        (from `page` onwards) only as they are consumed."""
+        if isinstance(ids, list):
+            ids = ",".join(ids)
+
+        params = dict(
+            id=ids,
+            parent_node_id=parent_node_id,
+            sector=sector,
+            limit=limit,
+            includes=includes,
+        )
+        return paginate(lambda p: self._get({**params, "page": p}), "assets", page)
+
+    def get_all(
+        self,
+        ids: Union[str, List[str], None] = None,
+        parent_node_id: Union[str, None] = None,
+        sector: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        page: Union[int, None] = None,
+        includes: Union[str, None] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Node]:
+        """Fetch every asset matching the query.
+
+        Once the first page reports `total_results`, the remaining pages are
+        requested concurrently (at most `max_concurrency` at a time) and
+        reassembled in order.
+        """
+        if isinstance(ids, list):
+            ids = ",".join(ids)
+
+        params = dict(
+            id=ids,
+            parent_node_id=parent_node_id,
+            sector=sector,
+            limit=limit,
+            includes=includes,
+        )
+        return fetch_all(
+            lambda p: self._get({**params, "page": p}),
+            "assets",
+            limit=limit,
+            page=page,
+            max_concurrency=max_concurrency,
+        )
+
+    def _get(self, params: dict, response_model: type | None = None) -> AssetResponse:
         resp = self.client.get("/assets", params=params)
         resp.raise_for_status()
+        return parse_page(AssetResponse, resp.json(), "assets", response_model)
 
-        return AssetResponse(**resp.json()).assets
+
+class AsyncAssetAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        ids: Union[str, List[str], None] = None,
+        parent_node_id: Union[str, None] = None,
+        sector: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        page: Union[int, None] = None,
+        includes: Union[str, None] = None,
+        response_model: type[NodeBase] | None = None,
+    ) -> List[Node]:
+        if isinstance(ids, list):
+            ids = ",".join(ids)
+
+        params = dict(
+            id=ids,
+            parent_node_id=parent_node_id,
+            sector=sector,
+            limit=limit,
+            page=page,
+            includes=includes,
+        )
+
+        return (await self._get(params, response_model)).assets
+
+    def iter_get(
+        self,
+        ids: Union[str, List[str], None] = None,
+        parent_node_id: Union[str, None] = None,
+        sector: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        page: Union[int, None] = None,
+        includes: Union[str, None] = None,
+    ) -> AsyncIterator[Node]:
+        """Asynchronously iterate over every asset matching the query; see
+        `AssetAPI.iter_get`."""
+        if isinstance(ids, list):
+            ids = ",".join(ids)
+
+        params = dict(
+            id=ids,
+            parent_node_id=parent_node_id,
+            sector=sector,
+            limit=limit,
+            includes=includes,
+        )
+        return apaginate(lambda p: self._get({**params, "page": p}), "assets", page)
+
+    async def get_all(
+        self,
+        ids: Union[str, List[str], None] = None,
+        parent_node_id: Union[str, None] = None,
+        sector: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        page: Union[int, None] = None,
+        includes: Union[str, None] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Node]:
+        """Fetch every asset matching the query; see `AssetAPI.get_all`."""
+        if isinstance(ids, list):
+            ids = ",".join(ids)
+
+        params = dict(
+            id=ids,
+            parent_node_id=parent_node_id,
+            sector=sector,
+            limit=limit,
+            includes=includes,
+        )
+        return await afetch_all(
+            lambda p: self._get({**params, "page": p}),
+            "assets",
+            limit=limit,
+            page=page,
+            max_concurrency=max_concurrency,
+        )
+
+    async def _get(self, params: dict, response_model: type | None = None) -> AssetResponse:
+        resp = await self.client.get("/assets", params=params)
+        resp.raise_for_status()
+        return parse_page(AssetResponse, resp.json(), "assets", response_model)
@@ -1,7 +1,33 @@
 from abc import ABC
 
-from .client import client
+from . import client as client_module
+from .client import AsyncClient
+
+
+class DefaultClient:
+    """Resolves to a module-level client of `tz.client.api.client`, which is only
+    built on first use."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        return getattr(client_module, self.name)
 
 
 class BaseAPI(ABC):
-    client = client
+    client = DefaultClient("client")
+
+
+class AsyncBaseAPI(ABC):
+    """Base class for the asyncio API wrappers.
+
+    By default all wrappers share the module-level `async_client`. Pass an
+    `AsyncClient` to bind a wrapper to a client owned by a specific event loop.
+    """
+
+    client = DefaultClient("async_client")
+
+    def __init__(self, client: AsyncClient | None = None):
+        if client is not None:
+            self.client = client
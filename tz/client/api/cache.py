@@ -0,0 +1,195 @@
+import os
+import threading
+
+import httpx
+
+from tz.client.api.disk_cache import DiskCache
+from tz.client.core import TTLCache
+
+API_CACHE_ENV = "TZ_API_CACHE"
+CONDITIONAL_REQUESTS_ENV = "TZ_API_CONDITIONAL"
+
+# response headers kept alongside a stored body; encodings are dropped since
+# httpx stores the body decoded
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+# seconds to cache GET responses for, per resource (the first segment of the path)
+DEFAULT_TTLS = {
+    "nodes": 3600,
+    "node-aliases": 3600,
+    "technologies": 3600,
+    "publishers": 3600,
+    "sources": 3600,
+}
+
+
+def _resource(url) -> str:
+    return str(url).strip("/").split("/")[0].split("?")[0]
+
+
+def request_key(url, kwargs: dict, scope: tuple = ()) -> tuple | None:
+    """A key identifying a GET request by its path, normalised params and `scope`
+    (e.g. the API base URL and user), or None if the request has other arguments
+    (e.g. headers) and can't be keyed."""
+    if set(kwargs) - {"params"}:
+        return None
+    params = kwargs.get("params") or {}
+    return (
+        str(url).strip("/"),
+        tuple(sorted((k, str(v)) for k, v in params.items() if v is not None)),
+        tuple(scope),
+    )
+
+
+def _record(response: httpx.Response) -> dict:
+    headers = {k: response.headers[k] for k in STORED_HEADERS if k in response.headers}
+    return {"status_code": response.status_code, "headers": headers, "content": response.content}
+
+
+def _response(record: dict, request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        record["status_code"],
+        headers=record["headers"],
+        content=record["content"],
+        request=request,
+    )
+
+
+class ResponseCache:
+    """
+    A cache of successful GET responses for slowly-changing reference data.
+
+    Only resources with a TTL in `ttls` are cached, each for its own TTL; at most
+    `maxsize` responses are kept in memory, least recently used are dropped first.
+    Pass a `DiskCache` as the `backend` to share cached responses between processes.
+    A successful `post` or `delete` to a resource invalidates its cached responses.
+
+    Caching is opt-in; pass a `ResponseCache` to `Client`/`AsyncClient`, or set
+    `TZ_API_CACHE=true` (or `disk`) to enable it with the default TTLs for the
+    module clients.
+
+    ```python
+    cache = ResponseCache(ttls={"nodes": 600})
+    client = Client(cache=cache)
+    ...
+    cache.hits, cache.misses
+    ```
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        maxsize: int = 1024,
+        backend: TTLCache | DiskCache | None = None,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+        self._cache = backend if backend is not None else TTLCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def key(self, url, kwargs: dict, scope: tuple = ()) -> tuple | None:
+        """The cache key of a GET request, or None if it isn't cacheable."""
+        if _resource(url) not in self.ttls:
+            return None
+        return request_key(url, kwargs, scope)
+
+    def get(self, key: tuple, request: httpx.Request) -> httpx.Response | None:
+        record = self._cache.get(key)
+        with self._lock:
+            if record is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if record is None else _response(record, request)
+
+    def set(self, key: tuple, response: httpx.Response) -> None:
+        if response.is_success:
+            self._cache.set(key, _record(response), ttl=self.ttls[_resource(key[0])])
+
+    def invalidate(self, url=None) -> None:
+        """Drop the cached responses of the resource `url` belongs to, or all of them."""
+        if url is None:
+            self._cache.clear()
+            return
+        resource = _resource(url)
+        for key in self._cache.keys():
+            if _resource(key[0]) == resource:
+                self._cache.pop(key)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def default_response_cache() -> ResponseCache | None:
+    """A `ResponseCache` if `TZ_API_CACHE` is enabled, else None."""
+    setting = str(os.environ.get(API_CACHE_ENV)).lower()
+    if setting == "disk":
+        return ResponseCache(backend=DiskCache(namespace="responses"))
+    if setting == "true":
+        return ResponseCache()
+    return None
+
+
+class ValidatorStore:
+    """
+    A store of `ETag`/`Last-Modified` validators and bodies of GET responses,
+    used to make conditional requests.
+
+    Later requests for the same path and params send `If-None-Match` and
+    `If-Modified-Since`; when the server answers `304 Not Modified`, the stored
+    body is served, so an unchanged payload only costs a header exchange. At most
+    `maxsize` responses are kept in memory, least recently used are dropped first;
+    pass a `DiskCache` as the `backend` to keep them on disk instead.
+
+    Conditional requests are opt-in; pass a `ValidatorStore` to `Client`/`AsyncClient`,
+    or set `TZ_API_CONDITIONAL=true` (or `disk`) to enable them for the module clients.
+    """
+
+    def __init__(self, maxsize: int = 256, backend: TTLCache | DiskCache | None = None):
+        self._cache = (
+            backend if backend is not None else TTLCache(maxsize=maxsize, ttl=float("inf"))
+        )
+
+    def key(self, url, kwargs: dict, scope: tuple = ()) -> tuple | None:
+        return request_key(url, kwargs, scope)
+
+    def prepare(self, key: tuple, kwargs: dict) -> dict:
+        """Add the validators stored for `key` to the request arguments."""
+        stored = self._cache.get(key)
+        if stored is None:
+            return kwargs
+        headers = {}
+        if "etag" in stored["headers"]:
+            headers["If-None-Match"] = stored["headers"]["etag"]
+        if "last-modified" in stored["headers"]:
+            headers["If-Modified-Since"] = stored["headers"]["last-modified"]
+        return {**kwargs, "headers": headers}
+
+    def resolve(self, key: tuple, response: httpx.Response) -> httpx.Response:
+        """Serve the stored body for a `304`, or store the validators of a new response."""
+        if response.status_code == 304:
+            stored = self._cache.get(key)
+            if stored is not None:
+                return _response(stored, response.request)
+        elif response.is_success and (
+            "etag" in response.headers or "last-modified" in response.headers
+        ):
+            self._cache.set(key, _record(response))
+        return response
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def default_validator_store() -> ValidatorStore | None:
+    """A `ValidatorStore` if `TZ_API_CONDITIONAL` is enabled, else None."""
+    setting = str(os.environ.get(CONDITIONAL_REQUESTS_ENV)).lower()
+    if setting == "disk":
+        return ValidatorStore(backend=DiskCache(namespace="validators"))
+    if setting == "true":
+        return ValidatorStore()
+    return None
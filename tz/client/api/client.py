@@ -1,15 +1,48 @@
+import asyncio
+import base64
+import contextlib
+import hashlib
 import json
 import os
+import random
 import threading
-from typing import Generator
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from typing import AsyncGenerator, AsyncIterator, Generator, Iterator
+from warnings import warn
 
 import httpx
+from httpx._config import DEFAULT_LIMITS
 from httpx._models import Request, Response
 
+try:
+    import fcntl
+
+    FILE_LOCK_SUPPORT = True
+except ImportError:  # e.g. Windows
+    FILE_LOCK_SUPPORT = False
+
+# fmt: off
+from tz.client.api.cache import (ResponseCache, ValidatorStore,
+                                 default_response_cache,
+                                 default_validator_store)
+from tz.client.api.rate_limit import RateLimiter, default_rate_limiter
 from tz.client.api.schemas import AuthToken
+from tz.client.api.snapshot import default_snapshot_transport, offline
 from tz.client.auth import AUTH0_CLIENT_ID, AUTH0_DOMAIN, TOKEN_PATH
+from tz.client.core import logger
+from tz.client.identity import IdentityMap, default_identity_map
 
 CLIENT_TIMEOUT = 10
+# refresh tokens this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 60
+RETRIES_ENV = "TZ_RETRIES"
+HTTP2_ENV = "TZ_HTTP2"
+MAX_CONNECTIONS_ENV = "TZ_MAX_CONNECTIONS"
+MAX_KEEPALIVE_CONNECTIONS_ENV = "TZ_MAX_KEEPALIVE_CONNECTIONS"
+KEEPALIVE_EXPIRY_ENV = "TZ_KEEPALIVE_EXPIRY"
 LOGIN_EXAMPLE = """from tz.client.auth import login
 login()"""
 
@@ -25,8 +58,11 @@ class ClientAuth(httpx.Auth):
 
     def __init__(self):
         self.token_path = TOKEN_PATH
-        self.no_token = str(os.environ.get("TZ_NO_TOKEN")).lower() == "true"
+        # snapshots are replayed without a login
+        self.no_token = str(os.environ.get("TZ_NO_TOKEN")).lower() == "true" or offline()
         self._sync_lock = threading.RLock()
+        # asyncio locks are bound to an event loop
+        self._async_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         if not self.no_token:
             try:
                 # Parse from local token file if it exists.
@@ -54,6 +90,19 @@ class ClientAuth(httpx.Auth):
                         f" Please login e.g. \n{LOGIN_EXAMPLE}"
                     )
 
+    def identity(self) -> str:
+        """A stable identifier of the authenticated user, used to scope cached responses."""
+        if self.token is None:
+            return "anonymous"
+        access_token = self.token.access_token
+        try:
+            # the `sub` claim of the (unverified) JWT payload
+            payload = access_token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return claims["sub"]
+        except (IndexError, ValueError, KeyError, TypeError):
+            return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
     def _refresh_token_parse(self, token_response: httpx.Response):
         """Parse a httpx Response into a new AuthToken object
 
@@ -66,11 +115,95 @@ class ClientAuth(httpx.Auth):
 
         # need to call read before parsing
         token_response.read()
-        token_json = token_response.json()
-        if token_response.status_code == 403:
+        try:
+            token_json = token_response.json()
+        except ValueError:
+            token_json = {}
+        # e.g. 403, or 400 `invalid_grant` for a revoked refresh token; the stale
+        # token must not be saved as if it were refreshed
+        if not token_response.is_success or "access_token" not in token_json:
             err_description = token_json.get("error_description", "No additional information")
             raise RefreshTokenError(f"{err_description}. Please login e.g. \n{LOGIN_EXAMPLE}")
-        self.token = AuthToken(**token_json)
+        # the response may leave out e.g. the refresh token if it isn't rotated
+        token = {**self.token.model_dump(), **token_json, "issued_at": time.time()}
+        self.token = AuthToken(**token)
+        self._save_token()
+
+    def _save_token(self):
+        """Persist a refreshed token, so that other processes don't refresh it again."""
+        try:
+            self.token.to_file(self.token_path)
+        except OSError as e:
+            logger.warning(f"Could not save the refreshed token to '{self.token_path}': {e}")
+
+    def _token_expiring(self) -> bool:
+        """Whether the token should be refreshed before it is next used."""
+        if self.no_token or not self.token.refresh_token or self.token.expires_at is None:
+            return False
+        return self.token.expires_at - time.time() < TOKEN_REFRESH_MARGIN
+
+    def _reload_token(self):
+        """Pick up a token refreshed and saved by another process."""
+        try:
+            self.token = AuthToken.from_file(self.token_path)
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def _open_lock_file(self):
+        try:
+            return open(f"{self.token_path}.lock", "a")
+        except OSError:
+            return None
+
+    @contextlib.contextmanager
+    def _refresh_lock(self) -> Iterator[None]:
+        """
+        Hold while refreshing the token, so that one thread and process refreshes it
+        while the others wait and then reuse the refreshed token.
+        """
+        with self._sync_lock:
+            lock_file = self._open_lock_file() if FILE_LOCK_SUPPORT else None
+            if lock_file is None:
+                yield
+                return
+            with lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextlib.asynccontextmanager
+    async def _async_refresh_lock(self) -> AsyncIterator[None]:
+        """The asyncio counterpart of `_refresh_lock`; the file lock is polled so
+        that the event loop isn't blocked."""
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            lock_file = self._open_lock_file() if FILE_LOCK_SUPPORT else None
+            if lock_file is None:
+                yield
+                return
+            with lock_file:
+                while True:
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        await asyncio.sleep(0.05)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _sync_refresh(self, stale_access_token: str) -> Generator[Request, Response, None]:
+        """Refresh the token, unless another caller already replaced `stale_access_token`."""
+        with self._refresh_lock():
+            self._reload_token()
+            if self.token.access_token != stale_access_token:
+                return
+            refresh_response = yield self._refresh_token_request()
+            self._refresh_token_parse(refresh_response)
 
     def _refresh_token_request(self) -> httpx.Request:
         """Build a refresh token HTTPX request"""
@@ -85,6 +218,9 @@ class ClientAuth(httpx.Auth):
     def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
         if not self.no_token:
             self.get_token()
+            if self._token_expiring():
+                # refresh ahead of expiry rather than sending the request twice
+                yield from self._sync_refresh(self.token.access_token)
             request.headers.update({"Authorization": f"Bearer {self.token.access_token}"})
         response = yield request
 
@@ -94,52 +230,426 @@ class ClientAuth(httpx.Auth):
                 response.raise_for_status()
             # Auth failed - possible expired token
             # Send refresh token request and parse response
-            refresh_response = yield self._refresh_token_request()
-            self._refresh_token_parse(refresh_response)
+            yield from self._sync_refresh(request.headers["Authorization"].removeprefix("Bearer "))
 
             # attach new token header
             request.headers.update({"Authorization": f"Bearer {self.token.access_token}"})
             yield request
 
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        if not self.no_token:
+            self.get_token()
+            if self._token_expiring():
+                stale_access_token = self.token.access_token
+                async with self._async_refresh_lock():
+                    self._reload_token()
+                    if self.token.access_token == stale_access_token:
+                        refresh_response = yield self._refresh_token_request()
+                        await refresh_response.aread()
+                        self._refresh_token_parse(refresh_response)
+            request.headers.update({"Authorization": f"Bearer {self.token.access_token}"})
+        response = yield request
 
-class Client:
-    def __init__(self, headers: dict | None = None):
-        base_url = (
-            os.environ.get("TZ_API_URL", "https://api.feo.transitionzero.org")
-            + "/"
-            + os.environ.get("TZ_API_VERSION", "v1")
+        if response.status_code == 401:
+            # Auth failed - handle case of no_token
+            if self.no_token:
+                response.raise_for_status()
+            # Auth failed - possible expired token
+            # Send refresh token request and parse response; the body must be
+            # read asynchronously before the (sync) parser can use it. Another
+            # caller may have refreshed the token already.
+            stale_access_token = request.headers["Authorization"].removeprefix("Bearer ")
+            async with self._async_refresh_lock():
+                self._reload_token()
+                if self.token.access_token == stale_access_token:
+                    refresh_response = yield self._refresh_token_request()
+                    await refresh_response.aread()
+                    self._refresh_token_parse(refresh_response)
+
+            # attach new token header
+            request.headers.update({"Authorization": f"Bearer {self.token.access_token}"})
+            yield request
+
+
+def _base_url() -> str:
+    return (
+        os.environ.get("TZ_API_URL", "https://api.feo.transitionzero.org")
+        + "/"
+        + os.environ.get("TZ_API_VERSION", "v1")
+    )
+
+
+def _limits(limits: httpx.Limits | None = None) -> httpx.Limits:
+    """Connection pool limits, by default httpx's own updated from the environment."""
+    if limits is not None:
+        return limits
+    return httpx.Limits(
+        max_connections=int(os.environ.get(MAX_CONNECTIONS_ENV, DEFAULT_LIMITS.max_connections)),
+        max_keepalive_connections=int(
+            os.environ.get(MAX_KEEPALIVE_CONNECTIONS_ENV, DEFAULT_LIMITS.max_keepalive_connections)
+        ),
+        keepalive_expiry=float(
+            os.environ.get(KEEPALIVE_EXPIRY_ENV, DEFAULT_LIMITS.keepalive_expiry)
+        ),
+    )
+
+
+def _http2(http2: bool | None = None) -> bool:
+    """Whether to use HTTP/2, which needs the 'http2' requirements; opt-in via `TZ_HTTP2`."""
+    if http2 is None:
+        http2 = str(os.environ.get(HTTP2_ENV)).lower() == "true"
+    if http2 and find_spec("h2") is None:
+        warn(
+            "HTTP/2 was requested but 'h2' is not installed, so HTTP/1.1 will be used."
+            " Please install the 'http2' requirements: pip install tz-client[http2]"
         )
+        return False
+    return http2
 
-        # maybe load some headers from environment
-        maybe_base_headers = os.environ.get("TZ_HEADERS")
-        if maybe_base_headers:
-            base_headers = json.loads(maybe_base_headers)
-        else:
-            base_headers = {}
 
-        # update any base_headers with instantiation headers
-        if headers is None:
-            headers = base_headers
+def _base_headers(headers: dict | None = None) -> dict:
+    # maybe load some headers from environment
+    maybe_base_headers = os.environ.get("TZ_HEADERS")
+    if maybe_base_headers:
+        base_headers = json.loads(maybe_base_headers)
+    else:
+        base_headers = {}
+
+    # update any base_headers with instantiation headers
+    if headers is not None:
+        base_headers.update(headers)
+    return base_headers
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Requests that fail with a connection error or one of `status_codes` are retried
+    up to `max_retries` times, after an exponential backoff of `backoff_factor *
+    2**attempt` seconds (at most `max_backoff`) with full jitter, or after the
+    response's `Retry-After` if it has one. A `Retry-After` longer than
+    `max_retry_after` is not waited for.
+
+    Only `methods` are retried, by default the safe methods; a request that failed
+    to connect never reached the server, so it is retried whatever its method.
+
+    Retries are drawn from a budget shared by every request made with the policy,
+    so that an outage doesn't multiply the load on the API: the budget starts at
+    (and is capped at) `budget_reserve` retries, and each request adds
+    `budget_ratio` of a retry to it.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        status_codes: tuple[int, ...] = (429, 502, 503, 504),
+        methods: tuple[str, ...] = ("GET", "HEAD", "OPTIONS"),
+        max_retry_after: float = 120,
+        budget_ratio: float = 0.2,
+        budget_reserve: float = 10,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = status_codes
+        self.methods = methods
+        self.max_retry_after = max_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self._budget = budget_reserve
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """The default policy, with `max_retries` set by `TZ_RETRIES`."""
+        return cls(max_retries=int(os.environ.get(RETRIES_ENV, 3)))
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> float | None:
+        """The wait requested by a response's `Retry-After` header, in seconds."""
+        value = response.headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _withdraw(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            return True
+
+    def delay(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """
+        How long to wait before retrying a request that got `response` or raised
+        `error` on its `attempt`th try (from 0), or None if it shouldn't be retried.
+        """
+        if attempt == 0:
+            with self._lock:
+                self._budget = min(self.budget_reserve, self._budget + self.budget_ratio)
+        if attempt >= self.max_retries:
+            return None
+
+        if error is not None:
+            if not isinstance(error, httpx.TransportError):
+                return None
+            not_sent = isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+            if method.upper() not in self.methods and not not_sent:
+                return None
+            delay = self.backoff(attempt)
         else:
-            base_headers.update(headers)
-            headers = base_headers
+            if response.status_code not in self.status_codes:
+                return None
+            if method.upper() not in self.methods:
+                return None
+            delay = self.retry_after(response)
+            if delay is None:
+                delay = self.backoff(attempt)
+            elif delay > self.max_retry_after:
+                return None
 
+        return delay if self._withdraw() else None
+
+
+class Client:
+    def __init__(
+        self,
+        headers: dict | None = None,
+        cache: ResponseCache | None = None,
+        validators: ValidatorStore | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        identity_map: IdentityMap | None = None,
+    ):
+        transport = default_snapshot_transport()
         self.httpx_client = httpx.Client(
-            base_url=base_url, auth=ClientAuth(), timeout=CLIENT_TIMEOUT, headers=headers
+            base_url=_base_url(),
+            auth=ClientAuth(),
+            timeout=CLIENT_TIMEOUT,
+            headers=_base_headers(headers),
+            transport=transport,
+            limits=_limits(limits),
+            http2=_http2(http2),
+        )
+        if transport is not None:
+            # every request must reach the snapshot to be recorded or replayed
+            self.cache, self.validators = cache, validators
+        else:
+            self.cache = cache if cache is not None else default_response_cache()
+            self.validators = validators if validators is not None else default_validator_store()
+        self.retry = retry if retry is not None else RetryPolicy.from_env()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter()
+        # the objects loaded through this client, e.g. by `Node.from_slug`
+        self.identity_map = identity_map if identity_map is not None else default_identity_map()
+
+    def _request(self, method: str, url, **kwargs) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                with self.rate_limiter.limit(url):
+                    response = self.httpx_client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                delay = self.retry.delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                self.rate_limiter.observe(url, response)
+                delay = self.retry.delay(method, attempt, response=response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _cache_scope(self) -> tuple:
+        auth = self.httpx_client.auth
+        identity = auth.identity() if isinstance(auth, ClientAuth) else "anonymous"
+        return (str(self.httpx_client.base_url), identity)
+
+    def _get(self, url, **kwargs) -> httpx.Response:
+        key = (
+            self.validators.key(url, kwargs, self._cache_scope())
+            if self.validators is not None
+            else None
+        )
+        if key is None:
+            return self._request("GET", url, **kwargs)
+        response = self._request("GET", url, **self.validators.prepare(key, kwargs))
+        return self.validators.resolve(key, response)
+
+    def get(self, url, **kwargs):
+        key = self.cache.key(url, kwargs, self._cache_scope()) if self.cache is not None else None
+        if key is None:
+            return self._get(url, **kwargs)
+        response = self.cache.get(key, self.httpx_client.build_request("GET", url, **kwargs))
+        if response is None:
+            response = self._get(url, **kwargs)
+            self.cache.set(key, response)
+        return response
+
+    def post(self, url, **kwargs):
+        response = self._request("POST", url, **kwargs)
+        if self.cache is not None and response.is_success:
+            self.cache.invalidate(url)
+        return response
+
+    def delete(self, url, **kwargs):
+        # `httpx.Client.delete` does not accept a body; go via `request` so that
+        # e.g. `TechnologyAPI.delete` can send its JSON payload.
+        response = self._request("DELETE", url, **kwargs)
+        if self.cache is not None and response.is_success:
+            self.cache.invalidate(url)
+        return response
+
+    @classmethod
+    def catch_errors(cls, r):
+        r.raise_for_status()
+
+
+class AsyncClient:
+    """The asyncio counterpart of `Client`.
+
+    Many requests can be in flight at once on a single event loop:
+
+    ```python
+    async with AsyncClient() as client:
+        responses = await asyncio.gather(*[client.get(f"/nodes/{slug}") for slug in slugs])
+    ```
+    """
+
+    def __init__(
+        self,
+        headers: dict | None = None,
+        cache: ResponseCache | None = None,
+        validators: ValidatorStore | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+    ):
+        transport = default_snapshot_transport()
+        self.httpx_client = httpx.AsyncClient(
+            base_url=_base_url(),
+            auth=ClientAuth(),
+            timeout=CLIENT_TIMEOUT,
+            headers=_base_headers(headers),
+            transport=transport,
+            limits=_limits(limits),
+            http2=_http2(http2),
         )
+        if transport is not None:
+            # every request must reach the snapshot to be recorded or replayed
+            self.cache, self.validators = cache, validators
+        else:
+            self.cache = cache if cache is not None else default_response_cache()
+            self.validators = validators if validators is not None else default_validator_store()
+        self.retry = retry if retry is not None else RetryPolicy.from_env()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter()
+
+    async def _request(self, method: str, url, **kwargs) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                async with self.rate_limiter.alimit(url):
+                    response = await self.httpx_client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                delay = self.retry.delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                self.rate_limiter.observe(url, response)
+                delay = self.retry.delay(method, attempt, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _cache_scope(self) -> tuple:
+        auth = self.httpx_client.auth
+        identity = auth.identity() if isinstance(auth, ClientAuth) else "anonymous"
+        return (str(self.httpx_client.base_url), identity)
+
+    async def _get(self, url, **kwargs) -> httpx.Response:
+        key = (
+            self.validators.key(url, kwargs, self._cache_scope())
+            if self.validators is not None
+            else None
+        )
+        if key is None:
+            return await self._request("GET", url, **kwargs)
+        response = await self._request("GET", url, **self.validators.prepare(key, kwargs))
+        return self.validators.resolve(key, response)
 
-    def get(self, *args, **kwargs):
-        return self.httpx_client.get(*args, **kwargs)
+    async def get(self, url, **kwargs):
+        key = self.cache.key(url, kwargs, self._cache_scope()) if self.cache is not None else None
+        if key is None:
+            return await self._get(url, **kwargs)
+        response = self.cache.get(key, self.httpx_client.build_request("GET", url, **kwargs))
+        if response is None:
+            response = await self._get(url, **kwargs)
+            self.cache.set(key, response)
+        return response
 
-    def post(self, *args, **kwargs):
-        return self.httpx_client.post(*args, **kwargs)
+    async def post(self, url, **kwargs):
+        response = await self._request("POST", url, **kwargs)
+        if self.cache is not None and response.is_success:
+            self.cache.invalidate(url)
+        return response
 
-    def delete(self, *args, **kwargs):
-        return self.httpx_client.delete(*args, **kwargs)
+    async def delete(self, url, **kwargs):
+        response = await self._request("DELETE", url, **kwargs)
+        if self.cache is not None and response.is_success:
+            self.cache.invalidate(url)
+        return response
+
+    async def aclose(self):
+        await self.httpx_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     @classmethod
     def catch_errors(cls, r):
         r.raise_for_status()
 
 
-client = Client()
+_default_clients_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    # the default `client` and `async_client` read the token file and environment,
+    # so they are only built on first use
+    if name not in ("client", "async_client"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _default_clients_lock:
+        if name not in globals():
+            globals()[name] = Client() if name == "client" else AsyncClient()
+    return globals()[name]
@@ -0,0 +1,206 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Hashable
+
+CACHE_DIR_ENV = "TZ_CACHE_DIR"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".tz", "cache")
+DEFAULT_MAX_BYTES = 512 * 1024**2
+
+# entries' access times are only bumped once they are this many seconds old, so
+# that most cache hits don't take the database's write lock
+ACCESS_RESOLUTION = 60
+
+# the stored size is tracked across writes and recounted every this many writes,
+# to pick up writes from other processes
+SIZE_RECOUNT_INTERVAL = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+def cache_path() -> str:
+    return os.path.join(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR), "responses.sqlite3")
+
+
+class DiskCache:
+    """
+    An on-disk backend for `ResponseCache` and `ValidatorStore`, shared by every
+    process on the machine.
+
+    Responses are kept in a SQLite database in WAL mode (under `~/.tz/cache`, or
+    `TZ_CACHE_DIR`) with zlib-compressed bodies, so many short-lived processes can
+    read and write it concurrently. Each `namespace` is a separate set of entries
+    in the same database. Once the stored bodies exceed `max_bytes`, the least
+    recently used entries are deleted; access times are kept to within
+    `ACCESS_RESOLUTION` seconds.
+
+    Values are the response records stored by `ResponseCache`/`ValidatorStore`:
+    dicts of `status_code`, `headers` and `content`.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        namespace: str = "responses",
+        ttl: float = float("inf"),
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.path = path or cache_path()
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        # an estimate of `size()`, or None until the next write recounts it
+        self._size: int | None = None
+        self._writes = 0
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections can't be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.time()
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT status_code, headers, body, accessed FROM entries"
+                " WHERE namespace = ? AND key = ? AND expires > ?",
+                (self.namespace, self._encode_key(key), now),
+            ).fetchone()
+            if row is None:
+                return default
+            status_code, headers, body, accessed = row
+            if now - accessed >= ACCESS_RESOLUTION:
+                conn.execute(
+                    "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, self._encode_key(key)),
+                )
+        return {
+            "status_code": status_code,
+            "headers": json.loads(headers),
+            "content": zlib.decompress(body),
+        }
+
+    def set(self, key: Hashable, value: dict, ttl: float | None = None) -> None:
+        now = time.time()
+        body = zlib.compress(value["content"])
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.namespace,
+                    self._encode_key(key),
+                    value["status_code"],
+                    json.dumps(value["headers"]),
+                    body,
+                    len(body),
+                    now + (self.ttl if ttl is None else ttl),
+                    now,
+                ),
+            )
+        self._writes += 1
+        if self._size is None or self._writes % SIZE_RECOUNT_INTERVAL == 0:
+            self._size = self.size()
+        else:
+            # overestimates when an entry is replaced, which only recounts sooner
+            self._size += len(body)
+        if self._size > self.max_bytes:
+            self.cap(self.max_bytes)
+            self._size = None
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        value = self.get(key, default)
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                (self.namespace, self._encode_key(key)),
+            )
+        return value
+
+    def keys(self) -> list:
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT key FROM entries WHERE namespace = ?", (self.namespace,)
+            ).fetchall()
+        return [json.loads(key) for key, in rows]
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+
+    def __len__(self) -> int:
+        with self._connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    # maintenance of the whole database, used by `tz cache`
+
+    def size(self) -> int:
+        """The total size of the stored (compressed) bodies in bytes."""
+        with self._connection() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def info(self) -> dict:
+        """Entry counts and sizes per namespace."""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0),"
+                " SUM(expires <= ?) FROM entries GROUP BY namespace",
+                (time.time(),),
+            ).fetchall()
+        return {
+            namespace: {"entries": entries, "bytes": size, "expired": expired}
+            for namespace, entries, size, expired in rows
+        }
+
+    def prune(self) -> int:
+        """Delete expired entries, returning how many were deleted."""
+        with self._connection() as conn:
+            return conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),)).rowcount
+
+    def cap(self, max_bytes: int) -> int:
+        """Delete least recently used entries until the bodies fit in `max_bytes`,
+        returning how many were deleted."""
+        deleted = 0
+        with self._connection() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            rows = conn.execute(
+                "SELECT namespace, key, size FROM entries ORDER BY accessed"
+            ).fetchall()
+            for namespace, key, size in rows:
+                if total <= max_bytes:
+                    break
+                conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+                total -= size
+                deleted += 1
+        return deleted
@@ -1714,23 +1714,3 @@ class UrlIndexPagination(PydanticBaseModel):
     next_page: int | None = Field(..., title="next_page")
     total_results: int | None = Field(..., title="total_results")
     url_index: list[UrlIndex] | None = Field(..., title="")
-
-
-DayPart.model_rebuild()
-User.model_rebuild()
-YearPart.model_rebuild()
-Asset.model_rebuild()
-Commodity.model_rebuild()
-Edge.model_rebuild()
-Job.model_rebuild()
-License.model_rebuild()
-Model.model_rebuild()
-ModelScenario.model_rebuild()
-Node.model_rebuild()
-OperatingMode.model_rebuild()
-ParameterPagination.model_rebuild()
-Publisher.model_rebuild()
-Record.model_rebuild()
-Run.model_rebuild()
-RunResultsChart.model_rebuild()
-ScenarioHeritage.model_rebuild()
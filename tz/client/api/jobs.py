@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 # fmt: off
 from tz.client.api.generated_schema import DeleteResponse, Job, JobCreate
 
@@ -15,3 +15,15 @@ class JobAPI(BaseAPI):
         resp = self.client.delete(f"/jobs/{uuid}")
         resp.raise_for_status()
         return DeleteResponse(**resp.json())
+
+
+class AsyncJobAPI(AsyncBaseAPI):
+    async def create(self, job: JobCreate) -> Job:
+        resp = await self.client.post("/jobs", json=job.model_dump())
+        resp.raise_for_status()
+        return Job(**resp.json())
+
+    async def delete(self, uuid: UUID) -> DeleteResponse:
+        resp = await self.client.delete(f"/jobs/{uuid}")
+        resp.raise_for_status()
+        return DeleteResponse(**resp.json())
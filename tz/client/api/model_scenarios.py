@@ -1,9 +1,11 @@
-from tz.client.api.base import BaseAPI
+from typing import AsyncIterator, Iterator
+
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 # fmt: off
 from tz.client.api.generated_schema import (DeleteResponse, ModelScenario,
                                             ModelScenarioCreate,
                                             ModelScenarioPagination)
-from tz.client.api.utils import non_empty
+from tz.client.api.utils import apaginate, non_empty, paginate, parse_page
 
 
 class ModelScenarioAPI(BaseAPI):
@@ -13,6 +15,7 @@ class ModelScenarioAPI(BaseAPI):
         model_slug: str,
         model_scenario_slug: str,
         includes: str | None = None,
+        response_model: type[ModelScenario] | None = None,
     ) -> ModelScenario:
         params = {
             "includes": includes,
@@ -23,7 +26,7 @@ class ModelScenarioAPI(BaseAPI):
         )
         resp.raise_for_status()
 
-        return ModelScenario(**resp.json())
+        return (response_model or ModelScenario)(**resp.json())
 
     def create(self, model_scenario: ModelScenarioCreate) -> ModelScenario:
         resp = self.client.post("/model-scenarios", json=model_scenario.model_dump())
@@ -45,6 +48,7 @@ class ModelScenarioAPI(BaseAPI):
         public: bool | None = None,
         limit: int = 5,
         page: int = 0,
+        response_model: type[ModelScenario] | None = None,
     ) -> list[ModelScenario]:
         params = {
             "model_scenario_slug": model_scenario_slug,
@@ -57,11 +61,128 @@ class ModelScenarioAPI(BaseAPI):
             "page": page,
         }
 
+        r = self._search(params, response_model)
+        if r.model_scenarios:
+            return r.model_scenarios
+        else:
+            return []
+
+    def iter_search(
+        self,
+        model_scenario_slug: str | None = None,
+        model_slug: str | None = None,
+        includes: str | None = None,
+        owner_id: str | None = None,
+        featured: bool | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+    ) -> Iterator[ModelScenario]:
+        """Lazily iterate over every model scenario matching the query, fetching
+        pages of `limit` model scenarios (from `page` onwards) only as they are consumed."""
+        params = {
+            "model_scenario_slug": model_scenario_slug,
+            "model_slug": model_slug,
+            "includes": includes,
+            "owner_id": owner_id,
+            "featured": featured,
+            "public": public,
+            "limit": limit,
+        }
+        return paginate(lambda p: self._search({**params, "page": p}), "model_scenarios", page)
+
+    def _search(self, params: dict, response_model: type | None = None) -> ModelScenarioPagination:
         resp = self.client.get("/model-scenarios", params=non_empty(params))
         resp.raise_for_status()
+        return parse_page(ModelScenarioPagination, resp.json(), "model_scenarios", response_model)
+
+
+class AsyncModelScenarioAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        owner: str,
+        model_slug: str,
+        model_scenario_slug: str,
+        includes: str | None = None,
+        response_model: type[ModelScenario] | None = None,
+    ) -> ModelScenario:
+        params = {
+            "includes": includes,
+        }
+
+        resp = await self.client.get(
+            f"/model-scenarios/{owner}:{model_slug}:{model_scenario_slug}", params=params
+        )
+        resp.raise_for_status()
+
+        return (response_model or ModelScenario)(**resp.json())
+
+    async def create(self, model_scenario: ModelScenarioCreate) -> ModelScenario:
+        resp = await self.client.post("/model-scenarios", json=model_scenario.model_dump())
+        resp.raise_for_status()
+        return ModelScenario(**resp.json())
+
+    async def delete(self, owner: str, model_slug: str, slug: str) -> DeleteResponse:
+        resp = await self.client.delete(f"/model-scenarios/{owner}:{model_slug}:{slug}")
+        resp.raise_for_status()
+        return DeleteResponse(**resp.json())
 
-        r = ModelScenarioPagination(**resp.json())
+    async def search(
+        self,
+        model_scenario_slug: str | None = None,
+        model_slug: str | None = None,
+        includes: str | None = None,
+        owner_id: str | None = None,
+        featured: bool | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+        response_model: type[ModelScenario] | None = None,
+    ) -> list[ModelScenario]:
+        params = {
+            "model_scenario_slug": model_scenario_slug,
+            "model_slug": model_slug,
+            "includes": includes,
+            "owner_id": owner_id,
+            "featured": featured,
+            "public": public,
+            "limit": limit,
+            "page": page,
+        }
+
+        r = await self._search(params, response_model)
         if r.model_scenarios:
             return r.model_scenarios
         else:
             return []
+
+    def iter_search(
+        self,
+        model_scenario_slug: str | None = None,
+        model_slug: str | None = None,
+        includes: str | None = None,
+        owner_id: str | None = None,
+        featured: bool | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+    ) -> AsyncIterator[ModelScenario]:
+        """Asynchronously iterate over every model scenario matching the query; see
+        `ModelScenarioAPI.iter_search`."""
+        params = {
+            "model_scenario_slug": model_scenario_slug,
+            "model_slug": model_slug,
+            "includes": includes,
+            "owner_id": owner_id,
+            "featured": featured,
+            "public": public,
+            "limit": limit,
+        }
+        return apaginate(lambda p: self._search({**params, "page": p}), "model_scenarios", page)
+
+    async def _search(
+        self, params: dict, response_model: type | None = None
+    ) -> ModelScenarioPagination:
+        resp = await self.client.get("/model-scenarios", params=non_empty(params))
+        resp.raise_for_status()
+        return parse_page(ModelScenarioPagination, resp.json(), "model_scenarios", response_model)
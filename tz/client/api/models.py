@@ -1,18 +1,24 @@
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 # fmt: off
 from tz.client.api.generated_schema import (DeleteResponse, Model, ModelCreate,
                                             ModelPagination)
-from tz.client.api.utils import non_empty
+from tz.client.api.utils import apaginate, non_empty, paginate, parse_page
 
 
 class ModelAPI(BaseAPI):
-    def get(self, model_slug: str, owner: str, includes: str | None = None) -> Model:
+    def get(
+        self,
+        model_slug: str,
+        owner: str,
+        includes: str | None = None,
+        response_model: type[Model] | None = None,
+    ) -> Model:
         resp = self.client.get(f"/models/{owner}:{model_slug}", params={"includes": includes})
         resp.raise_for_status()
 
-        return Model(**resp.json())
+        return (response_model or Model)(**resp.json())
 
     def create(self, model: ModelCreate) -> Model:
         resp = self.client.post("/models", json=model.model_dump())
@@ -34,6 +40,7 @@ class ModelAPI(BaseAPI):
         public: bool | None = None,
         limit: int = 10,
         page: int = 0,
+        response_model: type[Model] | None = None,
     ) -> List[Model]:
         params = {
             "slug": slug,
@@ -46,10 +53,117 @@ class ModelAPI(BaseAPI):
             "page": page,
         }
 
+        r = self._search(params, response_model)
+        if r.models is None:
+            return []
+        return r.models
+
+    def iter_search(
+        self,
+        slug: str | None = None,
+        includes: str | None = None,
+        owner: str | None = None,
+        sort: str | None = None,
+        featured: bool | None = None,
+        public: bool | None = None,
+        limit: int = 10,
+        page: int = 0,
+    ) -> Iterator[Model]:
+        """Lazily iterate over every model matching the query, fetching pages of
+        `limit` models (from `page` onwards) only as they are consumed."""
+        params = {
+            "slug": slug,
+            "includes": includes,
+            "owner": owner,
+            "sort": sort,
+            "featured": featured,
+            "public": public,
+            "limit": limit,
+        }
+        return paginate(lambda p: self._search({**params, "page": p}), "models", page)
+
+    def _search(self, params: dict, response_model: type | None = None) -> ModelPagination:
         resp = self.client.get("/models", params=non_empty(params))
         resp.raise_for_status()
+        return parse_page(ModelPagination, resp.json(), "models", response_model)
+
+
+class AsyncModelAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        model_slug: str,
+        owner: str,
+        includes: str | None = None,
+        response_model: type[Model] | None = None,
+    ) -> Model:
+        resp = await self.client.get(f"/models/{owner}:{model_slug}", params={"includes": includes})
+        resp.raise_for_status()
+
+        return (response_model or Model)(**resp.json())
+
+    async def create(self, model: ModelCreate) -> Model:
+        resp = await self.client.post("/models", json=model.model_dump())
+        resp.raise_for_status()
+        return Model(**resp.json())
+
+    async def delete(self, owner: str, slug: str) -> DeleteResponse:
+        resp = await self.client.delete(f"/models/{owner}:{slug}")
+        resp.raise_for_status()
+        return DeleteResponse(**resp.json())
+
+    async def search(
+        self,
+        slug: str | None = None,
+        includes: str | None = None,
+        owner: str | None = None,
+        sort: str | None = None,
+        featured: bool | None = None,
+        public: bool | None = None,
+        limit: int = 10,
+        page: int = 0,
+        response_model: type[Model] | None = None,
+    ) -> List[Model]:
+        params = {
+            "slug": slug,
+            "includes": includes,
+            "owner": owner,
+            "sort": sort,
+            "featured": featured,
+            "public": public,
+            "limit": limit,
+            "page": page,
+        }
 
-        r = ModelPagination(**resp.json())
+        r = await self._search(params, response_model)
         if r.models is None:
             return []
         return r.models
+
+    def iter_search(
+        self,
+        slug: str | None = None,
+        includes: str | None = None,
+        owner: str | None = None,
+        sort: str | None = None,
+        featured: bool | None = None,
+        public: bool | None = None,
+        limit: int = 10,
+        page: int = 0,
+    ) -> AsyncIterator[Model]:
+        """Asynchronously iterate over every model matching the query; see
+        `ModelAPI.iter_search`."""
+        params = {
+            "slug": slug,
+            "includes": includes,
+            "owner": owner,
+            "sort": sort,
+            "featured": featured,
+            "public": public,
+            "limit": limit,
+        }
+        return apaginate(lambda p: self._search({**params, "page": p}), "models", page)
+
+    async def _search(self, params: dict, response_model: type | None = None) -> ModelPagination:
+        resp = await self.client.get("/models", params=non_empty(params))
+        resp.raise_for_status()
+        return parse_page(ModelPagination, resp.json(), "models", response_model)
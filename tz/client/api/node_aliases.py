@@ -1,10 +1,22 @@
 from typing import Union
 
-from tz.client.api.base import BaseAPI
-from tz.client.api.generated_schema import NodeAliasPagination
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
+from tz.client.api.generated_schema import Node, NodeAliasPagination
 from tz.client.api.utils import non_empty
 
 
+def _parse_aliases(data: dict, node_model: type[Node] | None) -> NodeAliasPagination:
+    """Validate a page of aliases, validating each included node as `node_model` if given."""
+    if node_model is not None and data.get("node_aliases") is not None:
+        aliases = []
+        for alias in data["node_aliases"]:
+            if alias.get("node") is not None:
+                alias = {**alias, "node": node_model.model_validate(alias["node"])}
+            aliases.append(alias)
+        data = {**data, "node_aliases": aliases}
+    return NodeAliasPagination.model_validate(data)
+
+
 class NodeAliasAPI(BaseAPI):
     def get(
         self,
@@ -16,6 +28,7 @@ class NodeAliasAPI(BaseAPI):
         limit: Union[int, None] = None,
         page: Union[int, None] = None,
         includes: Union[str, None] = None,
+        node_model: type[Node] | None = None,
     ) -> NodeAliasPagination:
         params = dict(
             name=name,
@@ -31,4 +44,34 @@ class NodeAliasAPI(BaseAPI):
         resp = self.client.get("node-aliases", params=non_empty(params))
         resp.raise_for_status()
 
-        return NodeAliasPagination(**resp.json())
+        return _parse_aliases(resp.json(), node_model)
+
+
+class AsyncNodeAliasAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        name: str,
+        slug: Union[str, None] = None,
+        threshold: Union[float, None] = None,
+        node_type: Union[str, None] = None,
+        sector: Union[str, None] = None,
+        limit: Union[int, None] = None,
+        page: Union[int, None] = None,
+        includes: Union[str, None] = None,
+        node_model: type[Node] | None = None,
+    ) -> NodeAliasPagination:
+        params = dict(
+            name=name,
+            slug=slug,
+            threshold=threshold,
+            node_type=node_type,
+            sector=sector,
+            page=page,
+            limit=limit,
+            includes=includes,
+        )
+
+        resp = await self.client.get("node-aliases", params=non_empty(params))
+        resp.raise_for_status()
+
+        return _parse_aliases(resp.json(), node_model)
@@ -1,6 +1,6 @@
 from typing import Union
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 from tz.client.api.generated_schema import Node
 
 
@@ -9,10 +9,26 @@ class NodeAPI(BaseAPI):
         self,
         slug: str,
         includes: Union[str, None] = None,
+        response_model: type[Node] | None = None,
     ) -> Node:
         params = dict(includes=includes, is_asset=False)
 
         resp = self.client.get(f"/nodes/{slug}", params=params)
         resp.raise_for_status()
 
-        return Node(**resp.json())
+        return (response_model or Node)(**resp.json())
+
+
+class AsyncNodeAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        slug: str,
+        includes: Union[str, None] = None,
+        response_model: type[Node] | None = None,
+    ) -> Node:
+        params = dict(includes=includes, is_asset=False)
+
+        resp = await self.client.get(f"/nodes/{slug}", params=params)
+        resp.raise_for_status()
+
+        return (response_model or Node)(**resp.json())
@@ -1,15 +1,16 @@
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 from tz.client.api.schemas import Publisher, PublisherQueryResponse
+from tz.client.api.utils import apaginate, paginate, parse_page
 
 
 class PublisherAPI(BaseAPI):
-    def get(self, slug: str) -> Publisher:
+    def get(self, slug: str, response_model: type[Publisher] | None = None) -> Publisher:
         resp = self.client.get(f"/publishers/{slug}")
         resp.raise_for_status()
 
-        return Publisher(**resp.json())
+        return (response_model or Publisher)(**resp.json())
 
     def search(
         self,
@@ -20,6 +21,7 @@ class PublisherAPI(BaseAPI):
         organisation_type: str | None = None,
         limit: int | None = None,
         page: int | None = None,
+        response_model: type[Publisher] | None = None,
     ) -> List[Publisher]:
         params = {
             "name": name,
@@ -31,10 +33,34 @@ class PublisherAPI(BaseAPI):
             "page": page,
         }
 
+        return self._search(params, response_model).publishers
+
+    def iter_search(
+        self,
+        name: str | None = None,
+        short_name: str | None = None,
+        url: str | None = None,
+        public: bool | None = None,
+        organisation_type: str | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> Iterator[Publisher]:
+        """Lazily iterate over every publisher matching the query, fetching pages
+        (from `page` onwards) only as they are consumed."""
+        params = {
+            "name": name,
+            "short_name": short_name,
+            "url": url,
+            "public": public,
+            "organisation_type": organisation_type,
+            "limit": limit,
+        }
+        return paginate(lambda p: self._search({**params, "page": p}), "publishers", page)
+
+    def _search(self, params: dict, response_model: type | None = None) -> PublisherQueryResponse:
         resp = self.client.get("/publishers", params=params)
         resp.raise_for_status()
-
-        return PublisherQueryResponse(**resp.json()).publishers
+        return parse_page(PublisherQueryResponse, resp.json(), "publishers", response_model)
 
     def post(
         self,
@@ -76,3 +102,88 @@ class PublisherAPI(BaseAPI):
         resp = self.client.post("/publishers", json=publisher_data)
         resp.raise_for_status()
         return resp.json()
+
+
+class AsyncPublisherAPI(AsyncBaseAPI):
+    async def get(self, slug: str, response_model: type[Publisher] | None = None) -> Publisher:
+        resp = await self.client.get(f"/publishers/{slug}")
+        resp.raise_for_status()
+
+        return (response_model or Publisher)(**resp.json())
+
+    async def search(
+        self,
+        name: str | None = None,
+        short_name: str | None = None,
+        url: str | None = None,
+        public: bool | None = None,
+        organisation_type: str | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+        response_model: type[Publisher] | None = None,
+    ) -> List[Publisher]:
+        params = {
+            "name": name,
+            "short_name": short_name,
+            "url": url,
+            "public": public,
+            "organisation_type": organisation_type,
+            "limit": limit,
+            "page": page,
+        }
+
+        return (await self._search(params, response_model)).publishers
+
+    def iter_search(
+        self,
+        name: str | None = None,
+        short_name: str | None = None,
+        url: str | None = None,
+        public: bool | None = None,
+        organisation_type: str | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> AsyncIterator[Publisher]:
+        """Asynchronously iterate over every publisher matching the query; see
+        `PublisherAPI.iter_search`."""
+        params = {
+            "name": name,
+            "short_name": short_name,
+            "url": url,
+            "public": public,
+            "organisation_type": organisation_type,
+            "limit": limit,
+        }
+        return apaginate(lambda p: self._search({**params, "page": p}), "publishers", page)
+
+    async def _search(
+        self, params: dict, response_model: type | None = None
+    ) -> PublisherQueryResponse:
+        resp = await self.client.get("/publishers", params=params)
+        resp.raise_for_status()
+        return parse_page(PublisherQueryResponse, resp.json(), "publishers", response_model)
+
+    async def post(
+        self,
+        name: str,
+        short_name: str,
+        organisation_type: str,
+        url: str | None = None,
+        public: bool | None = None,
+        slug: str | None = None,
+    ):
+        """
+        Sends a POST request to create a new publisher. See `PublisherAPI.post`.
+        """
+
+        publisher_data = {
+            "name": name,
+            "short_name": short_name,
+            "url": url,
+            "public": public,
+            "organisation_type": organisation_type,
+            "slug": slug,
+        }
+        resp = await self.client.post("/publishers", json=publisher_data)
+        resp.raise_for_status()
+        return resp.json()
@@ -0,0 +1,161 @@
+import asyncio
+import contextlib
+import json
+import os
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+RATE_LIMITS_ENV = "TZ_RATE_LIMITS"
+
+
+class Limit:
+    """
+    The limits on requests to an endpoint prefix: at most `rate` requests per
+    second (in bursts of up to `burst`) and at most `max_in_flight` at once.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, max_in_flight: int = 8):
+        self.rate = rate
+        self.burst = rate if burst is None else burst
+        self.max_in_flight = max_in_flight
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that adapts its rate to throttling: each throttled
+    request halves the rate (down to `min_rate`), and each successful request
+    recovers `recovery` of the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        min_rate: float = 0.1,
+        decrease: float = 0.5,
+        recovery: float = 0.05,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.decrease = decrease
+        self.recovery = recovery
+        self.tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = max(0.0, now - self._updated)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before it can be used."""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def throttle(self) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def recover(self) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery)
+
+
+class _Endpoint:
+    def __init__(self, limit: Limit):
+        self.limit = limit
+        self.bucket = TokenBucket(limit.rate, limit.burst)
+        self.semaphore = threading.BoundedSemaphore(limit.max_in_flight)
+        # asyncio semaphores are bound to an event loop
+        self.async_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self.async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self.async_semaphores[loop] = asyncio.Semaphore(self.limit.max_in_flight)
+        return semaphore
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter and concurrency governor.
+
+    Each request is limited by the `Limit` of the longest endpoint prefix its path
+    starts with, e.g. `/records` for `/records?node=DEU`. It waits for a token from
+    the prefix's token bucket and for one of its `max_in_flight` slots, and the
+    bucket slows down whenever the API responds with `429 Too Many Requests`, so
+    parallel workloads settle at the highest rate the API accepts.
+
+    Requests are only limited on the prefixes given limits, so the limiter is
+    opt-in: pass `limits`, or set `TZ_RATE_LIMITS` to a JSON object of prefixes to
+    limits, e.g. `{"/records": {"rate": 5, "max_in_flight": 4}}`. Sync and async
+    requests are counted separately towards `max_in_flight`.
+    """
+
+    def __init__(self, limits: dict[str, Limit] | None = None):
+        limits = limits or {}
+        self.endpoints = {
+            prefix: _Endpoint(limit)
+            for prefix, limit in sorted(limits.items(), key=lambda item: -len(item[0]))
+        }
+
+    def endpoint(self, url) -> _Endpoint | None:
+        path = httpx.URL(str(url)).path
+        for prefix, endpoint in self.endpoints.items():
+            if path.startswith(prefix):
+                return endpoint
+        return None
+
+    @contextlib.contextmanager
+    def limit(self, url) -> Iterator[None]:
+        endpoint = self.endpoint(url)
+        if endpoint is None:
+            yield
+            return
+        with endpoint.semaphore:
+            delay = endpoint.bucket.reserve()
+            if delay:
+                time.sleep(delay)
+            yield
+
+    @contextlib.asynccontextmanager
+    async def alimit(self, url) -> AsyncIterator[None]:
+        endpoint = self.endpoint(url)
+        if endpoint is None:
+            yield
+            return
+        async with endpoint.async_semaphore():
+            delay = endpoint.bucket.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+            yield
+
+    def observe(self, url, response: httpx.Response) -> None:
+        """Adapt the rate of the request's endpoint to its response. Waiting out a
+        `Retry-After` is left to the client's `RetryPolicy`."""
+        endpoint = self.endpoint(url)
+        if endpoint is None:
+            return
+        if response.status_code == 429:
+            endpoint.bucket.throttle()
+        else:
+            endpoint.bucket.recover()
+
+
+def default_rate_limiter() -> RateLimiter:
+    """A rate limiter with the limits set by `TZ_RATE_LIMITS`, if any."""
+    limits = json.loads(os.environ.get(RATE_LIMITS_ENV) or "{}")
+    return RateLimiter({prefix: Limit(**limit) for prefix, limit in limits.items()})
@@ -1,8 +1,11 @@
 import datetime
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 from tz.client.api.schemas import Record, RecordsResponse
+# fmt: off
+from tz.client.api.utils import (DEFAULT_MAX_CONCURRENCY, afetch_all,
+                                 apaginate, fetch_all, paginate)
 
 
 class RecordsAPI(BaseAPI):
@@ -42,10 +45,99 @@ class RecordsAPI(BaseAPI):
             page=page,
         )
 
+        return self._get(params).records
+
+    def iter_get(
+        self,
+        node_id: list[str] | str | None = None,
+        public: bool = True,
+        timestamp: datetime.datetime | str | None = None,
+        valid_timestamp_start: datetime.datetime | str | None = None,
+        valid_timestamp_end: datetime.datetime | str | None = None,
+        provenance_slug: list[str] | str | None = None,
+        technology: str | None = None,
+        datum_type: list[str] | str | None = None,
+        datum_detail: list[str] | str | None = None,
+        node_type: list[str] | str | None = None,
+        value: float | None = None,
+        unit: list[str] | str | None = None,
+        properties: dict | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> Iterator[Record]:
+        """Lazily iterate over every record matching the query, fetching pages
+        (from `page` onwards) only as they are consumed."""
+        params = dict(
+            node_id=node_id,
+            public=public,
+            timestamp=timestamp,
+            valid_timestamp_start=valid_timestamp_start,
+            valid_timestamp_end=valid_timestamp_end,
+            provenance_slug=provenance_slug,
+            technology=technology,
+            datum_type=datum_type,
+            datum_detail=datum_detail,
+            node_type=node_type,
+            value=value,
+            unit=unit,
+            properties=properties,
+            limit=limit,
+        )
+        return paginate(lambda p: self._get({**params, "page": p}), "records", page)
+
+    def get_all(
+        self,
+        node_id: list[str] | str | None = None,
+        public: bool = True,
+        timestamp: datetime.datetime | str | None = None,
+        valid_timestamp_start: datetime.datetime | str | None = None,
+        valid_timestamp_end: datetime.datetime | str | None = None,
+        provenance_slug: list[str] | str | None = None,
+        technology: str | None = None,
+        datum_type: list[str] | str | None = None,
+        datum_detail: list[str] | str | None = None,
+        node_type: list[str] | str | None = None,
+        value: float | None = None,
+        unit: list[str] | str | None = None,
+        properties: dict | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Record]:
+        """Fetch every record matching the query.
+
+        Once the first page reports `total_results`, the remaining pages are
+        requested concurrently (at most `max_concurrency` at a time) and
+        reassembled in order.
+        """
+        params = dict(
+            node_id=node_id,
+            public=public,
+            timestamp=timestamp,
+            valid_timestamp_start=valid_timestamp_start,
+            valid_timestamp_end=valid_timestamp_end,
+            provenance_slug=provenance_slug,
+            technology=technology,
+            datum_type=datum_type,
+            datum_detail=datum_detail,
+            node_type=node_type,
+            value=value,
+            unit=unit,
+            properties=properties,
+            limit=limit,
+        )
+        return fetch_all(
+            lambda p: self._get({**params, "page": p}),
+            "records",
+            limit=limit,
+            page=page,
+            max_concurrency=max_concurrency,
+        )
+
+    def _get(self, params: dict) -> RecordsResponse:
         resp = self.client.get("/records", params=params)
         resp.raise_for_status()
-
-        return RecordsResponse(**resp.json()).records
+        return RecordsResponse(**resp.json())
 
     def post_csv(self, csv_path: str, publisher_slug: str, source_slug: str) -> dict:
         """
@@ -94,3 +186,155 @@ class RecordsAPI(BaseAPI):
         """
 
         """
+
+
+class AsyncRecordsAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        node_id: list[str] | str | None = None,
+        public: bool = True,
+        timestamp: datetime.datetime | str | None = None,
+        valid_timestamp_start: datetime.datetime | str | None = None,
+        valid_timestamp_end: datetime.datetime | str | None = None,
+        provenance_slug: list[str] | str | None = None,
+        technology: str | None = None,
+        datum_type: list[str] | str | None = None,
+        datum_detail: list[str] | str | None = None,
+        node_type: list[str] | str | None = None,
+        value: float | None = None,
+        unit: list[str] | str | None = None,
+        properties: dict | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> List[Record]:
+        params = dict(
+            node_id=node_id,
+            public=public,
+            timestamp=timestamp,
+            valid_timestamp_start=valid_timestamp_start,
+            valid_timestamp_end=valid_timestamp_end,
+            provenance_slug=provenance_slug,
+            technology=technology,
+            datum_type=datum_type,
+            datum_detail=datum_detail,
+            node_type=node_type,
+            value=value,
+            unit=unit,
+            properties=properties,
+            limit=limit,
+            page=page,
+        )
+
+        return (await self._get(params)).records
+
+    def iter_get(
+        self,
+        node_id: list[str] | str | None = None,
+        public: bool = True,
+        timestamp: datetime.datetime | str | None = None,
+        valid_timestamp_start: datetime.datetime | str | None = None,
+        valid_timestamp_end: datetime.datetime | str | None = None,
+        provenance_slug: list[str] | str | None = None,
+        technology: str | None = None,
+        datum_type: list[str] | str | None = None,
+        datum_detail: list[str] | str | None = None,
+        node_type: list[str] | str | None = None,
+        value: float | None = None,
+        unit: list[str] | str | None = None,
+        properties: dict | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> AsyncIterator[Record]:
+        """Asynchronously iterate over every record matching the query; see
+        `RecordsAPI.iter_get`."""
+        params = dict(
+            node_id=node_id,
+            public=public,
+            timestamp=timestamp,
+            valid_timestamp_start=valid_timestamp_start,
+            valid_timestamp_end=valid_timestamp_end,
+            provenance_slug=provenance_slug,
+            technology=technology,
+            datum_type=datum_type,
+            datum_detail=datum_detail,
+            node_type=node_type,
+            value=value,
+            unit=unit,
+            properties=properties,
+            limit=limit,
+        )
+        return apaginate(lambda p: self._get({**params, "page": p}), "records", page)
+
+    async def get_all(
+        self,
+        node_id: list[str] | str | None = None,
+        public: bool = True,
+        timestamp: datetime.datetime | str | None = None,
+        valid_timestamp_start: datetime.datetime | str | None = None,
+        valid_timestamp_end: datetime.datetime | str | None = None,
+        provenance_slug: list[str] | str | None = None,
+        technology: str | None = None,
+        datum_type: list[str] | str | None = None,
+        datum_detail: list[str] | str | None = None,
+        node_type: list[str] | str | None = None,
+        value: float | None = None,
+        unit: list[str] | str | None = None,
+        properties: dict | None = None,
+        limit: int | None = None,
+        page: int | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Record]:
+        """Fetch every record matching the query; see `RecordsAPI.get_all`."""
+        params = dict(
+            node_id=node_id,
+            public=public,
+            timestamp=timestamp,
+            valid_timestamp_start=valid_timestamp_start,
+            valid_timestamp_end=valid_timestamp_end,
+            provenance_slug=provenance_slug,
+            technology=technology,
+            datum_type=datum_type,
+            datum_detail=datum_detail,
+            node_type=node_type,
+            value=value,
+            unit=unit,
+            properties=properties,
+            limit=limit,
+        )
+        return await afetch_all(
+            lambda p: self._get({**params, "page": p}),
+            "records",
+            limit=limit,
+            page=page,
+            max_concurrency=max_concurrency,
+        )
+
+    async def _get(self, params: dict) -> RecordsResponse:
+        resp = await self.client.get("/records", params=params)
+        resp.raise_for_status()
+        return RecordsResponse(**resp.json())
+
+    async def post_csv(self, csv_path: str, publisher_slug: str, source_slug: str) -> dict:
+        """
+        POST a CSV file of records to the records API. See `RecordsAPI.post_csv`
+        for the expected CSV columns.
+
+        Args:
+            csv_path (str): The path to the CSV file.
+            publisher_slug (str): The slug of the publisher.
+            source_slug (str): The slug of the data source.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+
+        provenance_slug = f"{publisher_slug}:{source_slug}"
+        with open(csv_path, "rb") as f:
+            files = {"file": (csv_path, f)}
+            resp = await self.client.post(
+                f"/records/{provenance_slug}/data",
+                files=files,
+            )
+        resp.raise_for_status()
+
+        return resp.json()
@@ -1,13 +1,15 @@
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 from tz.client.api.constants import CHART_TYPES
 # fmt: off
 from tz.client.api.generated_schema import (DeleteResponse, Run, RunCreate,
                                             RunPagination)
 from tz.client.api.schemas import ChartData
-from tz.client.api.utils import non_empty
+from tz.client.api.utils import (DEFAULT_MAX_CONCURRENCY, afetch_all,
+                                 apaginate, fetch_all, non_empty, paginate,
+                                 parse_page)
 
 
 class RunAPI(BaseAPI):
@@ -20,6 +22,7 @@ class RunAPI(BaseAPI):
         includes: str | None = None,
         start_datetime: datetime | None = None,
         end_datetime: datetime | None = None,
+        response_model: type[Run] | None = None,
     ) -> Run:
         params = {
             "includes": includes,
@@ -32,7 +35,7 @@ class RunAPI(BaseAPI):
         )
         resp.raise_for_status()
 
-        return Run(**resp.json())
+        return (response_model or Run)(**resp.json())
 
     def create(self, run: RunCreate) -> Run:
         resp = self.client.post("/runs", json=run.model_dump())
@@ -88,6 +91,7 @@ class RunAPI(BaseAPI):
         public: bool | None = None,
         limit: int = 5,
         page: int = 0,
+        response_model: type[Run] | None = None,
     ) -> List[Run]:
         params = {
             "slug": slug,
@@ -101,10 +105,238 @@ class RunAPI(BaseAPI):
             "page": page,
         }
 
+        r = self._search(params, response_model)
+        if r.runs:
+            return r.runs
+        else:
+            return []
+
+    def iter_search(
+        self,
+        slug: str | None = None,
+        model_slug: str | None = None,
+        model_scenario_slug: str | None = None,
+        owner: str | None = None,
+        featured: bool | None = None,
+        includes: str | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+    ) -> Iterator[Run]:
+        """Lazily iterate over every run matching the query, fetching pages of
+        `limit` runs (from `page` onwards) only as they are consumed."""
+        params = {
+            "slug": slug,
+            "model_slug": model_slug,
+            "model_scenario_slug": model_scenario_slug,
+            "owner": owner,
+            "featured": featured,
+            "includes": includes,
+            "public": public,
+            "limit": limit,
+        }
+        return paginate(lambda p: self._search({**params, "page": p}), "runs", page)
+
+    def search_all(
+        self,
+        slug: str | None = None,
+        model_slug: str | None = None,
+        model_scenario_slug: str | None = None,
+        owner: str | None = None,
+        featured: bool | None = None,
+        includes: str | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Run]:
+        """Fetch every run matching the query.
+
+        Once the first page reports `total_results`, the remaining pages are
+        requested concurrently (at most `max_concurrency` at a time) and
+        reassembled in order.
+        """
+        params = {
+            "slug": slug,
+            "model_slug": model_slug,
+            "model_scenario_slug": model_scenario_slug,
+            "owner": owner,
+            "featured": featured,
+            "includes": includes,
+            "public": public,
+            "limit": limit,
+        }
+        return fetch_all(
+            lambda p: self._search({**params, "page": p}),
+            "runs",
+            limit=limit,
+            page=page,
+            max_concurrency=max_concurrency,
+        )
+
+    def _search(self, params: dict, response_model: type | None = None) -> RunPagination:
         resp = self.client.get("/runs", params=non_empty(params))
         resp.raise_for_status()
-        r = RunPagination(**resp.json())
+        return parse_page(RunPagination, resp.json(), "runs", response_model)
+
+
+class AsyncRunAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        owner: str,
+        model_slug: str,
+        model_scenario_slug: str,
+        run_slug: str,
+        includes: str | None = None,
+        start_datetime: datetime | None = None,
+        end_datetime: datetime | None = None,
+        response_model: type[Run] | None = None,
+    ) -> Run:
+        params = {
+            "includes": includes,
+            "start_datetime": start_datetime,
+            "end_datetime": end_datetime,
+        }
+
+        resp = await self.client.get(
+            f"/runs/{owner}:{model_slug}:{model_scenario_slug}:{run_slug}", params=params
+        )
+        resp.raise_for_status()
+
+        return (response_model or Run)(**resp.json())
+
+    async def create(self, run: RunCreate) -> Run:
+        resp = await self.client.post("/runs", json=run.model_dump())
+        resp.raise_for_status()
+        return Run(**resp.json())
+
+    async def delete(
+        self, owner: str, model_slug: str, model_scenario_slug: str, slug: str
+    ) -> DeleteResponse:
+        resp = await self.client.delete(f"/runs/{owner}:{model_slug}:{model_scenario_slug}:{slug}")
+        resp.raise_for_status()
+        return DeleteResponse(**resp.json())
+
+    async def get_chart_data(
+        self,
+        fullslug: str,
+        attribute: str,
+        chart_type: str,
+        capacity_type: str = "gross",
+        node_or_edge: str | None = None,
+        year: int | None = None,
+    ) -> Run:
+        if chart_type not in CHART_TYPES:
+            print(f"chart_type {chart_type} invalid- must be one of {CHART_TYPES}")
+        params = {
+            "fullslug": fullslug,
+            "chart_type": chart_type,
+            "capacity_type": capacity_type,
+        }
+        if node_or_edge == "node":
+            params["node_ids"] = "*"
+        elif node_or_edge == "edge":
+            params["edge_ids"] = "*"
+        elif chart_type in ["Production", "Capacity", "Flow"]:
+            print("node_or_edge must be given as either 'node' or 'edge' for this chart type!")
+
+        if year:
+            params["year"] = str(year)
+
+        resp = await self.client.get(f"/runs/{fullslug}/chart_data", params=params)
+        resp.raise_for_status()
+        chart_data_response = ChartData(**resp.json())
+        return getattr(chart_data_response, attribute)
+
+    async def search(
+        self,
+        slug: str | None = None,
+        model_slug: str | None = None,
+        model_scenario_slug: str | None = None,
+        owner: str | None = None,
+        featured: bool | None = None,
+        includes: str | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+        response_model: type[Run] | None = None,
+    ) -> List[Run]:
+        params = {
+            "slug": slug,
+            "model_slug": model_slug,
+            "model_scenario_slug": model_scenario_slug,
+            "owner": owner,
+            "featured": featured,
+            "includes": includes,
+            "public": public,
+            "limit": limit,
+            "page": page,
+        }
+
+        r = await self._search(params, response_model)
         if r.runs:
             return r.runs
         else:
             return []
+
+    def iter_search(
+        self,
+        slug: str | None = None,
+        model_slug: str | None = None,
+        model_scenario_slug: str | None = None,
+        owner: str | None = None,
+        featured: bool | None = None,
+        includes: str | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+    ) -> AsyncIterator[Run]:
+        """Asynchronously iterate over every run matching the query; see `RunAPI.iter_search`."""
+        params = {
+            "slug": slug,
+            "model_slug": model_slug,
+            "model_scenario_slug": model_scenario_slug,
+            "owner": owner,
+            "featured": featured,
+            "includes": includes,
+            "public": public,
+            "limit": limit,
+        }
+        return apaginate(lambda p: self._search({**params, "page": p}), "runs", page)
+
+    async def search_all(
+        self,
+        slug: str | None = None,
+        model_slug: str | None = None,
+        model_scenario_slug: str | None = None,
+        owner: str | None = None,
+        featured: bool | None = None,
+        includes: str | None = None,
+        public: bool | None = None,
+        limit: int = 5,
+        page: int = 0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Run]:
+        """Fetch every run matching the query; see `RunAPI.search_all`."""
+        params = {
+            "slug": slug,
+            "model_slug": model_slug,
+            "model_scenario_slug": model_scenario_slug,
+            "owner": owner,
+            "featured": featured,
+            "includes": includes,
+            "public": public,
+            "limit": limit,
+        }
+        return await afetch_all(
+            lambda p: self._search({**params, "page": p}),
+            "runs",
+            limit=limit,
+            page=page,
+            max_concurrency=max_concurrency,
+        )
+
+    async def _search(self, params: dict, response_model: type | None = None) -> RunPagination:
+        resp = await self.client.get("/runs", params=non_empty(params))
+        resp.raise_for_status()
+        return parse_page(RunPagination, resp.json(), "runs", response_model)
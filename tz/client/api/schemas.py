@@ -1,4 +1,5 @@
 import json
+import os
 import typing
 from datetime import date, datetime
 from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
@@ -22,8 +23,11 @@ except ImportError:
 
 
 class PydanticBaseModel(BaseModel):
-    # avoid protected 'model_' namespace
-    model_config = ConfigDict(protected_namespaces=())
+    # avoid protected 'model_' namespace; build validators on first use rather
+    # than at import, since a job only touches a few of the generated models.
+    # Built validators aren't cached across processes: pydantic has no supported
+    # way to persist them, so each is built once per process.
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
 
 
 class PowerUnit(PydanticBaseModel):
@@ -90,9 +94,23 @@ class CollectionScope(PydanticBaseModel):
     includes: Optional[str] = None
 
 
+class RecordCollectionScope(PydanticBaseModel):
+    node_id: list[str] | str | None = None
+    public: bool = True
+    valid_timestamp_start: datetime | str | None = None
+    valid_timestamp_end: datetime | str | None = None
+    provenance_slug: list[str] | str | None = None
+    datum_type: list[str] | str | None = None
+    datum_detail: list[str] | str | None = None
+    node_type: list[str] | str | None = None
+    technology: str | None = None
+    limit: int | None = None
+
+
 class AssetResponse(PydanticBaseModel):
     assets: List[Node]
     next_page: Optional[int]
+    total_results: Optional[int] = None
 
 
 class NodeResponse(PydanticBaseModel):
@@ -214,6 +232,7 @@ class Record(RecordID, RecordBase):
 class RecordsResponse(PydanticBaseModel):
     records: list[Record] = Field(..., title="Records")
     next_page: int | None = Field(..., title="Next Page")
+    total_results: int | None = Field(None, title="Total Results")
 
 
 class ModelScenarioRunLink(PydanticBaseModel):
@@ -508,9 +527,24 @@ class AuthToken(BaseModel):
     scope: str
     expires_in: int
     token_type: str
+    # seconds since the epoch; token files written before this was recorded fall
+    # back to the file's modification time
+    issued_at: float | None = None
 
     @classmethod
     def from_file(cls, file_path):
         with open(file_path) as f:
             token_dict = json.load(f)
+        token_dict.setdefault("issued_at", os.path.getmtime(file_path))
         return cls(**token_dict)
+
+    def to_file(self, file_path):
+        """Atomically (over)write the token file."""
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.model_dump(), f)
+        os.replace(tmp_path, file_path)
+
+    @property
+    def expires_at(self) -> float | None:
+        return None if self.issued_at is None else self.issued_at + self.expires_in
@@ -0,0 +1,152 @@
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+OFFLINE_ENV = "TZ_OFFLINE"
+RECORD_ENV = "TZ_RECORD"
+SNAPSHOT_ENV = "TZ_SNAPSHOT"
+DEFAULT_SNAPSHOT_PATH = os.path.join(os.path.expanduser("~"), ".tz", "snapshot.json.gz")
+
+# response headers kept in a snapshot; encodings are dropped since the body is
+# stored decoded, and nothing user-specific is kept
+SNAPSHOT_HEADERS = ("content-type", "etag", "last-modified")
+
+# requests never written to a snapshot, e.g. token refreshes
+EXCLUDED_PATHS = ("/oauth/token",)
+
+
+class SnapshotMissError(Exception):
+    """Raised when replaying a snapshot that holds no response for a request."""
+
+
+def snapshot_key(request: httpx.Request) -> str:
+    """Identify a request by its method, path, sorted query and body."""
+    query = urlencode(sorted(parse_qsl(request.url.query.decode(), keep_blank_values=True)))
+    key = f"{request.method} {request.url.path}?{query}"
+    if request.content:
+        key += " " + hashlib.sha256(request.content).hexdigest()
+    return key
+
+
+class SnapshotTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An httpx transport that records responses into, or replays them from, a single
+    gzip-compressed snapshot bundle. When recording, requests are sent on via
+    `transport` (by default httpx's own).
+
+    To capture everything a workload needs, run it once with `TZ_RECORD=1`; the
+    bundle is written to `TZ_SNAPSHOT` (default `~/.tz/snapshot.json.gz`) on exit.
+    Later runs with `TZ_OFFLINE=1` are served entirely from the bundle, without
+    network access or a login, and fail with `SnapshotMissError` on any request
+    the bundle doesn't hold.
+
+    ```
+    TZ_RECORD=1 TZ_SNAPSHOT=ci.json.gz python workload.py
+    TZ_OFFLINE=1 TZ_SNAPSHOT=ci.json.gz python workload.py
+    ```
+    """
+
+    def __init__(self, path: str, mode: str = "replay", transport=None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"mode must be 'record' or 'replay', got '{mode}'")
+        self.path = path
+        self.mode = mode
+        self.responses: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        # the transport responses are recorded from, by default the network
+        self._transport = transport
+        self._async_transport = transport
+        if mode == "replay" or os.path.exists(path):
+            self.load()
+
+    def load(self) -> None:
+        with gzip.open(self.path, "rt") as f:
+            self.responses.update(json.load(f)["responses"])
+
+    def save(self) -> None:
+        """Write the recorded responses to the bundle."""
+        with self._lock:
+            bundle = {"version": 1, "responses": dict(self.responses)}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt") as f:
+            json.dump(bundle, f)
+        os.replace(tmp_path, self.path)
+
+    def _replay(self, request: httpx.Request) -> httpx.Response:
+        record = self.responses.get(snapshot_key(request))
+        if record is None:
+            raise SnapshotMissError(
+                f"No response for '{snapshot_key(request)}' in snapshot '{self.path}'."
+            )
+        return httpx.Response(
+            record["status_code"],
+            headers=record["headers"],
+            content=base64.b64decode(record["content"]),
+            request=request,
+        )
+
+    def _record(self, request: httpx.Request, response: httpx.Response) -> None:
+        if request.url.path in EXCLUDED_PATHS:
+            return
+        headers = {k: response.headers[k] for k in SNAPSHOT_HEADERS if k in response.headers}
+        record = {
+            "status_code": response.status_code,
+            "headers": headers,
+            "content": base64.b64encode(response.content).decode(),
+        }
+        with self._lock:
+            self.responses[snapshot_key(request)] = record
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == "replay":
+            return self._replay(request)
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        response = self._transport.handle_request(request)
+        response.read()
+        self._record(request, response)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == "replay":
+            return self._replay(request)
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport()
+        response = await self._async_transport.handle_async_request(request)
+        await response.aread()
+        self._record(request, response)
+        return response
+
+
+_default_transport: SnapshotTransport | None = None
+
+
+def offline() -> bool:
+    return str(os.environ.get(OFFLINE_ENV)).lower() in ("1", "true")
+
+
+def default_snapshot_transport() -> SnapshotTransport | None:
+    """The transport configured by `TZ_OFFLINE`/`TZ_RECORD`, or None. It is
+    shared by every client, so a single bundle holds all their responses."""
+    global _default_transport
+    if offline():
+        mode = "replay"
+    elif str(os.environ.get(RECORD_ENV)).lower() in ("1", "true"):
+        mode = "record"
+    else:
+        return None
+    if _default_transport is None or _default_transport.mode != mode:
+        _default_transport = SnapshotTransport(
+            os.environ.get(SNAPSHOT_ENV, DEFAULT_SNAPSHOT_PATH), mode=mode
+        )
+        if mode == "record":
+            atexit.register(_default_transport.save)
+    return _default_transport
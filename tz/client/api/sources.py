@@ -1,15 +1,21 @@
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 from tz.client.api.schemas import Source, SourceQueryResponse
+from tz.client.api.utils import apaginate, paginate, parse_page
 
 
 class SourceAPI(BaseAPI):
-    def get(self, slug: str, includes: str = "") -> Source:
+    def get(
+        self,
+        slug: str,
+        includes: str = "",
+        response_model: type[Source] | None = None,
+    ) -> Source:
         resp = self.client.get(f"/sources/{slug}", params=dict(includes=includes))
         resp.raise_for_status()
 
-        return Source(**resp.json())
+        return (response_model or Source)(**resp.json())
 
     def search(
         self,
@@ -26,6 +32,7 @@ class SourceAPI(BaseAPI):
         includes: str = "",
         limit: int | None = None,
         page: int | None = None,
+        response_model: type[Source] | None = None,
     ) -> List[Source]:
         params = {
             "public": public,
@@ -36,16 +43,53 @@ class SourceAPI(BaseAPI):
             "day": day,
             "quarter": quarter,
             "license": license,
+            "publisher_slug": publisher_slug,
             "publisher_name": publisher_name,
             "limit": limit,
             "page": page,
             "includes": includes,
         }
 
+        return self._search(params, response_model).sources
+
+    def iter_search(
+        self,
+        public: bool = True,
+        name: str | None = None,
+        short_name: str | None = None,
+        year: int | None = None,
+        month: int | None = None,
+        day: int | None = None,
+        quarter: int | None = None,
+        license: str | None = None,
+        publisher_slug: str | None = None,
+        publisher_name: str | None = None,
+        includes: str = "",
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> Iterator[Source]:
+        """Lazily iterate over every source matching the query, fetching pages
+        (from `page` onwards) only as they are consumed."""
+        params = {
+            "public": public,
+            "name": name,
+            "short_name": short_name,
+            "year": year,
+            "month": month,
+            "day": day,
+            "quarter": quarter,
+            "license": license,
+            "publisher_slug": publisher_slug,
+            "publisher_name": publisher_name,
+            "limit": limit,
+            "includes": includes,
+        }
+        return paginate(lambda p: self._search({**params, "page": p}), "sources", page)
+
+    def _search(self, params: dict, response_model: type | None = None) -> SourceQueryResponse:
         resp = self.client.get("/sources", params=params)
         resp.raise_for_status()
-
-        return SourceQueryResponse(**resp.json()).sources
+        return parse_page(SourceQueryResponse, resp.json(), "sources", response_model)
 
     def post(
         self,
@@ -113,3 +157,134 @@ class SourceAPI(BaseAPI):
         resp = self.client.post("/sources", json=source_data)
         resp.raise_for_status()
         return resp.json()
+
+
+class AsyncSourceAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        slug: str,
+        includes: str = "",
+        response_model: type[Source] | None = None,
+    ) -> Source:
+        resp = await self.client.get(f"/sources/{slug}", params=dict(includes=includes))
+        resp.raise_for_status()
+
+        return (response_model or Source)(**resp.json())
+
+    async def search(
+        self,
+        public: bool = True,
+        name: str | None = None,
+        short_name: str | None = None,
+        year: int | None = None,
+        month: int | None = None,
+        day: int | None = None,
+        quarter: int | None = None,
+        license: str | None = None,
+        publisher_slug: str | None = None,
+        publisher_name: str | None = None,
+        includes: str = "",
+        limit: int | None = None,
+        page: int | None = None,
+        response_model: type[Source] | None = None,
+    ) -> List[Source]:
+        params = {
+            "public": public,
+            "name": name,
+            "short_name": short_name,
+            "year": year,
+            "month": month,
+            "day": day,
+            "quarter": quarter,
+            "license": license,
+            "publisher_slug": publisher_slug,
+            "publisher_name": publisher_name,
+            "limit": limit,
+            "page": page,
+            "includes": includes,
+        }
+
+        return (await self._search(params, response_model)).sources
+
+    def iter_search(
+        self,
+        public: bool = True,
+        name: str | None = None,
+        short_name: str | None = None,
+        year: int | None = None,
+        month: int | None = None,
+        day: int | None = None,
+        quarter: int | None = None,
+        license: str | None = None,
+        publisher_slug: str | None = None,
+        publisher_name: str | None = None,
+        includes: str = "",
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> AsyncIterator[Source]:
+        """Asynchronously iterate over every source matching the query; see
+        `SourceAPI.iter_search`."""
+        params = {
+            "public": public,
+            "name": name,
+            "short_name": short_name,
+            "year": year,
+            "month": month,
+            "day": day,
+            "quarter": quarter,
+            "license": license,
+            "publisher_slug": publisher_slug,
+            "publisher_name": publisher_name,
+            "limit": limit,
+            "includes": includes,
+        }
+        return apaginate(lambda p: self._search({**params, "page": p}), "sources", page)
+
+    async def _search(
+        self, params: dict, response_model: type | None = None
+    ) -> SourceQueryResponse:
+        resp = await self.client.get("/sources", params=params)
+        resp.raise_for_status()
+        return parse_page(SourceQueryResponse, resp.json(), "sources", response_model)
+
+    async def post(
+        self,
+        name: str,
+        short_name: str,
+        public: bool,
+        description: str,
+        year: int | None = None,
+        month: int | None = None,
+        day: int | None = None,
+        quarter: int | None = None,
+        license_abbrv: str | None = None,
+        publisher_slug: str | None = None,
+        slug: str | None = None,
+        links: list | None = None,
+        nodes: list | None = None,
+        license: str | None = None,
+    ):
+        """
+        POST a new source to the API. See `SourceAPI.post`.
+        """
+
+        source_data = {
+            "name": name,
+            "short_name": short_name,
+            "public": public,
+            "description": description,
+            "year": year,
+            "month": month,
+            "day": day,
+            "quarter": quarter,
+            "license_abbrv": license_abbrv,
+            "publisher_slug": publisher_slug,
+            "slug": slug,
+            "links": links,
+            "nodes": nodes,
+            "license": license,
+        }
+
+        resp = await self.client.post("/sources", json=source_data)
+        resp.raise_for_status()
+        return resp.json()
@@ -1,8 +1,8 @@
-from typing import List, Union
+from typing import AsyncIterator, Iterator, List, Union
 
-from tz.client.api.base import BaseAPI
+from tz.client.api.base import AsyncBaseAPI, BaseAPI
 from tz.client.api.generated_schema import Technology, TechnologyPagination
-from tz.client.api.utils import non_empty
+from tz.client.api.utils import apaginate, non_empty, paginate, parse_page
 
 
 class TechnologyAPI(BaseAPI):
@@ -10,12 +10,13 @@ class TechnologyAPI(BaseAPI):
         self,
         slug: str,
         includes: Union[str, None] = None,
+        response_model: type[Technology] | None = None,
     ) -> Technology:
         params = dict(includes=includes, is_asset=False)
         resp = self.client.get(f"/technologies/{slug}", params=params)
         resp.raise_for_status()
 
-        return Technology(**resp.json())
+        return (response_model or Technology)(**resp.json())
 
     def search(
         self,
@@ -25,6 +26,7 @@ class TechnologyAPI(BaseAPI):
         owner_id: str | None = None,
         limit: int = 10,
         page: int = 0,
+        response_model: type[Technology] | None = None,
     ) -> List[Technology]:
         params = {
             "uuid": uuid,
@@ -35,14 +37,37 @@ class TechnologyAPI(BaseAPI):
             "page": page,
         }
 
-        resp = self.client.get("/technologies", params=non_empty(params))
-        resp.raise_for_status()
-        r = TechnologyPagination(**resp.json())
+        r = self._search(params, response_model)
         if r.technologies:
             return r.technologies
         else:
             return []
 
+    def iter_search(
+        self,
+        uuid: str | None = None,
+        slug: str | None = None,
+        name: str | None = None,
+        owner_id: str | None = None,
+        limit: int = 10,
+        page: int = 0,
+    ) -> Iterator[Technology]:
+        """Lazily iterate over every technology matching the query, fetching pages
+        of `limit` technologies (from `page` onwards) only as they are consumed."""
+        params = {
+            "uuid": uuid,
+            "slug": slug,
+            "name": name,
+            "owner_id": owner_id,
+            "limit": limit,
+        }
+        return paginate(lambda p: self._search({**params, "page": p}), "technologies", page)
+
+    def _search(self, params: dict, response_model: type | None = None) -> TechnologyPagination:
+        resp = self.client.get("/technologies", params=non_empty(params))
+        resp.raise_for_status()
+        return parse_page(TechnologyPagination, resp.json(), "technologies", response_model)
+
     def post(
         self,
         name: str,
@@ -99,3 +124,102 @@ class TechnologyAPI(BaseAPI):
         resp = self.client.delete("/technologies", json={"slug": slug})
         resp.raise_for_status()
         return resp.json()
+
+
+class AsyncTechnologyAPI(AsyncBaseAPI):
+    async def get(
+        self,
+        slug: str,
+        includes: Union[str, None] = None,
+        response_model: type[Technology] | None = None,
+    ) -> Technology:
+        params = dict(includes=includes, is_asset=False)
+        resp = await self.client.get(f"/technologies/{slug}", params=params)
+        resp.raise_for_status()
+
+        return (response_model or Technology)(**resp.json())
+
+    async def search(
+        self,
+        uuid: str | None = None,
+        slug: str | None = None,
+        name: str | None = None,
+        owner_id: str | None = None,
+        limit: int = 10,
+        page: int = 0,
+        response_model: type[Technology] | None = None,
+    ) -> List[Technology]:
+        params = {
+            "uuid": uuid,
+            "slug": slug,
+            "name": name,
+            "owner_id": owner_id,
+            "limit": limit,
+            "page": page,
+        }
+
+        r = await self._search(params, response_model)
+        if r.technologies:
+            return r.technologies
+        else:
+            return []
+
+    def iter_search(
+        self,
+        uuid: str | None = None,
+        slug: str | None = None,
+        name: str | None = None,
+        owner_id: str | None = None,
+        limit: int = 10,
+        page: int = 0,
+    ) -> AsyncIterator[Technology]:
+        """Asynchronously iterate over every technology matching the query; see
+        `TechnologyAPI.iter_search`."""
+        params = {
+            "uuid": uuid,
+            "slug": slug,
+            "name": name,
+            "owner_id": owner_id,
+            "limit": limit,
+        }
+        return apaginate(lambda p: self._search({**params, "page": p}), "technologies", page)
+
+    async def _search(
+        self, params: dict, response_model: type | None = None
+    ) -> TechnologyPagination:
+        resp = await self.client.get("/technologies", params=non_empty(params))
+        resp.raise_for_status()
+        return parse_page(TechnologyPagination, resp.json(), "technologies", response_model)
+
+    async def post(
+        self,
+        name: str,
+        slug: str,
+        public: bool,
+        properties: dict | None = None,
+        parents: list[str] | None = None,
+        children: list[str] | None = None,
+    ):
+        """
+        POST a new technology to the API. See `TechnologyAPI.post`.
+        """
+
+        technology_data = {
+            "name": name,
+            "slug": slug,
+            "public": public,
+            "properties": properties,
+            "parents": parents,
+            "children": children,
+        }
+        resp = await self.client.post("/technologies", json=technology_data)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def delete(self, slug: str):
+        """
+        DELETE a technology via the API. See `TechnologyAPI.delete`.
+        """
+        resp = await self.client.delete("/technologies", json={"slug": slug})
+        resp.raise_for_status()
+        return resp.json()
@@ -1,2 +1,139 @@
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, TypeVar
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
 def non_empty(params):
     return {k: v for k, v in params.items() if v is not None}
+
+
+def parse_page(page_model: type[T], data: dict, field: str, response_model: type | None) -> T:
+    """Validate a pagination response, validating the items under `field` as
+    `response_model` (e.g. one of the high-level `tz.client` classes) if given.
+
+    Each item is only validated once, directly into `response_model`. The items
+    are set on the page after it is validated, so `response_model` needn't
+    subclass the item type the page declares (e.g. `Asset` for `Node`).
+    """
+    if response_model is None or data.get(field) is None:
+        return page_model.model_validate(data)
+    items = [response_model.model_validate(item) for item in data[field]]
+    page = page_model.model_validate({**data, field: []})
+    setattr(page, field, items)
+    return page
+
+
+def paginate(fetch_page: Callable, field: str, page: int | None = 0) -> Iterator:
+    """Lazily yield the items of a paginated query, following `next_page`.
+
+    Args:
+        fetch_page: A callable taking a page number and returning a pagination
+          response with a `next_page` attribute.
+        field: The attribute of the pagination response holding the items.
+        page: The page to start from.
+    """
+    page = page or 0
+    while page is not None:
+        response = fetch_page(page)
+        items = getattr(response, field) or []
+        yield from items
+        if not items:
+            return
+        page = response.next_page
+
+
+async def apaginate(
+    fetch_page: Callable[[int], Awaitable], field: str, page: int | None = 0
+) -> AsyncIterator:
+    """The asyncio counterpart of `paginate`; `fetch_page` returns an awaitable."""
+    page = page or 0
+    while page is not None:
+        response = await fetch_page(page)
+        items = getattr(response, field) or []
+        for item in items:
+            yield item
+        if not items:
+            return
+        page = response.next_page
+
+
+def _remaining_pages(first_page, page: int, n_items: int, limit: int | None) -> range | None:
+    """The page numbers left after `page`, computed from `total_results` and the
+    size of the first page, or None if the response doesn't say how many results
+    there are or the page size is uncertain (the server returned fewer than
+    `limit` items, e.g. because it caps the page size)."""
+    total_results = getattr(first_page, "total_results", None)
+    if total_results is None or not n_items or (limit is not None and n_items < limit):
+        return None
+    return range(page + 1, math.ceil(total_results / n_items))
+
+
+def fetch_all(
+    fetch_page: Callable,
+    field: str,
+    limit: int | None = None,
+    page: int | None = 0,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list:
+    """Fetch every item of a paginated query.
+
+    The first page is fetched on its own; if it reports `total_results`, the
+    remaining pages are requested concurrently (at most `max_concurrency` at a
+    time) and reassembled in page order. Otherwise falls back to following
+    `next_page` sequentially.
+
+    Args:
+        fetch_page: A callable taking a page number and returning a pagination response.
+        field: The attribute of the pagination response holding the items.
+        limit: The page size the query was made with, if any.
+        page: The page to start from.
+        max_concurrency: The maximum number of pages requested at once.
+    """
+    page = page or 0
+    first_page = fetch_page(page)
+    items = list(getattr(first_page, field) or [])
+    if first_page.next_page is None or not items:
+        return items
+
+    remaining = _remaining_pages(first_page, page, len(items), limit)
+    if remaining is None:
+        return items + list(paginate(fetch_page, field, first_page.next_page))
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        for response in pool.map(fetch_page, remaining):
+            items.extend(getattr(response, field) or [])
+    return items
+
+
+async def afetch_all(
+    fetch_page: Callable[[int], Awaitable],
+    field: str,
+    limit: int | None = None,
+    page: int | None = 0,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list:
+    """The asyncio counterpart of `fetch_all`; `fetch_page` returns an awaitable."""
+    page = page or 0
+    first_page = await fetch_page(page)
+    items = list(getattr(first_page, field) or [])
+    if first_page.next_page is None or not items:
+        return items
+
+    remaining = _remaining_pages(first_page, page, len(items), limit)
+    if remaining is None:
+        return items + [item async for item in apaginate(fetch_page, field, first_page.next_page)]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_fetch(p):
+        async with semaphore:
+            return await fetch_page(p)
+
+    for response in await asyncio.gather(*[bounded_fetch(p) for p in remaining]):
+        items.extend(getattr(response, field) or [])
+    return items
@@ -13,8 +13,7 @@ class Asset(schemas.NodeBase):
     @classmethod
     def from_id(cls, id: str):
         """Initialise Asset from `id` as a positional argument"""
-        node = api.assets.get(ids=id)[0]
-        return cls(**node.model_dump())
+        return api.assets.get(ids=id, response_model=cls)[0]
 
     # Note: v2-migration - This needs to be revised; but I don't want to try
     # and get the types right just now, so commenting it out.
@@ -78,10 +77,12 @@ class AssetCollection(pd.DataFrame):
     Args:
         _scope (schemas.AssetcollectionScope | None): params for generating api query for pagination
         _page (int | None): if generated from an API query, the current page of the query.
+        _pending (list[dict] | None): rows of fetched pages not yet added to the frame.
     """
 
     _scope: schemas.CollectionScope | None = None
     _page: int | None = None
+    _pending: list[dict] | None = None
 
     @property
     def _constructor(self):
@@ -118,22 +119,48 @@ class AssetCollection(pd.DataFrame):
         # pd.DataFrame.from_records
         return cls.from_records([asset.unpack() for asset in assets])
 
-    def next_page(self):
+    def next_page(self, materialise: bool = True):
         """Paginate through assets. The Asset collection must have a `_scope`.
 
-        Returns the next page of assets and concatenates them in-place to the current collection.
+        Fetches the next page of assets and buffers its rows. With `materialise=True`
+        (the default) the buffer is concatenated in-place to the current collection
+        straight away; pass `materialise=False` when fetching many pages and call
+        `materialise()` once at the end, so the frame is only copied once.
+
+        Returns:
+            int: The number of assets on the fetched page.
         """
         if not self._scope:
             raise ValueError("Cant iterate an unscoped AssetCollection")
         if self._scope.parent_node_id is None:
             raise ValueError("Cant iterate an AssetCollection without a parent id")
-        new_collection = self.__class__.from_assets(
-            api.assets.get(parent_node_id=self._scope.parent_node_id, page=self._page + 1)
+        assets = api.assets.get(
+            parent_node_id=self._scope.parent_node_id,
+            sector=self._scope.sector,
+            page=self._page + 1,
         )
         self._page += 1
 
-        self.__dict__.update(pd.concat([self, new_collection], ignore_index=True).__dict__)
-        return len(new_collection)
+        if self._pending is None:
+            self._pending = []
+        self._pending.extend(asset.unpack() for asset in assets)
+        if materialise:
+            self.materialise()
+        return len(assets)
+
+    def materialise(self):
+        """Concatenate any buffered pages in-place to the current collection."""
+        if self._pending:
+            new_collection = self.__class__.from_records(self._pending)
+            self.__dict__.update(pd.concat([self, new_collection], ignore_index=True).__dict__)
+        self._pending = []
+        return self
+
+    def load_all(self):
+        """Fetch every remaining page of assets and add them to the collection in one go."""
+        while self.next_page(materialise=False):
+            pass
+        return self.materialise()
 
     def to_assets(self):
         """Instantiate a list of Assets from an AssetCollection.
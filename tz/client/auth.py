@@ -4,7 +4,10 @@ import time
 
 import requests
 
-from tz.client.core import logger
+from tz.client.core import load_env, logger
+
+# the settings below may come from a .env file
+load_env()
 
 AUTH0_CLIENT_ID = os.environ.get("AUTH0_CLIENT_ID", "HhT6aGS8u3Pg4PkVQ8sKUtnrtg0x7nUk")
 AUTH0_DOMAIN = os.environ.get("AUTH0_DOMAIN", "prod-feo-tz.eu.auth0.com")
@@ -78,5 +81,6 @@ def login(config=None):
     # display a friendly welcome... print ('Hello {name}!')
 
     # write token data to file
+    token_data["issued_at"] = time.time()
     with open(TOKEN_PATH, "w") as tf:
         json.dump(token_data, tf)
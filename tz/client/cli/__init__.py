@@ -1,10 +1,9 @@
-from dotenv import load_dotenv
+from tz.client.cli import auth, cache, cli
+from tz.client.core import load_env
 
-from tz.client.cli import auth, cli
-
-__all__ = ["auth", "cli"]
+__all__ = ["auth", "cache", "cli"]
 
 
 def main():
-    load_dotenv()
+    load_env()
     cli.root()
@@ -0,0 +1,45 @@
+import click
+
+from tz.client.api.disk_cache import DiskCache, cache_path
+from tz.client.cli.cli import root
+
+
+@root.group()
+@click.pass_obj
+def cache(config):
+    """On-disk response cache operations"""
+
+
+@cache.command()
+@click.pass_obj
+def info(config):
+    """Show the location, size and entries of the cache"""
+    disk_cache = DiskCache()
+    click.echo(f"path: {cache_path()}")
+    click.echo(f"size: {disk_cache.size()} bytes")
+    for namespace, stats in disk_cache.info().items():
+        click.echo(
+            f"{namespace}: {stats['entries']} entries, {stats['bytes']} bytes,"
+            f" {stats['expired']} expired"
+        )
+
+
+@cache.command()
+@click.option("--max-bytes", type=int, default=None, help="Also evict down to this size.")
+@click.pass_obj
+def prune(config, max_bytes):
+    """Delete expired entries, and least recently used ones above --max-bytes"""
+    disk_cache = DiskCache()
+    deleted = disk_cache.prune()
+    if max_bytes is not None:
+        deleted += disk_cache.cap(max_bytes)
+    click.echo(f"deleted {deleted} entries")
+
+
+@cache.command()
+@click.pass_obj
+def clear(config):
+    """Delete every entry"""
+    disk_cache = DiskCache()
+    deleted = disk_cache.cap(0)
+    click.echo(f"deleted {deleted} entries")
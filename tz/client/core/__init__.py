@@ -1,3 +1,5 @@
+from tz.client.core.cache import TTLCache
+from tz.client.core.env import load_env
 from tz.client.core.logging import logger
 
-__all__ = ["logger"]
+__all__ = ["TTLCache", "load_env", "logger"]
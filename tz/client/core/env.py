@@ -0,0 +1,20 @@
+import threading
+
+_lock = threading.Lock()
+_loaded = False
+
+
+def load_env() -> None:
+    """Load environment variables from a .env file, once per process.
+
+    This is done on first use of the client rather than on import, so that
+    importing `tz.client` has no side effects.
+    """
+    global _loaded
+    with _lock:
+        if _loaded:
+            return
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _loaded = True
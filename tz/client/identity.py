@@ -0,0 +1,109 @@
+import os
+
+from tz.client.core import TTLCache
+
+IDENTITY_MAP_ENV = "TZ_IDENTITY_MAP"
+IDENTITY_MAP_TTL_ENV = "TZ_IDENTITY_MAP_TTL"
+IDENTITY_MAP_SIZE_ENV = "TZ_IDENTITY_MAP_SIZE"
+IDENTITY_FIELDS = ("uuid", "fullslug", "slug")
+
+
+class IdentityMap:
+    """
+    A map from identifiers to the objects already loaded for them, held by a
+    `Client` as its `identity_map`.
+
+    Each object is registered under its `uuid`, `fullslug` and `slug`, so the
+    same entity loaded twice (e.g. with `Node.from_slug`, or as the child of two
+    different nodes) is the same instance, with its relationships cached once.
+    Entries expire after `ttl` seconds and at most `maxsize` are kept; use
+    `invalidate` or `clear` to drop entries that are known to be stale.
+
+    The map is opt-in: pass `identity_map=IdentityMap()` to a `Client`, or set
+    `TZ_IDENTITY_MAP=1` for the default client used by `Node`, `Technology` etc.
+    (`TZ_IDENTITY_MAP_TTL` and `TZ_IDENTITY_MAP_SIZE` configure it).
+
+    Objects loaded as part of another response (e.g. the `children` of a node)
+    are registered as partial; a later full load (e.g. `from_slug`) updates that
+    same instance in place.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, cls, key, partial: bool = False):
+        """The `cls` instance registered under `key`, or None. Partially loaded
+        instances are only returned if `partial` is set."""
+        entry = self._cache.get((cls, str(key)))
+        if entry is None or (not partial and not entry[1]):
+            return None
+        return entry[0]
+
+    def add(self, obj, complete: bool = True):
+        """Register `obj`, returning the instance to use for it: an instance already
+        registered for the same entity is kept (and updated from `obj` if that one
+        was only partially loaded)."""
+        keys = [(type(obj), str(obj.__dict__[f])) for f in IDENTITY_FIELDS if obj.__dict__.get(f)]
+        for key in keys:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] is not obj:
+                existing, existing_complete = entry
+                if complete and not existing_complete:
+                    existing.__dict__.update(obj.__dict__)
+                    existing.__pydantic_fields_set__.update(obj.model_fields_set)
+                obj, complete = existing, complete or existing_complete
+                break
+        for key in keys:
+            self._cache.set(key, (obj, complete))
+        return obj
+
+    def load(self, cls, key, fetch):
+        """Return the `cls` instance for `key`, calling `fetch()` only on a miss."""
+        obj = self.get(cls, key)
+        if obj is None:
+            obj = self.add(fetch())
+        return obj
+
+    def invalidate(self, cls, key) -> None:
+        """Drop the `cls` instance registered under `key`, under all its identifiers."""
+        entry = self._cache.get((cls, str(key)))
+        if entry is None:
+            return
+        for cache_key in self._cache.keys():
+            other = self._cache.get(cache_key)
+            if other is not None and other[0] is entry[0]:
+                self._cache.pop(cache_key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+def default_identity_map() -> IdentityMap | None:
+    """The identity map configured by `TZ_IDENTITY_MAP`, or None if it isn't enabled."""
+    if str(os.environ.get(IDENTITY_MAP_ENV)).lower() not in ("1", "true"):
+        return None
+    return IdentityMap(
+        maxsize=int(os.environ.get(IDENTITY_MAP_SIZE_ENV, 10_000)),
+        ttl=float(os.environ.get(IDENTITY_MAP_TTL_ENV, 300)),
+    )
+
+
+def session_identity_map() -> IdentityMap | None:
+    """The identity map of the default client, which `Node`, `Technology` etc. load through."""
+    from tz.client.api.client import client
+
+    return client.identity_map
+
+
+def load(cls, key, fetch):
+    """Return the `cls` instance for `key` from the default client's identity map,
+    calling `fetch()` on a miss or if the client has no identity map."""
+    identity_map = session_identity_map()
+    return fetch() if identity_map is None else identity_map.load(cls, key, fetch)
+
+
+def add(obj, complete: bool = True):
+    """Register `obj` with the default client's identity map, if it has one; see
+    `IdentityMap.add`."""
+    identity_map = session_identity_map()
+    return obj if identity_map is None else identity_map.add(obj, complete=complete)
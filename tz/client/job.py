@@ -2,9 +2,10 @@ from uuid import UUID
 
 from tz.client import api
 from tz.client.api import generated_schema
+from tz.client.utils import GeneratedModelMixin
 
 
-class Job(generated_schema.Job):
+class Job(GeneratedModelMixin, generated_schema.Job):
     @classmethod
     def create(cls, job: generated_schema.JobCreate) -> "Job":
         result = api.jobs.create(job)
@@ -4,11 +4,11 @@ from tz.client import api
 from tz.client.api import generated_schema
 from tz.client.model_scenario import ModelScenario
 # fmt: off
-from tz.client.utils import (lazy_load_relationship,
+from tz.client.utils import (GeneratedModelMixin, lazy_load_relationship,
                              lazy_load_single_relationship)
 
 
-class Model(generated_schema.Model):
+class Model(GeneratedModelMixin, generated_schema.Model):
     _model_scenarios: list[ModelScenario] | None = None
     _featured_scenario: Optional[ModelScenario] | None = None
 
@@ -41,8 +41,7 @@ class Model(generated_schema.Model):
         Returns:
             Model: A Model object.
         """
-        model = api.models.get(owner=owner, model_slug=model_slug)
-        return cls(**model.model_dump())
+        return api.models.get(owner=owner, model_slug=model_slug, response_model=cls)
 
     @classmethod
     def delete(cls, owner: str, slug: str) -> generated_schema.DeleteResponse:
@@ -83,7 +82,7 @@ class Model(generated_schema.Model):
             List[Model]: A list of Model objects.
         """
 
-        search_results = api.models.search(
+        return api.models.search(
             slug=slug,
             includes=includes,
             owner=owner,
@@ -92,10 +91,9 @@ class Model(generated_schema.Model):
             public=public,
             limit=limit,
             page=page,
+            response_model=cls,
         )
 
-        return [cls(**model.model_dump()) for model in search_results]
-
     def __str__(self) -> str:
         return f"Model: {self.name} (fullslug={self.fullslug})"
 
@@ -3,11 +3,11 @@ from typing import List, Optional
 from tz.client import api
 from tz.client.api import generated_schema
 # fmt: off
-from tz.client.utils import (lazy_load_relationship,
+from tz.client.utils import (GeneratedModelMixin, lazy_load_relationship,
                              lazy_load_single_relationship)
 
 
-class ModelScenario(generated_schema.ModelScenario):
+class ModelScenario(GeneratedModelMixin, generated_schema.ModelScenario):
     # Lazy-loaded
     _model: Optional["Model"] = None  # type: ignore[name-defined] # noqa: F821
     _featured_run: Optional["Run"] = None  # type: ignore[name-defined] # noqa: F821
@@ -44,11 +44,12 @@ class ModelScenario(generated_schema.ModelScenario):
         Returns:
             ModelScenario: A ModelScenario object.
         """
-        scenario = api.model_scenarios.get(
-            owner=owner, model_slug=model_slug, model_scenario_slug=model_scenario_slug
+        return api.model_scenarios.get(
+            owner=owner,
+            model_slug=model_slug,
+            model_scenario_slug=model_scenario_slug,
+            response_model=cls,
         )
-        c = cls(**scenario.model_dump())
-        return c
 
     @classmethod
     def delete(cls, owner: str, model_slug: str, slug: str) -> generated_schema.DeleteResponse:
@@ -89,7 +90,7 @@ class ModelScenario(generated_schema.ModelScenario):
             List[ModelScenario]: A list of Scenario objects matching the search criteria.
         """
 
-        search_results = api.model_scenarios.search(
+        return api.model_scenarios.search(
             model_scenario_slug=model_scenario_slug,
             model_slug=model_slug,
             includes=includes,
@@ -98,10 +99,9 @@ class ModelScenario(generated_schema.ModelScenario):
             public=public,
             limit=limit,
             page=page,
+            response_model=cls,
         )
 
-        return [cls(**scenario.model_dump()) for scenario in search_results]
-
     # @property
     # def runs(self) -> list["Run"]:
     #     """The featured run associated with this scenario."""
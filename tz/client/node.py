@@ -1,11 +1,12 @@
 from typing import Optional
 
-from tz.client import api
+from tz.client import api, identity
 from tz.client.api import generated_schema
-from tz.client.utils import lazy_load_relationship
+from tz.client.api.utils import DEFAULT_MAX_CONCURRENCY
+from tz.client.utils import GeneratedModelMixin, lazy_load_relationship, walk
 
 
-class Node(generated_schema.Node):
+class Node(GeneratedModelMixin, generated_schema.Node):
 
     """
     <!--
@@ -33,9 +34,11 @@ class Node(generated_schema.Node):
     @classmethod
     def from_slug(cls, slug: str) -> "Node":
         """Initialise Node from `slug` as a positional argument"""
-        api_node = api.nodes.get(slug=slug, includes="primary_alias")
-        node = cls(**api_node.model_dump())
-        return node
+        return identity.load(
+            cls,
+            slug,
+            lambda: api.nodes.get(slug=slug, includes="primary_alias", response_model=cls),
+        )
 
     @classmethod
     def search(
@@ -71,12 +74,38 @@ class Node(generated_schema.Node):
             includes="node,node.primary_alias",
             limit=limit,
             page=page,
+            node_model=cls,
         )
 
-        return [
-            cls(**alias.node.model_dump())  # type: ignore[union-attr]
-            for alias in search_results.node_aliases  # type: ignore[union-attr]
-        ]
+        return [alias.node for alias in search_results.node_aliases]  # type: ignore[union-attr]
+
+    def walk(
+        self,
+        depth: int = 1,
+        direction: str = "children",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict[str, list[str]]:
+        """
+        Explore the node graph breadth-first from this node, up to `depth` levels.
+        The requests for each level are made concurrently, so the time taken grows
+        with `depth` rather than with the number of nodes.
+
+        ```python
+        tree = Node.from_slug("EUR").walk(depth=2)  # {"EUR": ["DEU", ...], "DEU": [...]}
+        ```
+
+        Args:
+            depth (int): The number of levels to explore.
+            direction (str): Either `children` or `parents`.
+            max_concurrency (int): The maximum number of requests in flight.
+
+        Returns:
+            dict[str, list[str]]: A map from the slug of each visited node to
+                the slugs of its children (or parents).
+        """
+        if direction not in ("children", "parents"):
+            raise ValueError(f"direction must be 'children' or 'parents', got '{direction}'")
+        return walk(self, direction, depth, max_concurrency=max_concurrency)
 
     # @property
     # def assets(self) -> AssetCollection:
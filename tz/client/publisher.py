@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, ForwardRef, List, Optional
 
-from tz.client import api, factory
+from tz.client import api, factory, identity
 from tz.client.api import schemas
 
 if TYPE_CHECKING:
@@ -25,8 +25,7 @@ class Publisher(schemas.Publisher):
         source = Source.from_id("<publisher_id>:<source_id>")
         ```
         """
-        publisher = api.publishers.get(slug=id)
-        return cls(**publisher.model_dump())
+        return identity.load(cls, id, lambda: api.publishers.get(slug=id, response_model=cls))
 
     @classmethod
     def search(cls, name: str | None) -> list["Publisher"]:
@@ -40,11 +39,7 @@ class Publisher(schemas.Publisher):
             List[Publisher]: A list of Publisher objects.
         """
 
-        search_results = api.publishers.search(
-            name=name,
-        )
-
-        return [cls(**publisher.model_dump()) for publisher in search_results]
+        return api.publishers.search(name=name, response_model=cls)
 
     @classmethod
     def _get_sources(cls, publisher_slug: str):
@@ -18,12 +18,15 @@ class RecordCollection(pd.DataFrame):
     but has a few extra useful constructors.
 
     Args:
-        _scope (schemas.CollectionScope | None): params for generating api query for pagination
+        _scope (schemas.RecordCollectionScope | None): the query the collection was generated
+            from, replayed for every subsequent page.
         _page (int | None): if generated from an API query, the current page of the query.
+        _pending (list[dict] | None): rows of fetched pages not yet added to the frame.
     """
 
-    _scope: Optional[schemas.CollectionScope] = None
+    _scope: Optional[schemas.RecordCollectionScope] = None
     _page: Optional[int] = None
+    _pending: Optional[list[dict]] = None
 
     @property
     def _constructor(self):
@@ -65,7 +68,7 @@ class RecordCollection(pd.DataFrame):
         Returns:
             RecordCollection: A pandas-dataframe extension for TZ records.
         """
-        records = api.records.get(
+        scope = schemas.RecordCollectionScope(
             node_id=node_id,
             public=public,
             valid_timestamp_start=valid_timestamp_start,
@@ -76,12 +79,12 @@ class RecordCollection(pd.DataFrame):
             node_type=node_type,
             technology=technology,
             limit=limit,
-            page=page,
         )
+        records = api.records.get(**scope.model_dump(), page=page)
 
         obj = cls.from_tz_records(records)  # type: ignore[arg-type]
-        obj._scope = schemas.CollectionScope(node_id=node_id)
-        obj._page = 0
+        obj._scope = scope
+        obj._page = page or 0
         return obj
 
     @classmethod
@@ -90,20 +93,42 @@ class RecordCollection(pd.DataFrame):
         # pd.DataFrame.from_records
         return cls.from_records([record.model_dump() for record in records])
 
-    def next_page(self):
+    def next_page(self, materialise: bool = True):
         """Paginate through records. The Record collection must have a `_scope`.
 
-        Returns the next page of records and concatenates them in-place to the current collection.
+        Fetches the next page of records and buffers its rows. With `materialise=True`
+        (the default) the buffer is concatenated in-place to the current collection
+        straight away; pass `materialise=False` when fetching many pages and call
+        `materialise()` once at the end, so the frame is only copied once.
+
+        Returns:
+            int: The number of records on the fetched page.
         """
         if not self._scope:
             raise ValueError("Cant iterate an unscoped RecordCollection")
-        new_collection = self.__class__.from_tz_records(
-            api.records.get(node_id=self._scope.node_id, page=self._page + 1)
-        )
+        records = api.records.get(**self._scope.model_dump(), page=self._page + 1)
         self._page += 1
 
-        self.__dict__.update(pd.concat([self, new_collection], ignore_index=True).__dict__)
-        return len(new_collection)
+        if self._pending is None:
+            self._pending = []
+        self._pending.extend(record.model_dump() for record in records)
+        if materialise:
+            self.materialise()
+        return len(records)
+
+    def materialise(self):
+        """Concatenate any buffered pages in-place to the current collection."""
+        if self._pending:
+            new_collection = self.__class__.from_records(self._pending)
+            self.__dict__.update(pd.concat([self, new_collection], ignore_index=True).__dict__)
+        self._pending = []
+        return self
+
+    def load_all(self):
+        """Fetch every remaining page of records and add them to the collection in one go."""
+        while self.next_page(materialise=False):
+            pass
+        return self.materialise()
 
     def to_tz_records(self):
         """Instantiate a list of Records from an RecordCollection."""
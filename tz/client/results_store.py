@@ -0,0 +1,149 @@
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+from warnings import warn
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_SUPPORT = True
+except ImportError:
+    PARQUET_SUPPORT = False
+
+RESULTS_STORE_ENV = "TZ_RESULTS_STORE"
+RESULTS_STORE_MAX_BYTES_ENV = "TZ_RESULTS_STORE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+class ResultsStore:
+    """
+    A local on-disk store of run results tables.
+
+    Run outputs don't change once a run has completed, so each table is saved
+    as a Parquet file keyed on the run's fullslug, chart type, capacity type and
+    year, and read back memory-mapped by later processes instead of being
+    downloaded and parsed again. Once the store grows past `max_bytes` the least
+    recently used files are evicted.
+
+    The store is opt-in; set `TZ_RESULTS_STORE` to a directory to enable it for
+    `RunResults`, and optionally `TZ_RESULTS_STORE_MAX_BYTES` to bound its size.
+    It requires `pyarrow`:
+    ```
+    pip install tz-client[cache]
+    ```
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        if not PARQUET_SUPPORT:
+            raise ImportError(
+                "ResultsStore requires 'pyarrow'. Please install the 'cache' requirements:"
+                " pip install tz-client[cache]"
+            )
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _run_dir(self, fullslug: str) -> Path:
+        return self.root / fullslug.replace(":", "__")
+
+    def path(
+        self,
+        fullslug: str,
+        attribute: str,
+        chart_type: str,
+        capacity_type: str = "gross",
+        year: Optional[int] = None,
+    ) -> Path:
+        """The file a results table is stored at."""
+        year_part = "all" if year is None else str(year)
+        name = f"{attribute}-{chart_type}-{capacity_type}-{year_part}.parquet"
+        return self._run_dir(fullslug) / name
+
+    def get(self, *args, **kwargs) -> Optional[pd.DataFrame]:
+        """Read a stored table, or None if it isn't stored. Takes the arguments of `path`."""
+        path = self.path(*args, **kwargs)
+        try:
+            table = pq.read_table(path, memory_map=True)
+        except FileNotFoundError:
+            return None
+        # file mtimes double as the LRU clock
+        try:
+            os.utime(path)
+        except OSError:
+            # evicted since it was read
+            pass
+        return table.to_pandas()
+
+    def put(self, df: pd.DataFrame, *args, **kwargs) -> Path:
+        """Store a table and evict old tables if over size. Takes the arguments of `path`."""
+        path = self.path(*args, **kwargs)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        pq.write_table(pa.Table.from_pandas(pd.DataFrame(df), preserve_index=False), tmp_path)
+        os.replace(tmp_path, path)
+        self.evict()
+        return path
+
+    def size(self) -> int:
+        """The total size of the stored tables in bytes."""
+        return sum(path.stat().st_size for path in self.root.glob("*/*.parquet"))
+
+    def evict(self) -> None:
+        """Delete least recently used tables until the store is within `max_bytes`."""
+        with self._lock:
+            files = []
+            for path in self.root.glob("*/*.parquet"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def invalidate(self, fullslug: Optional[str] = None) -> None:
+        """Remove the stored tables of one run, or of every run if no fullslug is given."""
+        with self._lock:
+            run_dirs = [self._run_dir(fullslug)] if fullslug else self.root.glob("*")
+            for run_dir in run_dirs:
+                if not run_dir.is_dir():
+                    continue
+                for path in run_dir.iterdir():
+                    path.unlink(missing_ok=True)
+                run_dir.rmdir()
+
+
+_default_store: Optional[ResultsStore] = None
+
+
+def default_store() -> Optional[ResultsStore]:
+    """The store configured by `TZ_RESULTS_STORE`, or None if it isn't enabled. It
+    is shared by every `RunResults`, so evictions in a process are serialised."""
+    global _default_store
+    root = os.environ.get(RESULTS_STORE_ENV)
+    if not root:
+        return None
+    if not PARQUET_SUPPORT:
+        warn(
+            f"{RESULTS_STORE_ENV} is set but 'pyarrow' is not installed, so run results"
+            " won't be stored. Please install the 'cache' requirements:"
+            " pip install tz-client[cache]"
+        )
+        return None
+    max_bytes = int(os.environ.get(RESULTS_STORE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+    if (
+        _default_store is None
+        or _default_store.root != Path(root).expanduser()
+        or _default_store.max_bytes != max_bytes
+    ):
+        _default_store = ResultsStore(root, max_bytes=max_bytes)
+    return _default_store
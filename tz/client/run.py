@@ -1,11 +1,15 @@
 # mypy: ignore-errors
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from tz.client import api
 from tz.client.api import generated_schema, schemas
-from tz.client.utils import lazy_load_single_relationship
+from tz.client.results_store import default_store
+from tz.client.utils import GeneratedModelMixin, lazy_load_single_relationship
 
 
 class ResultsCollection(pd.DataFrame):
@@ -21,133 +25,183 @@ class ResultsCollection(pd.DataFrame):
         return ResultsCollection
 
 
+# table name: (ChartData attribute, chart type, node_or_edge)
+RESULTS_TABLES = {
+    "node_capacity": ("node_capacity", "Capacity", "node"),
+    "edge_capacity": ("edge_capacity", "Capacity", "edge"),
+    "production": ("production_timeseries", "Production", "node"),
+    "flow": ("flow_timeseries", "Flow", "edge"),
+}
+
+
+# job statuses after which a run's outputs no longer change
+FINAL_JOB_STATUSES = ("complete", "completed", "success", "succeeded", "finished")
+
+
 class RunResults(schemas.PydanticBaseModel):
     id: str
+    # whether the run has finished, so its results can be kept in a `ResultsStore`
+    final: bool = False
     _node_capacity: Optional[ResultsCollection] = None
     _edge_capacity: Optional[ResultsCollection] = None
     _production: Optional[ResultsCollection] = None
     _flow: Optional[ResultsCollection] = None
 
-    def _structure_series(self, series, node_id, tech_type, commodity=None) -> list:
-        series_data = []
-        for year, value in zip(series.x, series.y):
-            entry = {
-                "node_id": node_id,
-                "technology_type": tech_type,
-                "timestamp": pd.to_datetime(year, format="%Y"),
-                "value": value,
-            }
-            if commodity:
-                entry["commodity"] = commodity
-            series_data.append(entry)
-        return series_data
-
-    def _structure_response(self, data: dict, commodity_column: bool = False) -> list:
-        restructured_data = []
-        for node_id, tech_data in data.items():
-            for tech_type, series_data in tech_data.items():
-                if commodity_column:
-                    for commodity, series in series_data.items():
-                        series_data = self._structure_series(series, node_id, tech_type, commodity)
-                        restructured_data += series_data
-                else:
-                    series_data = self._structure_series(series_data, node_id, tech_type)
-                    restructured_data += series_data
-        return restructured_data
-
-    def _structure_production_records(self, data: dict) -> list:
-        records = [
-            {"node": node, "technology": tech, "commodity": commodity, "year": year, "value": value}
-            for node, techs in data.items()
-            for tech, commodities in techs.items()
-            for commodity, values in commodities.items()
-            for year in values.x
-            for value in values.y
-        ]
-        return records
-
-    def _structure_flow_records(self, data: dict) -> list:
-        records = [
-            {
-                "source_node": node1,
-                "target_node": node2,
-                "commodity": commodity,
-                "flow_type": flow_type,
-                "year": year,
-                "value": value,
-            }
-            for node1, node2s in data.items()
-            for node2, commodities in node2s.items()
-            for commodity, flow_types in commodities.items()
-            for flow_type, records in flow_types.items()
-            for year in records.x
-            for value in records.y
-        ]
-        return records
+    def _structure_series(self, data: dict, levels: List[str], x_name: str) -> dict:
+        """Flatten nested `{key: {key: ... DataSeries}}` chart data into columns.
+
+        Each level of nesting becomes a categorical column named by `levels`, and
+        the `x`/`y` lists of every series are paired one-to-one and concatenated
+        into `x_name` and `value` columns, so the table has exactly one row per
+        data point and no per-data-point Python objects are created.
+
+        Raises:
+            ValueError: If a series has a different number of x and y values.
+        """
+        paths: list = []
+        xs: list = []
+        ys: list = []
+
+        def walk(node, path):
+            if isinstance(node, dict):
+                for key, child in node.items():
+                    walk(child, path + (key,))
+            else:
+                if len(node.x) != len(node.y):
+                    raise ValueError(
+                        f"Series {'/'.join(path)} has {len(node.x)} x values"
+                        f" but {len(node.y)} y values."
+                    )
+                paths.append(path)
+                xs.append(node.x)
+                ys.append(node.y)
+
+        walk(data, ())
+
+        lengths = np.fromiter((len(x) for x in xs), dtype=np.int64, count=len(xs))
+        n_rows = int(lengths.sum())
+        columns: dict = {}
+        for i, level in enumerate(levels):
+            keys = pd.Categorical([path[i] for path in paths])
+            columns[level] = pd.Categorical.from_codes(
+                np.repeat(keys.codes, lengths), categories=keys.categories
+            )
+        columns[x_name] = np.fromiter(chain.from_iterable(xs), dtype=np.int64, count=n_rows)
+        columns["value"] = np.fromiter(chain.from_iterable(ys), dtype=np.float64, count=n_rows)
+        return columns
+
+    def _structure_response(self, data: dict, commodity_column: bool = False) -> dict:
+        levels = ["node_id", "technology_type"] + (["commodity"] if commodity_column else [])
+        columns = self._structure_series(data, levels, "timestamp")
+        columns["timestamp"] = (columns["timestamp"] - 1970).astype("datetime64[Y]")
+        if commodity_column:
+            # keep the commodity as the trailing column
+            columns["commodity"] = columns.pop("commodity")
+        return columns
+
+    def _structure_production_records(self, data: dict) -> dict:
+        return self._structure_series(data, ["node", "technology", "commodity"], "year")
+
+    def _structure_flow_records(self, data: dict) -> dict:
+        return self._structure_series(
+            data, ["source_node", "target_node", "commodity", "flow_type"], "year"
+        )
+
+    def _structure_table(self, table: str, data: dict) -> dict:
+        if table == "node_capacity":
+            return self._structure_response(data)
+        if table == "edge_capacity":
+            return self._structure_response(data, commodity_column=True)
+        if table == "production":
+            return self._structure_production_records(data)
+        return self._structure_flow_records(data)
+
+    def _fetch_table(self, table: str) -> Optional[ResultsCollection]:
+        """Fetch and parse the chart data behind one of the `RESULTS_TABLES`.
+
+        If a `ResultsStore` is configured and the run has finished, the table is
+        read from it when present, and saved to it after a download otherwise.
+        """
+        attribute, chart_type, node_or_edge = RESULTS_TABLES[table]
+        store = default_store() if self.final else None
+        if store is not None:
+            stored = store.get(self.id, attribute, chart_type)
+            if stored is not None:
+                results = ResultsCollection(stored)
+                results._table = attribute
+                return results
+
+        response = api.runs.get_chart_data(
+            fullslug=self.id,
+            attribute=attribute,
+            chart_type=chart_type,
+            node_or_edge=node_or_edge,
+        )
+        if response is None or response.data is None:
+            return None
+        results = ResultsCollection(self._structure_table(table, response.data))
+        results._table = attribute
+        if store is not None:
+            store.put(results, self.id, attribute, chart_type)
+        return results
+
+    def _get_table(self, table: str) -> Optional[ResultsCollection]:
+        hidden = f"_{table}"
+        if getattr(self, hidden) is None:
+            setattr(self, hidden, self._fetch_table(table))
+        return getattr(self, hidden)
+
+    def load(self, tables: Optional[List[str]] = None) -> "RunResults":
+        """Fetch several results tables at once.
+
+        The chart data for each table that isn't loaded yet is requested
+        concurrently, and each response is parsed on its worker thread as soon
+        as it arrives, so loading all tables takes roughly one round trip.
+
+        ```python
+        results = run.results.load(tables=["production", "flow"])
+        ```
+
+        Args:
+            tables (List[str], optional): Any of `node_capacity`, `edge_capacity`,
+                `production` and `flow`. Defaults to all of them.
+
+        Returns:
+            RunResults: This object, with the requested tables cached.
+        """
+        tables = list(RESULTS_TABLES) if tables is None else tables
+        unknown = set(tables) - set(RESULTS_TABLES)
+        if unknown:
+            raise ValueError(
+                f"Unknown results tables {sorted(unknown)}; must be in {list(RESULTS_TABLES)}."
+            )
+
+        missing = [table for table in tables if getattr(self, f"_{table}") is None]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+                for table, results in zip(missing, pool.map(self._fetch_table, missing)):
+                    setattr(self, f"_{table}", results)
+        return self
 
     @property
     def node_capacity(self) -> Optional[ResultsCollection]:
-        if self._node_capacity is None:
-            response = api.runs.get_chart_data(
-                fullslug=self.id,
-                attribute="node_capacity",
-                chart_type="Capacity",
-                node_or_edge="node",
-            )
-            if response.data is not None:
-                self._node_capacity = ResultsCollection(self._structure_response(response.data))
-                self._node_capacity._table = "node_capacity"
-        return self._node_capacity
+        return self._get_table("node_capacity")
 
     @property
     def edge_capacity(self) -> Optional[ResultsCollection]:
-        if self._edge_capacity is None:
-            response = api.runs.get_chart_data(
-                fullslug=self.id,
-                attribute="edge_capacity",
-                chart_type="Capacity",
-                node_or_edge="edge",
-            )
-            if response.data is not None:
-                self._edge_capacity = ResultsCollection(
-                    self._structure_response(response.data, commodity_column=True)
-                )
-                self._edge_capacity._table = "edge_capacity"
-        return self._edge_capacity
+        return self._get_table("edge_capacity")
 
     @property
     def production(self) -> Optional[ResultsCollection]:
-        if self._production is None:
-            response = api.runs.get_chart_data(
-                fullslug=self.id,
-                attribute="production_timeseries",
-                chart_type="Production",
-                node_or_edge="node",
-            )
-            if response.data is not None:
-                self._production = ResultsCollection(
-                    self._structure_production_records(response.data)
-                )
-                self._production._table = "production_timeseries"
-        return self._production
+        return self._get_table("production")
 
     @property
     def flow(self) -> Optional[ResultsCollection]:
-        if self._flow is None:
-            response = api.runs.get_chart_data(
-                fullslug=self.id,
-                attribute="flow_timeseries",
-                chart_type="Flow",
-                node_or_edge="edge",
-            )
-            if response.data is not None:
-                self._flow = ResultsCollection(self._structure_flow_records(response.data))
-                self._flow._table = "flow_timeseries"
-        return self._flow
+        return self._get_table("flow")
 
 
-class Run(generated_schema.Run):
-    # _run_results: Optional[RunResults] = None
+class Run(GeneratedModelMixin, generated_schema.Run):
+    _run_results: Optional[RunResults] = None
     _model_scenario: Optional["ModelScenario"] = None  # type: ignore[name-defined] # noqa: F821
 
     @classmethod
@@ -185,13 +239,13 @@ class Run(generated_schema.Run):
         Returns:
             Run: A Run object.
         """
-        run_reponse = api.runs.get(
+        return api.runs.get(
             owner=owner,
             model_slug=model_slug,
             model_scenario_slug=model_scenario_slug,
             run_slug=run_slug,
+            response_model=cls,
         )
-        return cls(**run_reponse.model_dump())
 
     @classmethod
     def delete(
@@ -238,7 +292,7 @@ class Run(generated_schema.Run):
             List[Run]: A list of Run objects.
         """
 
-        search_results = api.runs.search(
+        return api.runs.search(
             slug=slug,
             model_slug=model_slug,
             model_scenario_slug=model_scenario_slug,
@@ -248,17 +302,23 @@ class Run(generated_schema.Run):
             public=public,
             limit=limit,
             page=page,
+            response_model=cls,
         )
 
-        return [cls(**r.model_dump()) for r in search_results]
+    @property
+    def results(self) -> RunResults:
+        """The results tables of this run; see `RunResults.load` to fetch several at once."""
+        if self._run_results is None:
+            self._run_results = RunResults(id=self.fullslug, final=self.final)
+        return self._run_results
 
-    # TODO: Implement this later
-    # @property
-    # def results(self) -> RunResults:
-    #     if self._run_results is None:
-    #         self._run_results = RunResults(id=self.id)
-    #         return self._run_results
-    #     return self._run_results
+    @property
+    def final(self) -> bool:
+        """Whether a job of this run has finished, so its outputs won't change."""
+        return any(
+            not isinstance(job, str) and str(job.status).lower() in FINAL_JOB_STATUSES
+            for job in self.jobs or []
+        )
 
     def __str__(self) -> str:
         return f"Run: {self.name} (fullslug={self.fullslug})"
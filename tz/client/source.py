@@ -28,8 +28,7 @@ class Source(schemas.Source):
         ```
         """
         publisher_slug, source_slug = parse_slug(id, 2)
-        source = api.sources.get(slug=id)
-        return cls(**source.model_dump())
+        return api.sources.get(slug=id, response_model=cls)
 
     @classmethod
     def search(cls, name: str | None, year: int | None, publisher_id: str) -> list["Source"]:
@@ -45,15 +44,14 @@ class Source(schemas.Source):
             List[Source]: A list of Source objects.
         """
 
-        search_results = api.sources.search(
+        return api.sources.search(
             name=name,
             year=year,
             publisher_slug=publisher_id,
             includes="publisher,links,license",
+            response_model=cls,
         )
 
-        return [cls(**source.model_dump()) for source in search_results]
-
     def _get_links(self):
         links = api.sources.get(
             slug=f"{self.publisher_slug}:{self.slug}", includes="links"
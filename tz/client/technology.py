@@ -1,11 +1,12 @@
 from typing import ForwardRef, Optional
 
-from tz.client import RecordCollection, api
+from tz.client import RecordCollection, api, identity
 from tz.client.api import generated_schema
-from tz.client.utils import lazy_load_relationship
+from tz.client.api.utils import DEFAULT_MAX_CONCURRENCY
+from tz.client.utils import GeneratedModelMixin, lazy_load_relationship, walk
 
 
-class Technology(generated_schema.Technology):
+class Technology(GeneratedModelMixin, generated_schema.Technology):
 
     """
     <!--
@@ -36,8 +37,7 @@ class Technology(generated_schema.Technology):
         Returns:
             Technology: A Technology object.
         """
-        technology = api.technologies.get(slug=slug)
-        return cls(**technology.model_dump())
+        return identity.load(cls, slug, lambda: api.technologies.get(slug=slug, response_model=cls))
 
     @classmethod
     def search(
@@ -64,17 +64,16 @@ class Technology(generated_schema.Technology):
             List[Technology]: A list of Technology objects.
         """
 
-        search_results = api.technologies.search(
+        return api.technologies.search(
             uuid=uuid,
             slug=slug,
             name=name,
             owner_id=owner_id,
             limit=limit,
             page=page,
+            response_model=cls,
         )
 
-        return [cls(**technology.model_dump()) for technology in search_results]
-
     @property
     def projections(self):
         """The RecordCollection associated with the technoogy"""
@@ -83,6 +82,34 @@ class Technology(generated_schema.Technology):
             self._projections = collection.search(technology=self.slug)
         return self._projections
 
+    def walk(
+        self,
+        depth: int = 1,
+        direction: str = "children",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict[str, list[str]]:
+        """
+        Explore the technology tree breadth-first from this technology, up to `depth` levels.
+        The requests for each level are made concurrently, so the time taken grows
+        with `depth` rather than with the number of technologies.
+
+        ```python
+        tree = Technology.from_slug("renewables").walk(depth=3)
+        ```
+
+        Args:
+            depth (int): The number of levels to explore.
+            direction (str): Either `children` or `parents`.
+            max_concurrency (int): The maximum number of requests in flight.
+
+        Returns:
+            dict[str, list[str]]: A map from the slug of each visited technology to
+                the slugs of its children (or parents).
+        """
+        if direction not in ("children", "parents"):
+            raise ValueError(f"direction must be 'children' or 'parents', got '{direction}'")
+        return walk(self, direction, depth, max_concurrency=max_concurrency)
+
     def __str__(self) -> str:
         return f"Technology: {self.name} (slug={self.slug})"
 
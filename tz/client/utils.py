@@ -1,6 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from typing import List, Union
 
+from pydantic import BaseModel
+
+from tz.client import identity
+from tz.client.api.utils import DEFAULT_MAX_CONCURRENCY
+
 
 def parse_slug(fullslug, nparts):
     slug_parts = fullslug.split(":")
@@ -24,6 +30,100 @@ def id(x):
     return x
 
 
+def promote(item, cls):
+    """Re-type an already validated model `item` as its subclass `cls`, without
+    serialising and validating it again."""
+    if isinstance(item, cls):
+        return item
+    return cls.model_construct(_fields_set=item.model_fields_set, **dict(item))
+
+
+class GeneratedModelMixin:
+    """Mixin for the high-level classes that subclass a generated model.
+
+    The generated models are built lazily, so the fields they pass on may still
+    have unresolved annotations naming other generated models (e.g. `UrlIndex`).
+    Those are resolved against the generated schema whenever the subclass is
+    built, rather than against the subclass's module.
+    """
+
+    @classmethod
+    def model_rebuild(cls, **kwargs):
+        generated_schema = import_module("tz.client.api.generated_schema")
+        kwargs["_types_namespace"] = {
+            **(kwargs.get("_types_namespace") or {}),
+            **vars(generated_schema),
+        }
+        return super().model_rebuild(**kwargs)  # type: ignore[misc]
+
+
+def camel_to_snake(s):
+    return "".join(["_" + c.lower() if c.isupper() else c for c in s]).lstrip("_")
+
+
+class LazyRelationship:
+    """A read-only property that loads the `field` relationship of a model on
+    first access and caches it in the model's private `_field` attribute.
+
+    Cached reads go straight to the model's private storage, so they cost about
+    as much as an attribute read; the related class is resolved once, and the
+    loader context (the model's `model_dump()`) is only built on a cache miss.
+    """
+
+    def __init__(self, mk_cls, field, loader, f=id, g=id):
+        self.mk_cls = mk_cls
+        self.field = field
+        self.hidden = f"_{field}"
+        self.loader = loader
+        self.f = f
+        self.g = g
+        self._target = None if isinstance(mk_cls, str) else mk_cls
+
+    @property
+    def target(self):
+        """The class of the related objects."""
+        if self._target is None:
+            # Bit of a hack to simplify the lazy-loading troubles: just let people
+            # use a string and we'll just import it by convention; this is
+            # because of circular dependencies.
+            module = import_module(f"tz.client.{camel_to_snake(self.mk_cls)}")
+            self._target = getattr(module, self.mk_cls)
+        return self._target
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        cached = obj.__pydantic_private__.get(self.hidden)
+        if cached is not None:
+            return cached
+        if self.included(obj):
+            return self.populate(obj, obj.__dict__[self.field])
+        return self.populate(obj, getattr(self.load(obj), self.field))
+
+    def __set__(self, obj, value):
+        raise AttributeError(f"Relationship '{self.field}' is read-only")
+
+    def load(self, obj):
+        """Fetch the response holding the relationship of `obj`."""
+        # Note: Here we assume `obj` is a pydantic model and we send the
+        # value of `model_dump()` as context to the `loader` function.
+        # This is so initial values of fields can be used in lazy-loading.
+        return self.loader(obj, obj.model_dump())
+
+    def included(self, obj) -> bool:
+        """Whether `obj` was itself loaded with the related objects included (e.g.
+        through `includes=`), rather than just their slugs."""
+        value = obj.__dict__.get(self.field)
+        return value is not None and all(isinstance(c, BaseModel) for c in self.f(value))
+
+    def populate(self, obj, value):
+        """Cache the relationship of `obj` from the loaded related object(s) and return it."""
+        items = [identity.add(promote(c, self.target), complete=False) for c in self.f(value)]
+        value = self.g(items)
+        setattr(obj, self.hidden, value)
+        return value
+
+
 def lazy_load_relationship(cls, mk_cls, field, loader, f=id, g=id):
     """Update the `cls` to have the `field` relationship (i.e. list of
     things) lazy-loaded by the provided loader so that when someone writes
@@ -47,38 +147,11 @@ def lazy_load_relationship(cls, mk_cls, field, loader, f=id, g=id):
           unwrap the item from a list if we previously had to do that.
 
     Returns:
-        Nothing.
+        LazyRelationship: The property installed on `cls`.
     """
-
-    def camel_to_snake(s):
-        return "".join(["_" + c.lower() if c.isupper() else c for c in s]).lstrip("_")
-
-    def lazy_loader(self):
-        # Note: Here we assume `self` is a pydantic model and we send the
-        # value of `model_dump()` as context to the `loader` function above.
-        # This is so initial values of fields can be used in lazy-loading.
-        current_context = self.model_dump()
-
-        if isinstance(mk_cls, str):
-            # Bit of a hack to simplify the lazy-loading troubles: just let people
-            # use a string and we'll just import it by convention; this is
-            # because of circular dependencies.
-            module_name = camel_to_snake(mk_cls)
-            module = import_module(f"tz.client.{module_name}")
-            mk_class = getattr(module, mk_cls)
-        else:
-            mk_class = mk_cls
-        hidden = f"_{field}"
-
-        if getattr(self, hidden) is None:
-            loaded = loader(self, current_context)
-            items = f(getattr(loaded, field))
-            values = g([mk_class(**c.model_dump()) for c in items])
-            setattr(self, hidden, values)
-        v = getattr(self, hidden)
-        return v
-
-    setattr(cls, field, property(lazy_loader))
+    relationship = LazyRelationship(mk_cls, field, loader, f=f, g=g)
+    setattr(cls, field, relationship)
+    return relationship
 
 
 def lazy_load_single_relationship(cls, mk_cls, field, loader):
@@ -87,3 +160,80 @@ def lazy_load_single_relationship(cls, mk_cls, field, loader):
     to_list = lambda x: [x]  # noqa: E731
     from_list = lambda x: x[0]  # noqa: E731
     return lazy_load_relationship(cls, mk_cls, field, loader, f=to_list, g=from_list)
+
+
+def prefetch_related(objs, *fields, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+    """Load the lazy `fields` relationships of a list of objects at once.
+
+    Objects loaded with the relationship already included (e.g. through
+    `Model.search(includes="model_scenarios")`) are filled without any request;
+    for the rest, one request is made per distinct object, at most
+    `max_concurrency` at a time. Each object's relationship is cached, so
+    reading it afterwards doesn't make a request.
+
+    ```python
+    models = Model.search(owner="feo-core-admin", limit=200)
+    prefetch_related(models, "model_scenarios")
+    ```
+
+    Args:
+        objs: A list of objects of the same high-level class, e.g. `Model`.
+        fields: The names of the relationships to load, e.g. `"model_scenarios"`.
+        max_concurrency: The maximum number of requests in flight.
+
+    Returns:
+        The `objs`, for chaining.
+    """
+    for field in fields:
+        # group the objects still missing the relationship, so duplicates share a request
+        pending: dict = {}
+        for i, obj in enumerate(objs):
+            relationship = getattr(type(obj), field, None)
+            if not isinstance(relationship, LazyRelationship):
+                raise ValueError(f"'{field}' is not a relationship of {type(obj).__name__}")
+            if obj.__pydantic_private__.get(relationship.hidden) is not None:
+                continue
+            if relationship.included(obj):
+                relationship.populate(obj, obj.__dict__[field])
+                continue
+            key = (type(obj), obj.__dict__.get("fullslug") or i)
+            pending.setdefault(key, []).append(obj)
+
+        if not pending:
+            continue
+
+        groups = list(pending.values())
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(groups)))) as pool:
+            responses = pool.map(
+                lambda group: getattr(type(group[0]), field).load(group[0]), groups
+            )
+            for group, loaded in zip(groups, responses):
+                for obj in group:
+                    getattr(type(obj), field).populate(obj, getattr(loaded, field))
+    return objs
+
+
+def walk(root, field: str, depth: int, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+    """Explore the `field` relationship (e.g. `children`) from `root` breadth-first,
+    up to `depth` levels, loading each level's relationships concurrently with
+    `prefetch_related`.
+
+    Returns:
+        dict[str, list[str]]: An adjacency map from each visited object's slug to
+            the slugs of its related objects; objects on the last level are not expanded.
+    """
+    adjacency: dict[str, list[str]] = {}
+    frontier = [root]
+    for _ in range(depth):
+        prefetch_related(frontier, field, max_concurrency=max_concurrency)
+        for obj in frontier:
+            adjacency[obj.slug] = [other.slug for other in getattr(obj, field) or []]
+        next_frontier = {}
+        for obj in frontier:
+            for other in getattr(obj, field) or []:
+                if other.slug not in adjacency:
+                    next_frontier.setdefault(other.slug, other)
+        frontier = list(next_frontier.values())
+        if not frontier:
+            break
+    return adjacency